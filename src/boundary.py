@@ -2,30 +2,59 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
+import numpy as np
+import shapely
+from shapely.errors import GEOSException
 from shapely.geometry import (
-    GeometryCollection,
     LineString,
     MultiLineString,
     MultiPolygon,
     Polygon,
-    shape,
 )
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import linemerge, unary_union
+from shapely.prepared import PreparedGeometry, prep
+
+from .utils import make_valid_polygons
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+    type BoundaryState = tuple[
+        MultiLineString | LineString, list[tuple[float, float]], Polygon | MultiPolygon
+    ]
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
 _boundary_line: MultiLineString | LineString | None = None
 _ordered_path: list[tuple[float, float]] | None = None
+_ordered_xy: np.ndarray | None = None
+_boundary_bounds: tuple[float, float, float, float] | None = None
+_europe_clip: tuple[Polygon | MultiPolygon, PreparedGeometry] | None = None
+_merged_boundary: tuple[BaseGeometry, LineString | MultiLineString] | None = None
+_boundary_segments: tuple[BaseGeometry, np.ndarray] | None = None
+
+# Western edge of the Europe clip polygon.  Far enough west to cover every
+# country that is clipped, but clamped to -30° to avoid wrapping past the
+# antimeridian and accidentally capturing far-east Russia (Chukotka at ~-170°).
+_WEST_EDGE = -30.0
 
 
 def load_boundary() -> MultiLineString | LineString:
     """Load the Trubetskoy Europe-Asia boundary as a shapely geometry.
 
-    Results are cached in the module-level ``_boundary_line`` variable so
+    Coordinates are read straight into NumPy arrays and all lines are built
+    with a single vectorized ``shapely.linestrings`` call.  The result is
+    written as WKB next to the GeoJSON so later runs skip JSON parsing; the
+    cache is rebuilt whenever the GeoJSON is newer or cannot be decoded.
+
+    Results are also cached in the module-level ``_boundary_line`` variable so
     subsequent calls return immediately.
 
     Returns:
@@ -36,21 +65,70 @@ def load_boundary() -> MultiLineString | LineString:
         return _boundary_line
 
     path = DATA_DIR / "europe_asia_boundary.geojson"
+    cache = path.with_suffix(".wkb")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        # A cache file that cannot be decoded is treated as a miss and rewritten
+        with contextlib.suppress(OSError, GEOSException, ValueError):
+            _boundary_line = shapely.from_wkb(cache.read_bytes())
+            return _boundary_line
+
     with path.open() as f:
         data = json.load(f)
 
-    lines: list[LineString] = []
+    parts: list[np.ndarray] = []
     for feat in data["features"]:
-        geom = shape(feat["geometry"])
-        if geom.geom_type == "LineString":
-            lines.append(geom)
-        elif geom.geom_type == "MultiLineString":
-            lines.extend(geom.geoms)
-
-    _boundary_line = MultiLineString(lines) if len(lines) > 1 else lines[0]
+        geom = feat["geometry"]
+        if geom["type"] == "LineString":
+            parts.append(np.asarray(geom["coordinates"], dtype=np.float64)[:, :2])
+        elif geom["type"] == "MultiLineString":
+            parts.extend(np.asarray(c, dtype=np.float64)[:, :2] for c in geom["coordinates"])
+
+    indices = np.repeat(np.arange(len(parts)), [len(p) for p in parts])
+    lines = shapely.linestrings(np.concatenate(parts), indices=indices)
+
+    _boundary_line = MultiLineString(list(lines)) if len(lines) > 1 else lines[0]
+
+    # The cache is best-effort; written via a temporary file so a concurrent
+    # reader never sees a partial one
+    tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+    with contextlib.suppress(OSError):
+        tmp.write_bytes(shapely.to_wkb(_boundary_line))
+        tmp.replace(cache)
     return _boundary_line
 
 
+def boundary_state() -> BoundaryState:
+    """Load the boundary and build the caches every clip needs.
+
+    Used to do this work once in the build process and hand the result to
+    worker processes via :func:`restore_boundary_state`.
+
+    Returns:
+        A ``(boundary, ordered_path, europe_polygon)`` tuple.
+    """
+    boundary = load_boundary()
+    ordered_coords = _build_ordered_path(boundary)
+    europe_polygon, _prepared = _europe_polygon(ordered_coords)
+    return boundary, ordered_coords, europe_polygon
+
+
+def restore_boundary_state(state: BoundaryState) -> None:
+    """Install a state from :func:`boundary_state` into this process's caches.
+
+    Args:
+        state: The ``(boundary, ordered_path, europe_polygon)`` tuple.
+    """
+    global _boundary_line, _ordered_path, _ordered_xy, _boundary_bounds, _europe_clip
+    boundary, ordered_coords, europe_polygon = state
+    if boundary is _boundary_line:
+        return
+    _boundary_line = boundary
+    _ordered_path = ordered_coords
+    _ordered_xy = None
+    _boundary_bounds = None
+    _europe_clip = (europe_polygon, prep(europe_polygon))
+
+
 def _build_ordered_path(boundary: MultiLineString | LineString) -> list[tuple[float, float]]:
     """Merge boundary segments and build a single ordered coordinate path.
 
@@ -72,70 +150,130 @@ def _build_ordered_path(boundary: MultiLineString | LineString) -> list[tuple[fl
         return _ordered_path
 
     # Step 1: linemerge to connect segments that share exact endpoints
-    merged = linemerge(boundary) if boundary.geom_type == "MultiLineString" else boundary
+    merged = _get_merged_boundary(boundary)
 
     if merged.geom_type == "LineString":
         _ordered_path = list(merged.coords)
         return _ordered_path
 
-    # Step 2: We have multiple lines — snap them together and re-merge
-    lines: list[LineString] = list(merged.geoms)
+    # Step 2: We have multiple lines — snap them together and re-merge.
+    # Coordinates are pulled out of GEOS once and split into one array per line.
+    coords, line_idx = shapely.get_coordinates(shapely.get_parts(merged), return_index=True)
+    parts = np.split(coords, np.flatnonzero(np.diff(line_idx)) + 1)
 
     # Sort by southernmost latitude to start building from the south
-    lines.sort(key=lambda seg: min(c[1] for c in seg.coords))
-
-    # Greedy nearest-neighbor: chain lines into a single coordinate path
-    ordered_coords: list[tuple[float, float]] = list(lines[0].coords)
-    remaining = lines[1:]
-
-    while remaining:
-        end_pt = ordered_coords[-1]
-        best_idx: int | None = None
-        best_dist = float("inf")
-        best_reverse = False
-
-        for i, line in enumerate(remaining):
-            coords: list[tuple[float, float]] = list(line.coords)
-            d_start = _pt_dist(end_pt, coords[0])
-            d_end = _pt_dist(end_pt, coords[-1])
-
-            if d_start < best_dist:
-                best_dist = d_start
-                best_idx = i
-                best_reverse = False
-            if d_end < best_dist:
-                best_dist = d_end
-                best_idx = i
-                best_reverse = True
-
-        if best_idx is not None and best_dist < 5.0:
-            line = remaining.pop(best_idx)
-            coords = list(line.coords)
-            if best_reverse:
-                coords.reverse()
-            ordered_coords.extend(coords)
-        else:
+    parts.sort(key=lambda xy: float(xy[:, 1].min()))
+
+    # Greedy nearest-neighbor: chain lines into a single coordinate path.
+    # Endpoints are gathered once so each step is a single vectorized argmin.
+    chain: list[np.ndarray] = [parts[0]]
+    remaining = parts[1:]
+    starts = np.array([xy[0] for xy in remaining]).reshape(-1, 2)
+    ends = np.array([xy[-1] for xy in remaining]).reshape(-1, 2)
+    alive = np.ones(len(remaining), dtype=bool)
+
+    while alive.any():
+        end_x, end_y = chain[-1][-1]
+        d_start = np.where(alive, _pt_dist_sq((end_x, end_y), starts), np.inf)
+        d_end = np.where(alive, _pt_dist_sq((end_x, end_y), ends), np.inf)
+        best_idx = int(np.argmin(np.minimum(d_start, d_end)))
+        best_reverse = bool(d_end[best_idx] < d_start[best_idx])
+
+        # Squared distances: 25.0 is a 5° gap
+        if min(d_start[best_idx], d_end[best_idx]) >= 25.0:
             break
 
+        alive[best_idx] = False
+        chain.append(remaining[best_idx][::-1] if best_reverse else remaining[best_idx])
+
+    path = np.concatenate(chain)
+
     # Ensure path goes south-to-north (ascending latitude)
-    if ordered_coords[0][1] > ordered_coords[-1][1]:
-        ordered_coords.reverse()
+    if path[0, 1] > path[-1, 1]:
+        path = path[::-1]
 
+    ordered_coords: list[tuple[float, float]] = [(x, y) for x, y in path.tolist()]
     _ordered_path = ordered_coords
     return _ordered_path
 
 
-def _pt_dist(p1: tuple[float, float], p2: tuple[float, float]) -> float:
-    """Euclidean distance between two ``(x, y)`` coordinate tuples.
+def _get_merged_boundary(
+    boundary: MultiLineString | LineString,
+) -> MultiLineString | LineString:
+    """Return the boundary with segments sharing exact endpoints line-merged.
+
+    The result for the most recent boundary is cached in the module-level
+    ``_merged_boundary`` variable, shared by :func:`_build_ordered_path` and
+    :func:`_fallback_clip`.
+
+    Args:
+        boundary: The boundary geometry returned by :func:`load_boundary`.
+
+    Returns:
+        The merged ``LineString`` or ``MultiLineString``.
+    """
+    global _merged_boundary
+    if _merged_boundary is not None and _merged_boundary[0] is boundary:
+        return _merged_boundary[1]
+
+    merged = linemerge(boundary) if boundary.geom_type == "MultiLineString" else boundary
+    _merged_boundary = (boundary, merged)
+    return merged
+
+
+def _ordered_path_xy(boundary: MultiLineString | LineString) -> np.ndarray:
+    """Return the ordered boundary path as an ``(N, 2)`` float array.
+
+    Results are cached in the module-level ``_ordered_xy`` variable.
 
     Args:
-        p1: First point as ``(longitude, latitude)``.
-        p2: Second point as ``(longitude, latitude)``.
+        boundary: The boundary geometry returned by :func:`load_boundary`.
 
     Returns:
-        Euclidean distance (degrees).
+        Array of ``(lon, lat)`` rows running south-to-north.
     """
-    return float(((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2) ** 0.5)
+    global _ordered_xy
+    if _ordered_xy is None:
+        _ordered_xy = np.asarray(_build_ordered_path(boundary), dtype=float)[:, :2]
+    return _ordered_xy
+
+
+def _boundary_bbox(boundary: MultiLineString | LineString) -> tuple[float, float, float, float]:
+    """Return the ``(minx, miny, maxx, maxy)`` bounds of the ordered boundary path.
+
+    Results are cached in the module-level ``_boundary_bounds`` variable.
+
+    Args:
+        boundary: The boundary geometry returned by :func:`load_boundary`.
+
+    Returns:
+        Bounding box of the ordered path in degrees.
+    """
+    global _boundary_bounds
+    if _boundary_bounds is None:
+        xy = _ordered_path_xy(boundary)
+        (minx, miny), (maxx, maxy) = xy.min(axis=0), xy.max(axis=0)
+        _boundary_bounds = (float(minx), float(miny), float(maxx), float(maxy))
+    return _boundary_bounds
+
+
+def _pt_dist_sq(p1: tuple[float, float], p2: ArrayLike) -> np.ndarray:
+    """Squared Euclidean distance from one ``(x, y)`` point to one or many points.
+
+    Only used to rank candidates, so the square root is skipped.
+
+    Args:
+        p1: Reference point as ``(longitude, latitude)``.
+        p2: A single ``(longitude, latitude)`` point or an ``(N, 2)`` array of points.
+
+    Returns:
+        Squared distance(s) in degrees² — a scalar array for a single point,
+        otherwise an array of shape ``(N,)``.
+    """
+    pts = np.asarray(p2, dtype=float)
+    dx = pts[..., 0] - p1[0]
+    dy = pts[..., 1] - p1[1]
+    return dx * dx + dy * dy
 
 
 def clip_to_europe(country_geom: Polygon | MultiPolygon) -> Polygon | MultiPolygon:
@@ -181,7 +319,12 @@ def _clip_by_boundary(
     1. Build ordered boundary path (south-to-north).
     2. Construct Europe clip polygon by closing the path via a far-west
        rectangle.
-    3. Intersect with country geometry to get the European part.
+    3. Intersect with country geometry to get the European part.  Countries
+       whose bounds miss the boundary path (east, north or south of it) are
+       returned as-is; countries entirely inside or outside the Europe polygon
+       are resolved with a prepared-geometry test; the rest are clipped via
+       a general polygon intersection of the two shapes pre-trimmed to each
+       other's bounding box.
     4. For Asia: subtract the European part from the country (avoids
        Aegean-pocket overlap issues with a separate Asia polygon).
 
@@ -196,61 +339,77 @@ def _clip_by_boundary(
     """
     ordered_coords = _build_ordered_path(boundary)
 
-    # Get the bounds of the country (extended)
-    minx, _miny, _maxx, _maxy = country_geom.bounds
-    pad = 10
-
-    first = ordered_coords[0]
-    last = ordered_coords[-1]
+    minx, miny, maxx, maxy = country_geom.bounds
 
-    # Always build the Europe polygon (boundary + close via far west).
-    # Clamp the western edge to -30° to avoid wrapping past the antimeridian
-    # and accidentally capturing far-east Russia (Chukotka at ~-170°).
-    west_edge = max(minx - pad, -30)
-
-    closing = [
-        (west_edge, last[1]),  # west from north end
-        (west_edge, first[1]),  # south along west edge
-        first,  # close
-    ]
-    poly_coords = ordered_coords + closing
+    # Entirely east, north or south of the boundary path: the Europe polygon
+    # cannot reach it, so either side would be empty and fall back to the
+    # full geometry anyway
+    _bnd_minx, bnd_miny, bnd_maxx, bnd_maxy = _boundary_bbox(boundary)
+    if minx > bnd_maxx or miny > bnd_maxy or maxy < bnd_miny:
+        return country_geom
 
     try:
-        europe_polygon = Polygon(poly_coords)
-        if not europe_polygon.is_valid:
-            europe_polygon = europe_polygon.buffer(0)
-        europe_result = country_geom.intersection(europe_polygon)
+        europe_polygon, prepared = _europe_polygon(ordered_coords)
+        if prepared.contains(country_geom):
+            europe_result = country_geom
+        elif prepared.disjoint(country_geom):
+            europe_result = Polygon()
+        else:
+            # Trim each operand to the other's bounding box first: rectangle
+            # clipping is far cheaper than a general overlay and cannot
+            # change the intersection
+            trimmed = shapely.clip_by_rect(country_geom, *europe_polygon.bounds)
+            europe_result = trimmed.intersection(
+                shapely.clip_by_rect(europe_polygon, minx, miny, maxx, maxy)
+            )
     except Exception:
         # Fallback: buffer-strip approach with ray-casting classification
-        result = _fallback_clip(country_geom, boundary, side)
-        if result is None or result.is_empty:
-            return country_geom
-        clean = _extract_polygons(result)
-        if clean is None or clean.is_empty:
-            return country_geom
-        if not clean.is_valid:
-            clean = clean.buffer(0)
-        return clean
-
-    europe_result = _extract_polygons(europe_result)
+        return _finalize(_fallback_clip(country_geom, boundary, side), country_geom)
 
     if side == "europe":
-        if europe_result is None or europe_result.is_empty:
-            return country_geom
-        if not europe_result.is_valid:
-            europe_result = europe_result.buffer(0)
-        return europe_result
-    else:
-        # Asia = country minus Europe (avoids overlap from Aegean pocket)
-        if europe_result is None or europe_result.is_empty:
-            return country_geom
-        asia_result = country_geom.difference(europe_result)
-        asia_result = _extract_polygons(asia_result)
-        if asia_result is None or asia_result.is_empty:
-            return country_geom
-        if not asia_result.is_valid:
-            asia_result = asia_result.buffer(0)
-        return asia_result
+        return _finalize(europe_result, country_geom)
+
+    # Asia = country minus Europe (avoids overlap from Aegean pocket)
+    europe_part = _finalize(europe_result, None)
+    if europe_part is None:
+        return country_geom
+    return _finalize(country_geom.difference(europe_part), country_geom)
+
+
+def _europe_polygon(
+    ordered_coords: list[tuple[float, float]],
+) -> tuple[Polygon | MultiPolygon, PreparedGeometry]:
+    """Return the Europe clip polygon and its prepared form.
+
+    The polygon is the ordered boundary path closed via a rectangle out to
+    ``_WEST_EDGE``.  It does not depend on the country being clipped — any
+    part of it west of a country has no effect on the intersection — so it is
+    built once per ordered path and cached in the module-level
+    ``_europe_clip`` variable.
+
+    Args:
+        ordered_coords: Ordered boundary path from :func:`_build_ordered_path`.
+
+    Returns:
+        A ``(polygon, prepared)`` tuple.
+    """
+    global _europe_clip
+    if _europe_clip is not None:
+        return _europe_clip
+
+    first = ordered_coords[0]
+    last = ordered_coords[-1]
+    closing = [
+        (_WEST_EDGE, last[1]),  # west from north end
+        (_WEST_EDGE, first[1]),  # south along west edge
+        first,  # close
+    ]
+    polygon: Polygon | MultiPolygon = Polygon(ordered_coords + closing)
+    if not polygon.is_valid:
+        polygon = make_valid_polygons(polygon)
+
+    _europe_clip = (polygon, prep(polygon))
+    return _europe_clip
 
 
 def _fallback_clip(
@@ -272,9 +431,11 @@ def _fallback_clip(
     Returns:
         Union of the classified pieces, or None if no pieces qualify.
     """
-    merged = linemerge(boundary) if boundary.geom_type == "MultiLineString" else boundary
+    merged = _get_merged_boundary(boundary)
 
-    strip = merged.buffer(0.005)
+    # Buffer each merged line with a single segment per quarter circle: the
+    # strip only needs to separate the sides, not follow the line smoothly
+    strip = unary_union(shapely.buffer(shapely.get_parts(merged), 0.005, quad_segs=1))
     remainder = country_geom.difference(strip)
 
     if remainder.is_empty:
@@ -287,50 +448,116 @@ def _fallback_clip(
     # Classify each piece using horizontal ray-casting against the boundary
     # A point is in Asia if a horizontal ray from far west crosses the
     # boundary an odd number of times
-    european: list[Polygon] = []
-    asian: list[Polygon] = []
-    for piece in pieces:
-        cx, cy = piece.centroid.x, piece.centroid.y
-        ray = LineString([(-180, cy), (cx, cy)])
-        crossings = _count_crossings(ray, merged)
-        if crossings % 2 == 0:
-            european.append(piece)
-        else:
-            asian.append(piece)
+    centroids = shapely.get_coordinates(shapely.centroid(pieces))
+    starts = np.column_stack([np.full(len(pieces), -180.0), centroids[:, 1]])
+    rays = shapely.linestrings(np.stack([starts, centroids], axis=1))
+    is_european = _count_crossings(rays, merged) % 2 == 0
+    keep = is_european if side == "europe" else ~is_european
 
-    selected = european if side == "europe" else asian
+    selected = [piece for piece, k in zip(pieces, keep, strict=True) if k]
     if not selected:
         return None
 
-    return unary_union(selected)
+    return unary_union(_morton_sorted(selected))
+
+
+def _morton_sorted(polys: list[Polygon]) -> list[Polygon]:
+    """Sort polygons along a Z-order (Morton) curve through their centroids.
+
+    Feeding spatially adjacent pieces to ``unary_union`` next to each other
+    lets its cascaded union pair up neighbours early.
+
+    Args:
+        polys: Polygons to sort.
+
+    Returns:
+        The same polygons in Z-order of their centroids.
+    """
+    if len(polys) < 3:
+        return polys
+
+    xy = shapely.get_coordinates(shapely.centroid(polys))
+    lo = xy.min(axis=0)
+    span = np.maximum(xy.max(axis=0) - lo, 1e-12)
+    grid = ((xy - lo) / span * 0xFFFF).astype(np.uint64)
+
+    def spread(v: np.ndarray) -> np.ndarray:
+        # Interleave zero bits: 16-bit value -> even bits of a 32-bit value
+        v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+        v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+        return v
+
+    codes = spread(grid[:, 0]) | (spread(grid[:, 1]) << np.uint64(1))
+    return [polys[i] for i in np.argsort(codes, kind="stable")]
+
 
+def _count_crossings(rays: ArrayLike, boundary_line: LineString | MultiLineString) -> np.ndarray:
+    """Count the number of times each ray crosses the boundary.
 
-def _count_crossings(ray: LineString, boundary_line: LineString | MultiLineString) -> int:
-    """Count the number of times a ray crosses the boundary.
+    Crossings are counted arithmetically rather than with GEOS: a segment is
+    crossed when exactly one of its endpoints lies above the ray's latitude
+    and the interpolated crossing longitude falls within the ray.  The
+    half-open test counts a ray through a shared vertex once, and a ray that
+    only touches a vertex zero or two times, so parity stays correct.
 
     Args:
-        ray: A horizontal ``LineString`` ray from longitude -180 to the centroid.
+        rays: A horizontal 2-point ``LineString`` ray from longitude -180 to a
+            centroid, or an array of such rays.
         boundary_line: The (merged) Europe-Asia boundary line.
 
     Returns:
-        Number of Point intersections between the ray and the boundary.
+        Number of boundary crossings along each ray, shaped like ``rays``
+        (a scalar array for a single ray).
     """
-    inter = ray.intersection(boundary_line)
-    if inter.is_empty:
-        return 0
-    if inter.geom_type == "Point":
-        return 1
-    if inter.geom_type == "MultiPoint":
-        return len(inter.geoms)
-    if inter.geom_type == "GeometryCollection":
-        return sum(1 for g in inter.geoms if g.geom_type == "Point")
-    return 0
+    rays_arr = np.asarray(rays, dtype=object)
+    ray_xy = shapely.get_coordinates(rays_arr.ravel()).reshape(-1, 2, 2)
+    x_lo = ray_xy[:, :, 0].min(axis=1)[:, None]
+    x_hi = ray_xy[:, :, 0].max(axis=1)[:, None]
+    cy = ray_xy[:, 0, 1][:, None]
+
+    segments = _boundary_segments_xy(boundary_line)
+    x0, y0 = segments[:, 0, 0], segments[:, 0, 1]
+    x1, y1 = segments[:, 1, 0], segments[:, 1, 1]
+
+    straddles = (y0 > cy) != (y1 > cy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x0 + (cy - y0) * (x1 - x0) / (y1 - y0)
+    hits = straddles & (x_cross >= x_lo) & (x_cross <= x_hi)
+    counts: np.ndarray = hits.sum(axis=1)
+    return counts.reshape(rays_arr.shape)
+
+
+def _boundary_segments_xy(boundary_line: LineString | MultiLineString) -> np.ndarray:
+    """Split the boundary into its individual 2-vertex segments.
+
+    The result for the most recent boundary is cached in the module-level
+    ``_boundary_segments`` variable.
+
+    Args:
+        boundary_line: The (merged) Europe-Asia boundary line.
+
+    Returns:
+        Array of shape ``(M, 2, 2)`` holding each segment's start and end
+        ``(lon, lat)``.
+    """
+    global _boundary_segments
+    if _boundary_segments is not None and _boundary_segments[0] is boundary_line:
+        return _boundary_segments[1]
+
+    coords, line_idx = shapely.get_coordinates(shapely.get_parts(boundary_line), return_index=True)
+    same_line = line_idx[:-1] == line_idx[1:]
+    segments: np.ndarray = np.stack([coords[:-1], coords[1:]], axis=1)[same_line]
+    _boundary_segments = (boundary_line, segments)
+    return segments
 
 
 def _collect_polygons(geom: object) -> list[Polygon]:
     """Extract all Polygon instances from any geometry type.
 
-    Recurses into ``MultiPolygon`` and ``GeometryCollection`` containers.
+    Flattens ``MultiPolygon`` and (nested) ``GeometryCollection`` containers
+    level by level with ``shapely.get_parts``, preserving part order.
 
     Args:
         geom: Any shapely geometry object.
@@ -340,14 +567,38 @@ def _collect_polygons(geom: object) -> list[Polygon]:
     """
     if isinstance(geom, Polygon):
         return [geom]
-    if isinstance(geom, MultiPolygon):
-        return list(geom.geoms)
-    if isinstance(geom, GeometryCollection):
-        result: list[Polygon] = []
-        for g in geom.geoms:
-            result.extend(_collect_polygons(g))
+    if not isinstance(geom, BaseGeometry):
+        return []
+    parts = shapely.get_parts(geom)
+    # Type ids >= 4 are the Multi* types and GeometryCollection
+    while (shapely.get_type_id(parts) >= 4).any():
+        parts = shapely.get_parts(parts)
+    return list(parts[shapely.get_type_id(parts) == 3])
+
+
+def _finalize[T](geom: object, fallback: T) -> Polygon | MultiPolygon | T:
+    """Reduce a clip result to a valid polygonal geometry.
+
+    Extracts the non-empty polygons from ``geom`` and repairs the assembled
+    result with :func:`~utils.make_valid_polygons` only if it is invalid, so
+    every return path of the clip shares one extract / empty-check / repair
+    pass.
+
+    Args:
+        geom: Any shapely geometry, or ``None``.
+        fallback: Value returned when no (valid) polygons remain.
+
+    Returns:
+        A valid ``Polygon`` or ``MultiPolygon``, or ``fallback``.
+    """
+    polys = [p for p in _collect_polygons(geom) if not p.is_empty]
+    if not polys:
+        return fallback
+    result = polys[0] if len(polys) == 1 else MultiPolygon(polys)
+    if shapely.is_valid(result):
         return result
-    return []
+    repaired = make_valid_polygons(result)
+    return fallback if repaired.is_empty else repaired
 
 
 def _extract_polygons(geom: object) -> Polygon | MultiPolygon | None:
@@ -5,12 +5,20 @@ Loads source data, runs all extractors, and outputs merged.geojson.
 
 from __future__ import annotations
 
-import json
+import contextlib
+import hashlib
+import multiprocessing
+import operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import geopandas as gpd
+import orjson
+import shapely
+from shapely.errors import GEOSException
+from shapely.geometry.base import BaseGeometry
 
+from .boundary import boundary_state, restore_boundary_state
 from .category_a import extract_direct, extract_subunit
 from .category_b import extract_admin1, extract_disputed_remainder, extract_remainder
 from .category_c import (
@@ -21,27 +29,114 @@ from .category_c import (
     generate_antarctic_wedge,
     generate_point,
 )
-from .destinations import get_destinations
+from .destinations import get_destination, get_destinations
+from .utils import dissolve_rows, load_shapefile, make_properties, select_rows, to_feature
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    import geopandas as gpd
+
+    from .boundary import BoundaryState
     from .types import TccDestination, TccFeature
 
+    type Extractor = Callable[
+        [
+            TccDestination,
+            gpd.GeoDataFrame,
+            gpd.GeoDataFrame,
+            gpd.GeoDataFrame,
+            gpd.GeoDataFrame,
+            dict[int, TccFeature],
+            Any | None,
+        ],
+        TccFeature | None,
+    ]
+
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
 
+# Attribute columns the extractors look up in each Natural Earth layer; the
+# rest are never decoded
+ADMIN0_COLUMNS = ["ADM0_A3", "SU_A3", "GU_A3", "ISO_A3", "NAME", "NAME_EN"]
+ADMIN1_COLUMNS = ["adm0_a3", "iso_a2", "name", "name_en"]
+DISPUTED_COLUMNS = ["NAME", "BRK_NAME", "NAME_LONG", "ADMIN"]
+
+# Source files (in DATA_DIR) whose changes invalidate the feature cache
+CACHE_SOURCE_SUFFIXES = {".shp", ".shx", ".dbf", ".geojson"}
+
+# Rough relative cost of each extraction strategy, used to hand the slowest
+# jobs (large-country overlays) to the pool first; unlisted strategies are cheap
+STRATEGY_COST = {
+    "clip": 3,
+    "remainder": 2,
+    "disputed_remainder": 2,
+    "disputed_subtract": 2,
+    "antarctic": 2,
+    "admin1": 1,
+    "island_bbox": 1,
+}
+
+# Extractor for each strategy, adapting the common
+# (dest, subunits, units, admin1, disputed, built, antarctica_geom) arguments
+# to the extractor's own signature
+STRATEGY_TABLE: dict[str, Extractor] = {
+    "direct": lambda dest, sub, uni, adm, dis, built, ata: extract_direct(dest, sub, uni),
+    "subunit": lambda dest, sub, uni, adm, dis, built, ata: extract_subunit(dest, sub),
+    "admin1": lambda dest, sub, uni, adm, dis, built, ata: extract_admin1(dest, adm, sub, uni),
+    "remainder": lambda dest, sub, uni, adm, dis, built, ata: extract_remainder(
+        dest, adm, sub, uni, dis
+    ),
+    "disputed_remainder": lambda dest, sub, uni, adm, dis, built, ata: (
+        extract_disputed_remainder(dest, adm, sub, uni, dis)
+    ),
+    "disputed_subtract": lambda dest, sub, uni, adm, dis, built, ata: (
+        extract_disputed_remainder(dest, adm, sub, uni, dis)
+    ),
+    "clip": lambda dest, sub, uni, adm, dis, built, ata: extract_clip(dest, sub, uni, built),
+    "disputed": lambda dest, sub, uni, adm, dis, built, ata: extract_disputed(dest, dis),
+    "island_bbox": lambda dest, sub, uni, adm, dis, built, ata: extract_island_bbox(
+        dest, sub, uni, adm
+    ),
+    "antarctic": lambda dest, sub, uni, adm, dis, built, ata: generate_antarctic_wedge(dest, ata),
+    "point": lambda dest, sub, uni, adm, dis, built, ata: generate_point(dest),
+    "group_remainder": lambda dest, sub, uni, adm, dis, built, ata: extract_group_remainder(
+        dest, sub, uni, built
+    ),
+}
+
+# Start method for the build pool.  The build process is already
+# multi-threaded (threaded shapefile loads, Arrow's thread pool), so the
+# workers are not forked from it directly.
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Source frames held by each worker process (see _init_worker)
+_worker_frames: (
+    tuple[gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame, Any | None] | None
+) = None
+
 
 def load_data() -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame, gpd.GeoDataFrame]:
     """Load all source GeoDataFrames.
 
     Returns:
         A 4-tuple of ``(subunits, units, admin1, disputed)`` GeoDataFrames loaded
-        from the Natural Earth shapefiles in ``DATA_DIR``.
+        from the Natural Earth shapefiles in ``DATA_DIR`` (or their parquet caches).
     """
     print("Loading source data...")
-    subunits = gpd.read_file(DATA_DIR / "ne_10m_admin_0_map_subunits.shp")
-    units = gpd.read_file(DATA_DIR / "ne_10m_admin_0_map_units.shp")
-    admin1 = gpd.read_file(DATA_DIR / "ne_10m_admin_1_states_provinces.shp")
-    disputed = gpd.read_file(DATA_DIR / "ne_10m_admin_0_disputed_areas.shp")
+    paths = [
+        DATA_DIR / "ne_10m_admin_0_map_subunits.shp",
+        DATA_DIR / "ne_10m_admin_0_map_units.shp",
+        DATA_DIR / "ne_10m_admin_1_states_provinces.shp",
+        DATA_DIR / "ne_10m_admin_0_disputed_areas.shp",
+    ]
+    columns = [ADMIN0_COLUMNS, ADMIN0_COLUMNS, ADMIN1_COLUMNS, DISPUTED_COLUMNS]
+    # The layers are independent and their reads spend most of their time in
+    # GDAL / Arrow with the GIL released, so overlap them in threads
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        subunits, units, admin1, disputed = pool.map(load_shapefile, paths, columns)
 
     print(f"  Subunits: {len(subunits)} features")
     print(f"  Units: {len(units)} features")
@@ -56,63 +151,286 @@ def build_features(
     units: gpd.GeoDataFrame,
     admin1: gpd.GeoDataFrame,
     disputed: gpd.GeoDataFrame,
+    workers: int | None = None,
+    destinations: list[TccDestination] | None = None,
+    cache_dir: Path | None = None,
 ) -> dict[int, TccFeature]:
     """Build all 330 TCC features.
 
-    Uses a two-pass approach: first builds all features whose extraction
-    does not depend on previously built features; then builds
-    ``group_remainder`` features that subtract already-built geometries.
+    Uses a two-pass approach, both spread across one process pool: first
+    builds all features whose extraction does not depend on previously built
+    features; then builds the features that subtract already-built geometries
+    (``group_remainder``, and clips with ``subtract_indices``), each shipped
+    only the first-pass features it subtracts.
 
     Args:
         subunits: Natural Earth admin_0_map_subunits GeoDataFrame.
         units: Natural Earth admin_0_map_units GeoDataFrame.
         admin1: Natural Earth admin_1_states_provinces GeoDataFrame.
         disputed: Natural Earth breakaway_disputed_areas GeoDataFrame.
+        workers: Number of worker processes; defaults to ``os.cpu_count()``.
+            ``1`` builds everything in-process.
+        destinations: Destination configs to build; defaults to
+            ``get_destinations()``.
+        cache_dir: Directory for the on-disk first-pass feature cache, or
+            None to build everything from scratch.
 
     Returns:
         Dict mapping tcc_index to GeoJSON Feature dict for all successfully
         built features.
     """
-    destinations = get_destinations()
+    if destinations is None:
+        destinations = get_destinations()
     print(f"\nBuilding {len(destinations)} TCC destinations...")
 
     # Load Antarctica coastline for clipping wedge sectors
     antarctica_geom: Any | None = None
-    ata = units[units["ADM0_A3"] == "ATA"]
+    ata = select_rows(units, "ADM0_A3", "ATA")
     if len(ata) > 0:
-        antarctica_geom = ata.dissolve().geometry.iloc[0]
+        antarctica_geom = dissolve_rows(ata)
 
     built: dict[int, TccFeature] = {}  # tcc_index -> feature
+    independent: list[TccDestination] = []
     deferred: list[TccDestination] = []  # destinations that depend on other built features
-
-    # First pass: build all non-dependent features
     for dest in destinations:
-        strategy: str = dest.get("strategy", "direct")
-
-        if strategy == "group_remainder":
+        if dest.get("strategy") == "group_remainder" or dest.get("subtract_indices"):
             deferred.append(dest)
-            continue
-
-        feature = _extract_feature(
-            dest, strategy, subunits, units, admin1, disputed, built, antarctica_geom
-        )
-
-        if feature:
-            built[dest["tcc_index"]] = feature
         else:
-            print(f"  FAILED: [{dest['tcc_index']}] {dest['name']} (strategy={strategy})")
-
-    # Second pass: build group_remainder features (depend on first pass results)
-    for dest in deferred:
-        feature = extract_group_remainder(dest, subunits, units, built)
-        if feature:
-            built[dest["tcc_index"]] = feature
+            independent.append(dest)
+
+    # Reuse first-pass features cached by an earlier build with the same
+    # config, source data and code
+    fingerprint = _cache_fingerprint() if cache_dir is not None else b""
+    pending: list[TccDestination] = []
+    for dest in independent:
+        cached = _load_cached(cache_dir, dest, fingerprint) if cache_dir is not None else None
+        if cached:
+            built[dest["tcc_index"]] = cached
+        else:
+            pending.append(dest)
+
+    # First pass: build all non-dependent features in parallel.  The source
+    # frames are shipped once per worker process rather than once per task,
+    # and the most expensive jobs are scheduled first so that no single large
+    # overlay is left running alone at the end.
+    schedule = sorted(pending, key=lambda d: -STRATEGY_COST.get(d.get("strategy", ""), 0))
+
+    # Load the Europe-Asia boundary and its clip polygon once here rather than
+    # in every worker that gets a clip.  A missing boundary file is left for
+    # extract_clip() to report.
+    boundary: BoundaryState | None = None
+    if any(d.get("strategy") == "clip" for d in schedule + deferred):
+        with contextlib.suppress(OSError):
+            boundary = boundary_state()
+
+    frames = (subunits, units, admin1, disputed, antarctica_geom, boundary)
+    with contextlib.ExitStack() as stack:
+        run: Callable[..., Iterable[TccFeature | None]]
+        if workers == 1:
+            _init_worker(*frames)
+            run = map
         else:
-            print(f"  FAILED: [{dest['tcc_index']}] {dest['name']} (group_remainder)")
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                initializer=_init_worker,
+                initargs=frames,
+            )
+            run = stack.enter_context(pool).map
+
+        for dest, feature in zip(schedule, run(_extract_in_worker, schedule), strict=True):
+            if feature:
+                built[dest["tcc_index"]] = feature
+                if cache_dir is not None:
+                    _store_cached(cache_dir, dest, fingerprint, feature)
+
+        for dest in independent:
+            if dest["tcc_index"] not in built:
+                strategy = dest.get("strategy", "direct")
+                print(f"  FAILED: [{dest['tcc_index']}] {dest['name']} (strategy={strategy})")
+
+        # Second pass: build dependent features (need first pass results).  Each
+        # wave only subtracts features built by the first pass or by earlier
+        # waves, so the destinations within a wave can share the pool too.
+        for wave in _dependency_waves(deferred):
+            needs = [
+                {idx: built[idx] for idx in dest.get("subtract_indices", []) if idx in built}
+                for dest in wave
+            ]
+            for dest, feature in zip(wave, run(_extract_in_worker, wave, needs), strict=True):
+                if feature:
+                    built[dest["tcc_index"]] = feature
+                else:
+                    strategy = dest.get("strategy", "direct")
+                    print(f"  FAILED: [{dest['tcc_index']}] {dest['name']} (strategy={strategy})")
 
     return built
 
 
+def _dependency_waves(deferred: list[TccDestination]) -> list[list[TccDestination]]:
+    """Group dependent destinations into waves that can each run concurrently.
+
+    A destination lands in the first wave after every other deferred
+    destination listed in its ``subtract_indices``.
+
+    Args:
+        deferred: Destinations that subtract already-built features.
+
+    Returns:
+        The destinations grouped into waves, in build order.
+
+    Raises:
+        ValueError: If the ``subtract_indices`` of deferred destinations form a cycle.
+    """
+    pending = {dest["tcc_index"]: dest for dest in deferred}
+    waves: list[list[TccDestination]] = []
+    while pending:
+        wave = [
+            dest
+            for dest in pending.values()
+            if not pending.keys() & set(dest.get("subtract_indices", []))
+        ]
+        if not wave:
+            msg = f"Circular subtract_indices between destinations {sorted(pending)}"
+            raise ValueError(msg)
+        for dest in wave:
+            del pending[dest["tcc_index"]]
+        waves.append(wave)
+    return waves
+
+
+def _cache_fingerprint() -> bytes:
+    """Fingerprint the inputs every cached feature depends on.
+
+    Covers the source files in ``DATA_DIR`` (by name, size and mtime) and the
+    bytes of the build code itself, so updating either invalidates the cache.
+
+    Returns:
+        A 16-byte digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(DATA_DIR.glob("*")):
+        if path.suffix in CACHE_SOURCE_SUFFIXES:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def _cache_path(cache_dir: Path, dest: TccDestination, fingerprint: bytes) -> Path:
+    """Return the cache file for ``dest`` under the given input fingerprint.
+
+    Args:
+        cache_dir: Feature cache directory.
+        dest: Merged destination config dict from ``get_destinations()``.
+        fingerprint: Digest from ``_cache_fingerprint()``.
+
+    Returns:
+        Path of the ``.wkb`` file holding the feature's geometry.
+    """
+    config = orjson.dumps(dest, option=orjson.OPT_SORT_KEYS)
+    key = hashlib.blake2b(config + fingerprint, digest_size=16).hexdigest()
+    return cache_dir / f"{key}.wkb"
+
+
+def _load_cached(cache_dir: Path, dest: TccDestination, fingerprint: bytes) -> TccFeature | None:
+    """Load a cached feature geometry and wrap it with current properties.
+
+    Args:
+        cache_dir: Feature cache directory.
+        dest: Merged destination config dict from ``get_destinations()``.
+        fingerprint: Digest from ``_cache_fingerprint()``.
+
+    Returns:
+        The cached feature, or None on a cache miss.  An unreadable cache
+        file (e.g. truncated by an interrupted build) counts as a miss and is
+        removed.
+    """
+    path = _cache_path(cache_dir, dest, fingerprint)
+    try:
+        geom = shapely.from_wkb(path.read_bytes())
+    except OSError:
+        return None
+    except (GEOSException, ValueError):
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+        return None
+    return to_feature(geom, make_properties(dest))
+
+
+def _store_cached(
+    cache_dir: Path, dest: TccDestination, fingerprint: bytes, feature: TccFeature
+) -> None:
+    """Write a built feature's geometry to the cache as WKB.
+
+    The cache is best-effort: write failures are ignored.
+
+    Args:
+        cache_dir: Feature cache directory.
+        dest: Merged destination config dict from ``get_destinations()``.
+        fingerprint: Digest from ``_cache_fingerprint()``.
+        feature: Feature built for ``dest``.
+    """
+    geom = feature["geometry"]
+    if not isinstance(geom, BaseGeometry):
+        return
+    path = _cache_path(cache_dir, dest, fingerprint)
+    tmp = path.with_suffix(".tmp")
+    with contextlib.suppress(OSError):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(shapely.to_wkb(geom))
+        tmp.replace(path)
+
+
+def _init_worker(
+    subunits: gpd.GeoDataFrame,
+    units: gpd.GeoDataFrame,
+    admin1: gpd.GeoDataFrame,
+    disputed: gpd.GeoDataFrame,
+    antarctica_geom: Any | None,
+    boundary: BoundaryState | None = None,
+) -> None:
+    """Store the source frames for :func:`_extract_in_worker` in this process.
+
+    Args:
+        subunits: Natural Earth admin_0_map_subunits GeoDataFrame.
+        units: Natural Earth admin_0_map_units GeoDataFrame.
+        admin1: Natural Earth admin_1_states_provinces GeoDataFrame.
+        disputed: Natural Earth breakaway_disputed_areas GeoDataFrame.
+        antarctica_geom: Shapely geometry for Antarctica coastline, or None.
+        boundary: Europe-Asia boundary state from ``boundary_state()``, or
+            None to let each clip load it.
+    """
+    global _worker_frames
+    _worker_frames = (subunits, units, admin1, disputed, antarctica_geom)
+    if boundary is not None:
+        restore_boundary_state(boundary)
+
+
+def _extract_in_worker(
+    dest: TccDestination, built: dict[int, TccFeature] | None = None
+) -> TccFeature | None:
+    """Extract one destination using the frames from :func:`_init_worker`.
+
+    Args:
+        dest: Merged destination config dict from ``get_destinations()``.
+        built: The already-built features this destination subtracts, keyed
+            by tcc_index; None for first-pass destinations.
+
+    Returns:
+        A GeoJSON Feature dict, or None if extraction fails.
+    """
+    if _worker_frames is None:
+        msg = "_init_worker() must run before _extract_in_worker()"
+        raise RuntimeError(msg)
+    subunits, units, admin1, disputed, antarctica_geom = _worker_frames
+    strategy: str = dest.get("strategy", "direct")
+    return _extract_feature(
+        dest, strategy, subunits, units, admin1, disputed, built or {}, antarctica_geom
+    )
+
+
 def _extract_feature(
     dest: TccDestination,
     strategy: str,
@@ -123,7 +441,7 @@ def _extract_feature(
     built: dict[int, TccFeature],
     antarctica_geom: Any | None = None,
 ) -> TccFeature | None:
-    """Dispatch to the appropriate extraction function based on strategy.
+    """Dispatch to the appropriate extraction function via ``STRATEGY_TABLE``.
 
     Strategy routing:
 
@@ -138,6 +456,7 @@ def _extract_feature(
     - ``"island_bbox"``       → :func:`~category_c.extract_island_bbox`
     - ``"antarctic"``         → :func:`~category_c.generate_antarctic_wedge`
     - ``"point"``             → :func:`~category_c.generate_point`
+    - ``"group_remainder"``   → :func:`~category_c.extract_group_remainder`
 
     Args:
         dest: Merged destination config dict from ``get_destinations()``.
@@ -152,62 +471,51 @@ def _extract_feature(
     Returns:
         A GeoJSON Feature dict, or None if extraction fails.
     """
-    idx = dest["tcc_index"]
-    name = dest["name"]
-
-    if strategy == "direct":
-        return extract_direct(dest, subunits, units)
-
-    elif strategy == "subunit":
-        return extract_subunit(dest, subunits)
-
-    elif strategy == "admin1":
-        return extract_admin1(dest, admin1, subunits, units)
-
-    elif strategy == "remainder":
-        return extract_remainder(dest, admin1, subunits, units, disputed)
-
-    elif strategy in ("disputed_remainder", "disputed_subtract"):
-        return extract_disputed_remainder(dest, admin1, subunits, units, disputed)
-
-    elif strategy == "clip":
-        return extract_clip(dest, subunits, units, built)
-
-    elif strategy == "disputed":
-        return extract_disputed(dest, disputed)
-
-    elif strategy == "island_bbox":
-        return extract_island_bbox(dest, subunits, units, admin1)
-
-    elif strategy == "antarctic":
-        return generate_antarctic_wedge(dest, antarctica_geom)
-
-    elif strategy == "point":
-        return generate_point(dest)
-
-    else:
-        print(f"  Unknown strategy '{strategy}' for [{idx}] {name}")
+    extractor = STRATEGY_TABLE.get(strategy)
+    if extractor is None:
+        print(f"  Unknown strategy '{strategy}' for [{dest['tcc_index']}] {dest['name']}")
         return None
+    return extractor(dest, subunits, units, admin1, disputed, built, antarctica_geom)
 
 
 def write_geojson(features: dict[int, TccFeature], output_path: Path) -> None:
     """Write features dict to a GeoJSON FeatureCollection.
 
+    All shapely geometries are serialised in one vectorized
+    ``shapely.to_geojson`` call; geometries already given as GeoJSON mappings
+    and the properties go through ``orjson``.  Features are streamed to the
+    file one at a time, so the whole collection is never held in memory as
+    one string.
+
     Args:
-        features: Dict mapping tcc_index to GeoJSON Feature dict.
+        features: Dict mapping tcc_index to Feature dict.
         output_path: Destination file path (parent directories created if needed).
     """
     # Sort by tcc_index
-    sorted_features = [features[i] for i in sorted(features.keys())]
-
-    collection = {
-        "type": "FeatureCollection",
-        "features": sorted_features,
-    }
+    sorted_features = [feat for _, feat in sorted(features.items(), key=operator.itemgetter(0))]
+
+    geoms = [feat["geometry"] for feat in sorted_features]
+    encoded = [
+        b"" if isinstance(g, BaseGeometry) else orjson.dumps(g, option=orjson.OPT_SERIALIZE_NUMPY)
+        for g in geoms
+    ]
+    shapely_idx = [i for i, g in enumerate(geoms) if isinstance(g, BaseGeometry)]
+    texts = shapely.to_geojson([geoms[i] for i in shapely_idx])
+    for i, text in zip(shapely_idx, texts, strict=True):
+        encoded[i] = text.encode()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w") as f:
-        json.dump(collection, f)
+    with output_path.open("wb") as f:
+        f.write(b'{"type":"FeatureCollection","features":[')
+        for i, feat in enumerate(sorted_features):
+            if i:
+                f.write(b",")
+            f.write(b'{"type":"Feature","geometry":')
+            f.write(encoded[i])
+            f.write(b',"properties":')
+            f.write(orjson.dumps(feat["properties"], option=orjson.OPT_SERIALIZE_NUMPY))
+            f.write(b"}")
+        f.write(b"]}")
 
     size_mb = output_path.stat().st_size / (1024 * 1024)
     print(f"\nWrote {len(sorted_features)} features to {output_path} ({size_mb:.1f} MB)")
@@ -216,7 +524,15 @@ def write_geojson(features: dict[int, TccFeature], output_path: Path) -> None:
 def main() -> None:
     """Orchestrate the full build pipeline."""
     subunits, units, admin1, disputed = load_data()
-    features = build_features(subunits, units, admin1, disputed)
+    destinations = get_destinations()
+    features = build_features(
+        subunits,
+        units,
+        admin1,
+        disputed,
+        destinations=destinations,
+        cache_dir=OUTPUT_DIR / ".cache" / "features",
+    )
 
     total = len(features)
     missing = 330 - total
@@ -226,10 +542,9 @@ def main() -> None:
         all_indices = set(range(1, 331))
         built_indices = set(features.keys())
         missing_indices = sorted(all_indices - built_indices)
-        destinations = {d["tcc_index"]: d for d in get_destinations()}
         print("Missing destinations:")
         for idx in missing_indices:
-            d = destinations.get(idx, {})
+            d = get_destination(idx) or {}
             print(f"  [{idx}] {d.get('name', '???')} (strategy={d.get('strategy', '???')})")
 
     output_path = OUTPUT_DIR / "merged.geojson"
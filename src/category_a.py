@@ -8,9 +8,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from shapely.ops import unary_union
+import numpy as np
+import shapely
 
-from .utils import make_properties, to_feature
+from .utils import (
+    dissolve_rows,
+    find_rows,
+    make_properties,
+    select_rows,
+    to_feature,
+)
 
 if TYPE_CHECKING:
     import geopandas as gpd
@@ -18,6 +25,27 @@ if TYPE_CHECKING:
     from .types import TccDestination, TccFeature
 
 
+def _find_rows(
+    code: str,
+    subunits_gdf: gpd.GeoDataFrame,
+    units_gdf: gpd.GeoDataFrame,
+) -> gpd.GeoDataFrame | None:
+    """Find the admin_0 rows matching an A3 code.
+
+    Searches both GeoDataFrames across four standard A3 field names and
+    returns the first non-empty match.
+
+    Args:
+        code: Three-letter A3 code to search for.
+        subunits_gdf: Natural Earth admin_0_map_subunits GeoDataFrame.
+        units_gdf: Natural Earth admin_0_map_units GeoDataFrame.
+
+    Returns:
+        The matching rows, or None if not found.
+    """
+    return find_rows([subunits_gdf, units_gdf], ["SU_A3", "ADM0_A3", "ISO_A3", "GU_A3"], code)
+
+
 def _find_geom(
     code: str,
     subunits_gdf: gpd.GeoDataFrame,
@@ -25,8 +53,7 @@ def _find_geom(
 ) -> Any | None:
     """Find a geometry by A3 code from admin_0 layers.
 
-    Searches both GeoDataFrames across four standard A3 field names.
-    Dissolves any multi-row match into a single geometry.
+    Dissolves any multi-row match from ``_find_rows`` into a single geometry.
 
     Args:
         code: Three-letter A3 code to search for.
@@ -36,14 +63,8 @@ def _find_geom(
     Returns:
         A dissolved shapely geometry, or None if not found.
     """
-    for gdf in [subunits_gdf, units_gdf]:
-        for field in ["SU_A3", "ADM0_A3", "ISO_A3", "GU_A3"]:
-            if field not in gdf.columns:
-                continue
-            matches = gdf[gdf[field] == code]
-            if len(matches) >= 1:
-                return matches.dissolve().geometry.iloc[0]
-    return None
+    matches = _find_rows(code, subunits_gdf, units_gdf)
+    return None if matches is None else dissolve_rows(matches)
 
 
 def extract_direct(
@@ -72,31 +93,34 @@ def extract_direct(
     name = dest["name"]
     merge_a3: list[str] = dest.get("merge_a3", [])
 
-    geom = None
-
-    if ne_a3:
-        geom = _find_geom(ne_a3, subunits_gdf, units_gdf)
+    rows = _find_rows(ne_a3, subunits_gdf, units_gdf) if ne_a3 else None
+    found_by_code = rows is not None
 
     # Fallback: try name match
-    if geom is None:
+    if rows is None:
         for gdf in [subunits_gdf, units_gdf]:
             if "NAME" in gdf.columns:
-                matches = gdf[gdf["NAME"].str.lower() == name.lower()]
+                matches = select_rows(gdf, "NAME", name, lower=True)
                 if len(matches) >= 1:
-                    geom = matches.dissolve().geometry.iloc[0]
+                    rows = matches
                     break
 
-    if geom is None:
+    if rows is None:
         return None
 
-    # Merge additional features if specified (e.g. Baikonur into Kazakhstan)
     if merge_a3:
-        parts = [geom]
+        # Merge additional features (e.g. Baikonur into Kazakhstan) in a
+        # single union over every matched row instead of one per code
+        frames = [rows]
         for code in merge_a3:
-            extra = _find_geom(code, subunits_gdf, units_gdf)
+            extra = _find_rows(code, subunits_gdf, units_gdf)
             if extra is not None:
-                parts.append(extra)
-        geom = unary_union(parts)
+                frames.append(extra)
+        geom = shapely.union_all(np.concatenate([f.geometry.values for f in frames]))
+    elif found_by_code and ne_a3:
+        geom = _find_geom(ne_a3, subunits_gdf, units_gdf)
+    else:
+        geom = dissolve_rows(rows)
 
     return to_feature(geom, make_properties(dest))
 
@@ -122,11 +146,11 @@ def extract_subunit(
     if not su_a3:
         return None
 
-    matches = subunits_gdf[subunits_gdf["SU_A3"] == su_a3]
+    matches = select_rows(subunits_gdf, "SU_A3", su_a3)
 
     # If ne_name is given, narrow to the specific feature by NAME
     if ne_name and len(matches) > 1:
-        named = matches[matches["NAME"] == ne_name]
+        named = select_rows(matches, "NAME", ne_name)
         if len(named) > 0:
             matches = named
 
@@ -134,12 +158,12 @@ def extract_subunit(
         # Try NAME_EN or NAME
         for field in ["NAME_EN", "NAME"]:
             if field in subunits_gdf.columns:
-                matches = subunits_gdf[subunits_gdf[field].str.lower() == dest["name"].lower()]
+                matches = select_rows(subunits_gdf, field, dest["name"], lower=True)
                 if len(matches) >= 1:
                     break
 
     if len(matches) == 0:
         return None
 
-    geom = matches.dissolve().geometry.iloc[0]
+    geom = dissolve_rows(matches)
     return to_feature(geom, make_properties(dest))
@@ -6,13 +6,29 @@ from a parent country polygon.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from shapely.ops import unary_union
 
-from .utils import get_country_geom, make_properties, to_feature
+from .utils import (
+    column_index,
+    contains_rows,
+    difference_by_parts,
+    dissolve_rows,
+    get_country_geom,
+    lower_column,
+    make_properties,
+    make_valid_polygons,
+    select_rows,
+    to_feature,
+    union_rows,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import geopandas as gpd
 
     from .types import TccDestination, TccFeature
@@ -39,16 +55,16 @@ def extract_admin1(
         A GeoJSON Feature dict, or None if no matching provinces were found.
     """
     adm0 = dest.get("adm0_a3")
-    admin1_names: list[str] = dest.get("admin1", [])
+    admin1_names: Sequence[str] = dest.get("admin1", ())
 
     if not adm0 or not admin1_names:
         return None
 
     # Filter admin1 to the target country
-    country_admin1 = admin1_gdf[admin1_gdf["adm0_a3"] == adm0]
+    country_admin1 = select_rows(admin1_gdf, "adm0_a3", adm0)
     if len(country_admin1) == 0:
         # Try iso_a3
-        country_admin1 = admin1_gdf[admin1_gdf["iso_a2"] == dest.get("iso_a2", "")]
+        country_admin1 = select_rows(admin1_gdf, "iso_a2", dest.get("iso_a2", ""))
 
     # Match province names (case-insensitive, partial match)
     matched = _match_provinces(country_admin1, admin1_names)
@@ -60,7 +76,7 @@ def extract_admin1(
         )
         return None
 
-    geom = matched.dissolve().geometry.iloc[0]
+    geom = dissolve_rows(matched)
     return to_feature(geom, make_properties(dest))
 
 
@@ -88,7 +104,7 @@ def extract_remainder(
         A GeoJSON Feature dict, or None if the country geometry or subtraction fails.
     """
     adm0 = dest.get("adm0_a3")
-    subtract_names: list[str] = dest.get("subtract_admin1", [])
+    subtract_names: Sequence[str] = dest.get("subtract_admin1", ())
     subtract_disputed: list[str] = dest.get("subtract_disputed", [])
 
     if not adm0:
@@ -100,55 +116,47 @@ def extract_remainder(
         print(f"  WARNING: Could not find country {adm0} for remainder")
         return None
 
-    result = country_geom
+    # Collect everything to subtract, then remove it in a single overlay
+    subtract_parts: list[Any] = []
 
     # Subtract admin1 provinces
     if subtract_names:
-        country_admin1 = admin1_gdf[admin1_gdf["adm0_a3"] == adm0]
+        country_admin1 = select_rows(admin1_gdf, "adm0_a3", adm0)
         matched = _match_provinces(country_admin1, subtract_names)
 
         if len(matched) == 0:
             print(f"  WARNING: No admin1 to subtract for {dest['name']}")
         else:
-            subtract_geom = matched.dissolve().geometry.iloc[0]
-            result = result.difference(subtract_geom.buffer(0))
+            subtract_parts.append(dissolve_rows(matched))
 
     # Subtract disputed areas
     if subtract_disputed and disputed_gdf is not None:
         for disp_name in subtract_disputed:
-            for field in ["NAME", "BRK_NAME", "NAME_LONG"]:
-                if field not in disputed_gdf.columns:
-                    continue
-                matches = disputed_gdf[
-                    disputed_gdf[field].str.lower().str.contains(disp_name.lower(), na=False)
-                ]
-                if len(matches) > 0:
-                    disp_geom = matches.dissolve().geometry.iloc[0]
-                    result = result.difference(disp_geom.buffer(0))
-                    break
+            disputed = _find_disputed(disputed_gdf, disp_name, country_geom)
+            if disputed is not None:
+                subtract_parts.append(disputed)
+
+    result = country_geom
+    if subtract_parts:
+        subtract_union = unary_union([make_valid_polygons(p) for p in subtract_parts])
+        result = difference_by_parts(country_geom, subtract_union)
 
     # Merge disputed areas into result
     merge_disputed: list[str] = dest.get("merge_disputed", [])
     if merge_disputed and disputed_gdf is not None:
-        for disp_name in merge_disputed:
-            for field in ["NAME", "BRK_NAME", "NAME_LONG"]:
-                if field not in disputed_gdf.columns:
-                    continue
-                matches = disputed_gdf[
-                    disputed_gdf[field].str.lower().str.contains(disp_name.lower(), na=False)
-                ]
-                if len(matches) > 0:
-                    result = unary_union([result, matches.dissolve().geometry.iloc[0]])
-                    break
+        merged = [
+            disputed
+            for disp_name in merge_disputed
+            if (disputed := _find_disputed(disputed_gdf, disp_name)) is not None
+        ]
+        if merged:
+            result = unary_union([result, *merged])
 
     if result.is_empty:
         print(f"  WARNING: Remainder is empty for {dest['name']}")
         return None
 
-    if not result.is_valid:
-        result = result.buffer(0)
-
-    return to_feature(result, make_properties(dest))
+    return to_feature(make_valid_polygons(result), make_properties(dest))
 
 
 def extract_disputed_remainder(
@@ -188,26 +196,56 @@ def extract_disputed_remainder(
     # Find disputed features to subtract
     subtract_geoms = []
     for disp_name in subtract_disputed:
-        for field in ["NAME", "BRK_NAME", "NAME_LONG"]:
-            if field in disputed_gdf.columns:
-                matches = disputed_gdf[
-                    disputed_gdf[field].str.lower().str.contains(disp_name.lower(), na=False)
-                ]
-                if len(matches) > 0:
-                    subtract_geoms.append(matches.dissolve().geometry.iloc[0])
-                    break
+        disputed = _find_disputed(disputed_gdf, disp_name, country_geom)
+        if disputed is not None:
+            subtract_geoms.append(disputed)
 
     if subtract_geoms:
-        subtract_union = unary_union(subtract_geoms)
-        result = country_geom.difference(subtract_union.buffer(0))
-        if not result.is_valid:
-            result = result.buffer(0)
-        return to_feature(result, make_properties(dest))
+        subtract_union = unary_union([make_valid_polygons(g) for g in subtract_geoms])
+        result = difference_by_parts(country_geom, subtract_union)
+        return to_feature(make_valid_polygons(result), make_properties(dest))
 
     return to_feature(country_geom, make_properties(dest))
 
 
-def _match_provinces(admin1_gdf: gpd.GeoDataFrame, names: list[str]) -> gpd.GeoDataFrame:
+def _find_disputed(
+    disputed_gdf: gpd.GeoDataFrame,
+    name: str,
+    within: Any | None = None,
+) -> Any | None:
+    """Find disputed areas whose name contains ``name`` (case-insensitive).
+
+    Tries NAME, BRK_NAME and NAME_LONG in turn and dissolves the matches of the
+    first field that has any.  When ``within`` is given, only matches that
+    intersect it are dissolved (queried through the frame's STRtree); the rest
+    cannot affect a subtraction from ``within``.
+
+    Args:
+        disputed_gdf: Natural Earth breakaway_disputed_areas GeoDataFrame.
+        name: Substring to look for in the name fields.
+        within: Geometry the matches will be subtracted from, or None to keep
+            every match.
+
+    Returns:
+        A dissolved shapely geometry, or None if nothing (relevant) matched.
+    """
+    needle = name.lower()
+    for field in ["NAME", "BRK_NAME", "NAME_LONG"]:
+        if field not in disputed_gdf.columns:
+            continue
+        positions = contains_rows(disputed_gdf, field, needle)
+        if len(positions) == 0:
+            continue
+        if within is not None:
+            nearby = disputed_gdf.sindex.query(within, predicate="intersects")
+            positions = np.intersect1d(positions, nearby)
+            if len(positions) == 0:
+                return None
+        return union_rows(disputed_gdf, positions)
+    return None
+
+
+def _match_provinces(admin1_gdf: gpd.GeoDataFrame, names: Sequence[str]) -> gpd.GeoDataFrame:
     """Match admin1 provinces by name (case-insensitive, with fallbacks).
 
     Accumulates matches across multiple name fields so that provinces
@@ -224,30 +262,29 @@ def _match_provinces(admin1_gdf: gpd.GeoDataFrame, names: list[str]) -> gpd.GeoD
         A GeoDataFrame of matched rows (may be empty if no match found).
     """
     name_lower = [n.lower() for n in names]
-    matched_idx: set[int] = set()
 
-    # Exact match — accumulate across all name fields
+    # Exact match — accumulate row positions across all name fields
+    positions: set[int] = set()
     for field in ["name", "name_en", "NAME", "NAME_EN"]:
         if field not in admin1_gdf.columns:
             continue
-        mask = admin1_gdf[field].str.lower().isin(name_lower)
-        matched_idx.update(admin1_gdf.index[mask])
+        index = column_index(admin1_gdf, field, lower=True)
+        for name in name_lower:
+            positions.update(index.get(name, ()))
 
-    if matched_idx:
-        return admin1_gdf.loc[list(matched_idx)]
+    if positions:
+        return admin1_gdf.iloc[sorted(positions)]
 
-    # Try contains match — accumulate across all name fields
-    for field in ["name", "name_en", "NAME", "NAME_EN"]:
+    # Try contains match — one regex scan per name field, accumulated
+    # (an empty pattern would match every row)
+    pattern = "|".join(re.escape(n) for n in name_lower)
+    for field in ["name", "name_en", "NAME", "NAME_EN"] if pattern else []:
         if field not in admin1_gdf.columns:
             continue
-        mask = (
-            admin1_gdf[field]
-            .str.lower()
-            .apply(lambda x: any(n in str(x) for n in name_lower) if x else False)
-        )
-        matched_idx.update(admin1_gdf.index[mask])
+        mask = lower_column(admin1_gdf, field).str.contains(pattern, regex=True, na=False)
+        positions.update(np.flatnonzero(mask.to_numpy()))
 
-    if matched_idx:
-        return admin1_gdf.loc[list(matched_idx)]
+    if positions:
+        return admin1_gdf.iloc[sorted(positions)]
 
     return admin1_gdf.iloc[0:0]  # empty
@@ -6,17 +6,27 @@ Antarctic wedges, and point markers.
 
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import shapely
 from shapely.geometry import MultiPolygon, Point, Polygon
 from shapely.ops import unary_union
 
 from .boundary import clip_to_asia, clip_to_europe
 from .utils import (
+    contains_rows,
+    difference_by_parts,
+    dissolve_rows,
     extract_polygons_by_bbox,
+    geometries_from_features,
     get_country_geom,
     make_properties,
+    make_valid_polygons,
+    select_rows,
     to_feature,
+    union_rows,
 )
 
 if TYPE_CHECKING:
@@ -89,21 +99,15 @@ def extract_clip(
     # Subtract other TCC features if specified
     subtract_indices: list[int] = dest.get("subtract_indices", [])
     if subtract_indices and built:
-        from shapely.geometry import shape as shp
-
-        subtract_geoms = []
-        for idx in subtract_indices:
-            feat = built.get(idx)
-            if feat:
-                subtract_geoms.append(shp(feat["geometry"]))
+        subtract_geoms = geometries_from_features(
+            [feat for idx in subtract_indices if (feat := built.get(idx))]
+        )
         if subtract_geoms:
-            subtract_union = unary_union(subtract_geoms)
-            result = result.difference(subtract_union.buffer(0))
+            result = difference_by_parts(result, _valid_union(subtract_geoms))
             if result.is_empty:
                 print(f"  WARNING: Clip-subtract result empty for {dest['name']}")
                 return None
-            if not result.is_valid:
-                result = result.buffer(0)
+            result = make_valid_polygons(result)
 
     # Subtract NE subunits by SU_A3 code (e.g. Crimea from Russia)
     subtract_su: list[str] = dest.get("subtract_su_a3", [])
@@ -111,17 +115,15 @@ def extract_clip(
         subtract_geoms = []
         for su_code in subtract_su:
             if "SU_A3" in subunits_gdf.columns:
-                matches = subunits_gdf[subunits_gdf["SU_A3"] == su_code]
+                matches = select_rows(subunits_gdf, "SU_A3", su_code)
                 if len(matches) > 0:
-                    subtract_geoms.append(matches.dissolve().geometry.iloc[0])
+                    subtract_geoms.append(dissolve_rows(matches))
         if subtract_geoms:
-            subtract_union = unary_union(subtract_geoms)
-            result = result.difference(subtract_union.buffer(0))
+            result = difference_by_parts(result, _valid_union(subtract_geoms))
             if result.is_empty:
                 print(f"  WARNING: Clip-subtract-su result empty for {dest['name']}")
                 return None
-            if not result.is_valid:
-                result = result.buffer(0)
+            result = make_valid_polygons(result)
 
     return to_feature(result, make_properties(dest))
 
@@ -142,40 +144,48 @@ def extract_disputed(
     ne_name: str = str(dest.get("ne_name", dest["name"]))
     also_merge: list[str] = dest.get("also_merge", [])
 
-    geom = _find_disputed_geom(ne_name, disputed_gdf)
+    found = _find_disputed_geoms([ne_name, *also_merge], disputed_gdf)
+    geom = found.get(ne_name)
     if geom is None:
         print(f"  WARNING: Disputed feature not found: {ne_name}")
         return None
 
-    # Merge additional disputed features if specified
-    for extra_name in also_merge:
-        extra = _find_disputed_geom(extra_name, disputed_gdf)
-        if extra is not None:
-            geom = unary_union([geom, extra])
+    # Merge additional disputed features if specified, in a single union
+    extras = [extra for name in also_merge if (extra := found.get(name)) is not None]
+    if extras:
+        geom = unary_union([geom, *extras])
 
     return to_feature(geom, make_properties(dest))
 
 
-def _find_disputed_geom(name: str, disputed_gdf: gpd.GeoDataFrame) -> Any | None:
-    """Find a geometry from the disputed layer by name.
+def _find_disputed_geoms(names: list[str], disputed_gdf: gpd.GeoDataFrame) -> dict[str, Any]:
+    """Find geometries from the disputed layer for several names at once.
 
     Searches across NAME, BRK_NAME, NAME_LONG, and ADMIN fields using a
-    case-insensitive substring match.
+    case-insensitive, literal substring match against the cached lower-cased
+    columns.  Each name takes the matches of the first field where it has
+    any.
 
     Args:
-        name: Name (or partial name) to search for.
+        names: Names (or partial names) to search for.
         disputed_gdf: Natural Earth breakaway_disputed_areas GeoDataFrame.
 
     Returns:
-        A dissolved shapely geometry, or None if not found.
+        A dict mapping each name that was found to its dissolved shapely geometry.
     """
+    pending = {name: name.lower() for name in names}
+    found: dict[str, Any] = {}
     for field in ["NAME", "BRK_NAME", "NAME_LONG", "ADMIN"]:
+        if not pending:
+            break
         if field not in disputed_gdf.columns:
             continue
-        matches = disputed_gdf[disputed_gdf[field].str.lower().str.contains(name.lower(), na=False)]
-        if len(matches) > 0:
-            return matches.dissolve().geometry.iloc[0]
-    return None
+        for name, needle in list(pending.items()):
+            rows = contains_rows(disputed_gdf, field, needle)
+            if len(rows) > 0:
+                found[name] = union_rows(disputed_gdf, rows)
+                del pending[name]
+    return found
 
 
 def extract_island_bbox(
@@ -259,19 +269,13 @@ def extract_group_remainder(
     if not subtract_indices:
         return to_feature(country_geom, make_properties(dest))
 
-    subtract_geoms = []
-    for idx in subtract_indices:
-        feat = built_features.get(idx)
-        if feat:
-            from shapely.geometry import shape
-
-            subtract_geoms.append(shape(feat["geometry"]))
+    subtract_geoms = geometries_from_features(
+        [feat for idx in subtract_indices if (feat := built_features.get(idx))]
+    )
 
     if subtract_geoms:
-        subtract_union = unary_union(subtract_geoms)
-        result = country_geom.difference(subtract_union.buffer(0))
-        if not result.is_valid:
-            result = result.buffer(0)
+        result = difference_by_parts(country_geom, _valid_union(subtract_geoms))
+        result = make_valid_polygons(result)
         if result.is_empty:
             print(f"  WARNING: Group remainder empty for {dest['name']}")
             return None
@@ -307,8 +311,7 @@ def generate_antarctic_wedge(
 
     # Multi-sector territories (e.g., Australian Antarctic Territory)
     if sectors:
-        parts = [_make_wedge(s["lon_west"], s["lon_east"], lat_north, lat_south) for s in sectors]
-        wedge = unary_union(parts) if len(parts) > 1 else parts[0]
+        spans = [(s["lon_west"], s["lon_east"]) for s in sectors]
     else:
         # Single sector
         lon_west: float | None = dest.get("lon_west")
@@ -319,22 +322,29 @@ def generate_antarctic_wedge(
 
         # Handle sectors that cross the antimeridian (e.g., Ross Dependency: 160°E to 150°W)
         if lon_west > lon_east:
-            wedge1 = _make_wedge(lon_west, 180, lat_north, lat_south)
-            wedge2 = _make_wedge(-180, lon_east, lat_north, lat_south)
-            wedge = unary_union([wedge1, wedge2])
+            spans = [(lon_west, 180), (-180, lon_east)]
         else:
-            wedge = _make_wedge(lon_west, lon_east, lat_north, lat_south)
+            spans = [(lon_west, lon_east)]
 
-    # Clip wedge with actual Antarctica coastline
+    # Clip wedge with actual Antarctica coastline.  Each wedge is a lon/lat
+    # rectangle, so the rectangle clipper replaces a full overlay against the
+    # dense coastline
     if antarctica_geom is not None:
-        result = antarctica_geom.intersection(wedge)
+        aw, as_, ae, an = antarctica_geom.bounds
+        pieces = [
+            shapely.clip_by_rect(antarctica_geom, w, lat_south, e, lat_north)
+            for w, e in spans
+            # A sector whose rectangle misses the coastline's envelope is all ocean
+            if w <= ae and e >= aw and lat_south <= an and lat_north >= as_
+        ]
+        result = pieces[0] if len(pieces) == 1 else unary_union(pieces)
         if result.is_empty:
             print(f"  WARNING: Antarctic clip empty for {dest['name']}, using wedge")
-            result = wedge
-        elif not result.is_valid:
-            result = result.buffer(0)
+            result = _sector_wedge(spans, lat_north, lat_south)
+        else:
+            result = make_valid_polygons(result)
     else:
-        result = wedge
+        result = _sector_wedge(spans, lat_north, lat_south)
 
     return to_feature(result, make_properties(dest))
 
@@ -384,21 +394,86 @@ def _make_wedge(
         A ``Polygon`` wedge from ``lat_south`` to ``lat_north`` between the
         two longitudes.
     """
-    coords: list[tuple[float, float]] = []
-
     # Northern arc from west to east
-    for i in range(n_points + 1):
-        lon = lon_west + (lon_east - lon_west) * i / n_points
-        coords.append((lon, lat_north))
+    lons = np.linspace(lon_west, lon_east, n_points + 1)
+    arc = np.column_stack([lons, np.full_like(lons, lat_north)])
+
+    # South pole (or near it), then close
+    tail = np.array([[lon_east, lat_south], [lon_west, lat_south], [lon_west, lat_north]])
 
-    # South pole (or near it)
-    coords.append((lon_east, lat_south))
-    coords.append((lon_west, lat_south))
+    return Polygon(np.vstack([arc, tail]))
 
-    # Close
-    coords.append(coords[0])
 
-    return Polygon(coords)
+def _sector_wedge(
+    spans: list[tuple[float, float]], lat_north: float, lat_south: float
+) -> Polygon | MultiPolygon:
+    """Build the wedge covering several longitude spans.
+
+    Spans that neither overlap nor touch (both halves of an antimeridian
+    crossing, or separate sectors) give disjoint wedges, which form a valid
+    ``MultiPolygon`` as they are; only adjoining spans need a union.
+
+    Args:
+        spans: ``(lon_west, lon_east)`` pairs, each with ``lon_west < lon_east``.
+        lat_north: Northern latitude bound (degrees).
+        lat_south: Southern latitude bound (degrees).
+
+    Returns:
+        A ``Polygon`` for a single span, otherwise the combined wedges.
+    """
+    parts = [_make_wedge(w, e, lat_north, lat_south) for w, e in spans]
+    if len(parts) == 1:
+        return parts[0]
+    ordered = sorted(spans)
+    if all(prev[1] < nxt[0] for prev, nxt in itertools.pairwise(ordered)):
+        return MultiPolygon(parts)
+    return unary_union(parts)
+
+
+def _valid_union(geoms: list[Any]) -> Any:
+    """Union subtract geometries into one valid polygonal geometry.
+
+    Most destinations subtract a single feature, which is used directly
+    instead of going through a one-element ``unary_union``.
+
+    Args:
+        geoms: Non-empty list of shapely (Multi)Polygons.
+
+    Returns:
+        The (repaired, if needed) union of ``geoms``.
+    """
+    union = geoms[0] if len(geoms) == 1 else unary_union(geoms)
+    return make_valid_polygons(union)
+
+
+def _parts_in_lon(
+    geom: Polygon | MultiPolygon, lo: float, hi: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the polygon parts of ``geom`` and which of them lie in a longitude band.
+
+    A part's centroid lies within its envelope, so parts whose bounds miss
+    ``[lo, hi]`` are out and parts whose bounds lie inside it are in; centroids
+    are only computed for the parts straddling an edge of the band.  Bounds and
+    centroids are each taken in one vectorized shapely call.
+
+    Args:
+        geom: A ``Polygon`` or ``MultiPolygon`` to inspect.
+        lo: Western longitude bound (inclusive).
+        hi: Eastern longitude bound (inclusive).
+
+    Returns:
+        A ``(parts, inside)`` tuple: the array of polygon parts and a boolean
+        mask of those whose centroid.x is in ``[lo, hi]``.
+    """
+    if not isinstance(geom, Polygon | MultiPolygon):
+        return np.empty(0, dtype=object), np.zeros(0, dtype=bool)
+    parts = shapely.get_parts(geom)
+    bounds = shapely.bounds(parts)
+    inside = (bounds[:, 0] <= hi) & (bounds[:, 2] >= lo)
+    candidates = np.flatnonzero(inside & ((bounds[:, 0] < lo) | (bounds[:, 2] > hi)))
+    cx = shapely.get_x(shapely.centroid(parts[candidates]))
+    inside[candidates] = (cx >= lo) & (cx <= hi)
+    return parts, inside
 
 
 def _collect_parts_in_lon(geom: Polygon | MultiPolygon, lo: float, hi: float) -> list[Polygon]:
@@ -412,15 +487,8 @@ def _collect_parts_in_lon(geom: Polygon | MultiPolygon, lo: float, hi: float) ->
     Returns:
         List of polygon parts whose centroid.x is in ``[lo, hi]``.
     """
-    parts: list[Polygon] = []
-    if isinstance(geom, Polygon):
-        if lo <= geom.centroid.x <= hi:
-            parts.append(geom)
-    elif isinstance(geom, MultiPolygon):
-        for p in geom.geoms:
-            if lo <= p.centroid.x <= hi:
-                parts.append(p)
-    return parts
+    parts, inside = _parts_in_lon(geom, lo, hi)
+    return list(parts[inside])
 
 
 def _split_parts_by_lon(
@@ -439,20 +507,8 @@ def _split_parts_by_lon(
         A ``(keep, shed)`` tuple where ``keep`` contains parts whose centroid.x
         is outside ``[lo, hi]`` and ``shed`` contains parts inside ``[lo, hi]``.
     """
-    keep: list[Polygon] = []
-    shed: list[Polygon] = []
-    if isinstance(geom, Polygon):
-        if lo <= geom.centroid.x <= hi:
-            shed.append(geom)
-        else:
-            keep.append(geom)
-    elif isinstance(geom, MultiPolygon):
-        for p in geom.geoms:
-            if lo <= p.centroid.x <= hi:
-                shed.append(p)
-            else:
-                keep.append(p)
-    return keep, shed
+    parts, inside = _parts_in_lon(geom, lo, hi)
+    return list(parts[~inside]), list(parts[inside])
 
 
 def _get_admin1_geom(
@@ -470,13 +526,13 @@ def _get_admin1_geom(
     Returns:
         A dissolved shapely geometry, or None if not found.
     """
-    country = admin1_gdf[admin1_gdf["adm0_a3"] == adm0_a3] if adm0_a3 else admin1_gdf
+    country = select_rows(admin1_gdf, "adm0_a3", adm0_a3) if adm0_a3 else admin1_gdf
 
     for field in ["name", "name_en", "NAME", "NAME_EN"]:
         if field not in country.columns:
             continue
-        matches = country[country[field].str.lower() == admin1_name.lower()]
+        matches = select_rows(country, field, admin1_name, lower=True)
         if len(matches) > 0:
-            return matches.dissolve().geometry.iloc[0]
+            return dissolve_rows(matches)
 
     return None
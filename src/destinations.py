@@ -2,30 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
     from .types import TccDestination
 
-# Each destination tuple fields (positional):
-#   [0] tcc_index : int          — TCC destination number (1-330)
-#   [1] name      : str          — TCC destination name
-#   [2] region    : str          — TCC region name
-#   [3] iso_a2    : str | None   — ISO 3166-1 alpha-2 code (None for sub-national)
-#   [4] iso_a3    : str | None   — ISO 3166-1 alpha-3 code (None for sub-national)
-#   [5] iso_n3    : int | None   — ISO 3166-1 numeric code (None for sub-national)
-#   [6] sovereign : str          — Sovereign state name
-#   [7] type      : str          — Feature type: "country" | "territory" | "disputed"
-#                                               | "subnational" | "antarctic"
-#
 # EXTRACTIONS dict fields (per-entry keys vary by strategy):
 #   strategy       : str   — Extraction strategy (see strategy comments below)
 #   adm0_a3        : str   — NE ADM0_A3 / SU_A3 code for the parent country
 #   su_a3          : str   — NE SU_A3 code (strategy="subunit")
-#   admin1         : list  — Province names to dissolve (strategy="admin1")
-#   subtract_admin1: list  — Province names to subtract (strategy="remainder")
+#   admin1         : tuple — Province names to dissolve (strategy="admin1")
+#   subtract_admin1: tuple — Province names to subtract (strategy="remainder")
 #   subtract_disputed: list — Disputed layer feature names to subtract
 #   merge_disputed : list  — Disputed layer feature names to merge in
+#   ne_name        : str   — NE feature name when it differs from the TCC name
+#                            (strategy="subunit" / "disputed"); never ``name``,
+#                            which would override the TCC name in the output
+#   also_merge     : list  — Further disputed layer names to merge (strategy="disputed")
 #   parent_adm0_a3 : str   — Parent country A3 code (strategy="island_bbox")
 #   parent_admin1  : str   — Parent province name (strategy="island_bbox")
 #   bbox           : tuple — (west, south, east, north) for bbox extraction
@@ -34,38 +27,63 @@ if TYPE_CHECKING:
 #   sectors        : list  — Multi-sector defs (strategy="antarctic")
 #   lat, lon       : float — Point coordinates (strategy="point")
 
-type _DestRow = tuple[int, str, str, str | None, str | None, int | None, str, str]
 
-DESTINATIONS: list[_DestRow] = [
+class _DestRow(NamedTuple):
+    """One TCC destination; the fields are also the base keys of its config dict."""
+
+    tcc_index: int  # TCC destination number (1-330)
+    name: str  # TCC destination name
+    region: str  # TCC region name
+    iso_a2: str | None  # ISO 3166-1 alpha-2 code (None for sub-national)
+    iso_a3: str | None  # ISO 3166-1 alpha-3 code (None for sub-national)
+    iso_n3: int | None  # ISO 3166-1 numeric code (None for sub-national)
+    sovereign: str  # Sovereign state name
+    # Feature type: "country" | "territory" | "disputed" | "subnational" | "antarctic"
+    type: str
+
+
+DESTINATIONS: tuple[_DestRow, ...] = (
     # === PACIFIC OCEAN (1-40) ===
-    (1, "Austral Islands", "Pacific Ocean", None, None, None, "France", "territory"),
-    (2, "Australia", "Pacific Ocean", "AU", "AUS", 36, "Australia", "country"),
-    (3, "Chatham Islands", "Pacific Ocean", None, None, None, "New Zealand", "territory"),
-    (4, "Cook Islands", "Pacific Ocean", "CK", "COK", 184, "Cook Islands", "country"),
-    (5, "Easter Island", "Pacific Ocean", None, None, None, "Chile", "territory"),
-    (6, "Fiji Islands", "Pacific Ocean", "FJ", "FJI", 242, "Fiji", "country"),
-    (7, "French Polynesia", "Pacific Ocean", "PF", "PYF", 258, "France", "territory"),
-    (8, "Galapagos Islands", "Pacific Ocean", None, None, None, "Ecuador", "subnational"),
-    (9, "Guam", "Pacific Ocean", "GU", "GUM", 316, "United States", "territory"),
-    (10, "Hawaiian Islands", "Pacific Ocean", None, None, None, "United States", "subnational"),
-    (11, "Juan Fernandez Islands", "Pacific Ocean", None, None, None, "Chile", "territory"),
-    (12, "Kiribati", "Pacific Ocean", "KI", "KIR", 296, "Kiribati", "country"),
-    (13, "Line/Phoenix Islands", "Pacific Ocean", None, None, None, "Kiribati", "territory"),
-    (14, "Lord Howe Island", "Pacific Ocean", None, None, None, "Australia", "territory"),
-    (15, "Marquesas Islands", "Pacific Ocean", None, None, None, "France", "territory"),
-    (16, "Marshall Islands", "Pacific Ocean", "MH", "MHL", 584, "Marshall Islands", "country"),
-    (17, "Micronesia", "Pacific Ocean", "FM", "FSM", 583, "Micronesia", "country"),
-    (18, "Midway Island", "Pacific Ocean", None, None, None, "United States", "territory"),
-    (19, "Nauru", "Pacific Ocean", "NR", "NRU", 520, "Nauru", "country"),
-    (20, "New Caledonia & Dependencies", "Pacific Ocean", "NC", "NCL", 540, "France", "territory"),
-    (21, "New Zealand", "Pacific Ocean", "NZ", "NZL", 554, "New Zealand", "country"),
-    (22, "Niue", "Pacific Ocean", "NU", "NIU", 570, "Niue", "country"),
-    (23, "Norfolk Island", "Pacific Ocean", "NF", "NFK", 574, "Australia", "territory"),
-    (24, "Northern Marianas", "Pacific Ocean", "MP", "MNP", 580, "United States", "territory"),
-    (25, "Ogasawara", "Pacific Ocean", None, None, None, "Japan", "territory"),
-    (26, "Palau", "Pacific Ocean", "PW", "PLW", 585, "Palau", "country"),
-    (27, "Papua New Guinea", "Pacific Ocean", "PG", "PNG", 598, "Papua New Guinea", "country"),
-    (
+    _DestRow(1, "Austral Islands", "Pacific Ocean", None, None, None, "France", "territory"),
+    _DestRow(2, "Australia", "Pacific Ocean", "AU", "AUS", 36, "Australia", "country"),
+    _DestRow(3, "Chatham Islands", "Pacific Ocean", None, None, None, "New Zealand", "territory"),
+    _DestRow(4, "Cook Islands", "Pacific Ocean", "CK", "COK", 184, "Cook Islands", "country"),
+    _DestRow(5, "Easter Island", "Pacific Ocean", None, None, None, "Chile", "territory"),
+    _DestRow(6, "Fiji Islands", "Pacific Ocean", "FJ", "FJI", 242, "Fiji", "country"),
+    _DestRow(7, "French Polynesia", "Pacific Ocean", "PF", "PYF", 258, "France", "territory"),
+    _DestRow(8, "Galapagos Islands", "Pacific Ocean", None, None, None, "Ecuador", "subnational"),
+    _DestRow(9, "Guam", "Pacific Ocean", "GU", "GUM", 316, "United States", "territory"),
+    _DestRow(
+        10, "Hawaiian Islands", "Pacific Ocean", None, None, None, "United States", "subnational"
+    ),
+    _DestRow(11, "Juan Fernandez Islands", "Pacific Ocean", None, None, None, "Chile", "territory"),
+    _DestRow(12, "Kiribati", "Pacific Ocean", "KI", "KIR", 296, "Kiribati", "country"),
+    _DestRow(
+        13, "Line/Phoenix Islands", "Pacific Ocean", None, None, None, "Kiribati", "territory"
+    ),
+    _DestRow(14, "Lord Howe Island", "Pacific Ocean", None, None, None, "Australia", "territory"),
+    _DestRow(15, "Marquesas Islands", "Pacific Ocean", None, None, None, "France", "territory"),
+    _DestRow(
+        16, "Marshall Islands", "Pacific Ocean", "MH", "MHL", 584, "Marshall Islands", "country"
+    ),
+    _DestRow(17, "Micronesia", "Pacific Ocean", "FM", "FSM", 583, "Micronesia", "country"),
+    _DestRow(18, "Midway Island", "Pacific Ocean", None, None, None, "United States", "territory"),
+    _DestRow(19, "Nauru", "Pacific Ocean", "NR", "NRU", 520, "Nauru", "country"),
+    _DestRow(
+        20, "New Caledonia & Dependencies", "Pacific Ocean", "NC", "NCL", 540, "France", "territory"
+    ),
+    _DestRow(21, "New Zealand", "Pacific Ocean", "NZ", "NZL", 554, "New Zealand", "country"),
+    _DestRow(22, "Niue", "Pacific Ocean", "NU", "NIU", 570, "Niue", "country"),
+    _DestRow(23, "Norfolk Island", "Pacific Ocean", "NF", "NFK", 574, "Australia", "territory"),
+    _DestRow(
+        24, "Northern Marianas", "Pacific Ocean", "MP", "MNP", 580, "United States", "territory"
+    ),
+    _DestRow(25, "Ogasawara", "Pacific Ocean", None, None, None, "Japan", "territory"),
+    _DestRow(26, "Palau", "Pacific Ocean", "PW", "PLW", 585, "Palau", "country"),
+    _DestRow(
+        27, "Papua New Guinea", "Pacific Ocean", "PG", "PNG", 598, "Papua New Guinea", "country"
+    ),
+    _DestRow(
         28,
         "Papua New Guinea \u2013 Islands Region",
         "Pacific Ocean",
@@ -75,25 +93,31 @@ DESTINATIONS: list[_DestRow] = [
         "Papua New Guinea",
         "subnational",
     ),
-    (29, "Pitcairn Island", "Pacific Ocean", "PN", "PCN", 612, "United Kingdom", "territory"),
-    (30, "Ryukyu Islands", "Pacific Ocean", None, None, None, "Japan", "subnational"),
-    (31, "Samoa American", "Pacific Ocean", "AS", "ASM", 16, "United States", "territory"),
-    (32, "Samoa", "Pacific Ocean", "WS", "WSM", 882, "Samoa", "country"),
-    (33, "Solomon Islands", "Pacific Ocean", "SB", "SLB", 90, "Solomon Islands", "country"),
-    (34, "Tasmania", "Pacific Ocean", None, None, None, "Australia", "subnational"),
-    (35, "Tokelau Islands", "Pacific Ocean", "TK", "TKL", 772, "New Zealand", "territory"),
-    (36, "Tonga", "Pacific Ocean", "TO", "TON", 776, "Tonga", "country"),
-    (37, "Tuvalu", "Pacific Ocean", "TV", "TUV", 798, "Tuvalu", "country"),
-    (38, "Vanuatu", "Pacific Ocean", "VU", "VUT", 548, "Vanuatu", "country"),
-    (39, "Wake Island", "Pacific Ocean", None, None, None, "United States", "territory"),
-    (40, "Wallis & Futuna Islands", "Pacific Ocean", "WF", "WLF", 876, "France", "territory"),
+    _DestRow(
+        29, "Pitcairn Island", "Pacific Ocean", "PN", "PCN", 612, "United Kingdom", "territory"
+    ),
+    _DestRow(30, "Ryukyu Islands", "Pacific Ocean", None, None, None, "Japan", "subnational"),
+    _DestRow(31, "Samoa American", "Pacific Ocean", "AS", "ASM", 16, "United States", "territory"),
+    _DestRow(32, "Samoa", "Pacific Ocean", "WS", "WSM", 882, "Samoa", "country"),
+    _DestRow(33, "Solomon Islands", "Pacific Ocean", "SB", "SLB", 90, "Solomon Islands", "country"),
+    _DestRow(34, "Tasmania", "Pacific Ocean", None, None, None, "Australia", "subnational"),
+    _DestRow(35, "Tokelau Islands", "Pacific Ocean", "TK", "TKL", 772, "New Zealand", "territory"),
+    _DestRow(36, "Tonga", "Pacific Ocean", "TO", "TON", 776, "Tonga", "country"),
+    _DestRow(37, "Tuvalu", "Pacific Ocean", "TV", "TUV", 798, "Tuvalu", "country"),
+    _DestRow(38, "Vanuatu", "Pacific Ocean", "VU", "VUT", 548, "Vanuatu", "country"),
+    _DestRow(39, "Wake Island", "Pacific Ocean", None, None, None, "United States", "territory"),
+    _DestRow(
+        40, "Wallis & Futuna Islands", "Pacific Ocean", "WF", "WLF", 876, "France", "territory"
+    ),
     # === NORTH AMERICA (41-46) ===
-    (41, "Alaska", "North America", None, None, None, "United States", "subnational"),
-    (42, "Canada", "North America", "CA", "CAN", 124, "Canada", "country"),
-    (43, "Mexico", "North America", "MX", "MEX", 484, "Mexico", "country"),
-    (44, "Prince Edward Island", "North America", None, None, None, "Canada", "subnational"),
-    (45, "St. Pierre & Miquelon", "North America", "PM", "SPM", 666, "France", "territory"),
-    (
+    _DestRow(41, "Alaska", "North America", None, None, None, "United States", "subnational"),
+    _DestRow(42, "Canada", "North America", "CA", "CAN", 124, "Canada", "country"),
+    _DestRow(43, "Mexico", "North America", "MX", "MEX", 484, "Mexico", "country"),
+    _DestRow(
+        44, "Prince Edward Island", "North America", None, None, None, "Canada", "subnational"
+    ),
+    _DestRow(45, "St. Pierre & Miquelon", "North America", "PM", "SPM", 666, "France", "territory"),
+    _DestRow(
         46,
         "United States (Contiguous)",
         "North America",
@@ -104,54 +128,62 @@ DESTINATIONS: list[_DestRow] = [
         "country",
     ),
     # === CENTRAL AMERICA (47-53) ===
-    (47, "Belize", "Central America", "BZ", "BLZ", 84, "Belize", "country"),
-    (48, "Costa Rica", "Central America", "CR", "CRI", 188, "Costa Rica", "country"),
-    (49, "El Salvador", "Central America", "SV", "SLV", 222, "El Salvador", "country"),
-    (50, "Guatemala", "Central America", "GT", "GTM", 320, "Guatemala", "country"),
-    (51, "Honduras", "Central America", "HN", "HND", 340, "Honduras", "country"),
-    (52, "Nicaragua", "Central America", "NI", "NIC", 558, "Nicaragua", "country"),
-    (53, "Panama", "Central America", "PA", "PAN", 591, "Panama", "country"),
+    _DestRow(47, "Belize", "Central America", "BZ", "BLZ", 84, "Belize", "country"),
+    _DestRow(48, "Costa Rica", "Central America", "CR", "CRI", 188, "Costa Rica", "country"),
+    _DestRow(49, "El Salvador", "Central America", "SV", "SLV", 222, "El Salvador", "country"),
+    _DestRow(50, "Guatemala", "Central America", "GT", "GTM", 320, "Guatemala", "country"),
+    _DestRow(51, "Honduras", "Central America", "HN", "HND", 340, "Honduras", "country"),
+    _DestRow(52, "Nicaragua", "Central America", "NI", "NIC", 558, "Nicaragua", "country"),
+    _DestRow(53, "Panama", "Central America", "PA", "PAN", 591, "Panama", "country"),
     # === SOUTH AMERICA (54-67) ===
-    (54, "Argentina", "South America", "AR", "ARG", 32, "Argentina", "country"),
-    (55, "Bolivia", "South America", "BO", "BOL", 68, "Bolivia", "country"),
-    (56, "Brazil", "South America", "BR", "BRA", 76, "Brazil", "country"),
-    (57, "Chile", "South America", "CL", "CHL", 152, "Chile", "country"),
-    (58, "Colombia", "South America", "CO", "COL", 170, "Colombia", "country"),
-    (59, "Ecuador", "South America", "EC", "ECU", 218, "Ecuador", "country"),
-    (60, "French Guiana", "South America", "GF", "GUF", 254, "France", "territory"),
-    (61, "Guyana", "South America", "GY", "GUY", 328, "Guyana", "country"),
-    (62, "Nueva Esparta", "South America", None, None, None, "Venezuela", "subnational"),
-    (63, "Paraguay", "South America", "PY", "PRY", 600, "Paraguay", "country"),
-    (64, "Peru", "South America", "PE", "PER", 604, "Peru", "country"),
-    (65, "Suriname", "South America", "SR", "SUR", 740, "Suriname", "country"),
-    (66, "Uruguay", "South America", "UY", "URY", 858, "Uruguay", "country"),
-    (67, "Venezuela", "South America", "VE", "VEN", 862, "Venezuela", "country"),
+    _DestRow(54, "Argentina", "South America", "AR", "ARG", 32, "Argentina", "country"),
+    _DestRow(55, "Bolivia", "South America", "BO", "BOL", 68, "Bolivia", "country"),
+    _DestRow(56, "Brazil", "South America", "BR", "BRA", 76, "Brazil", "country"),
+    _DestRow(57, "Chile", "South America", "CL", "CHL", 152, "Chile", "country"),
+    _DestRow(58, "Colombia", "South America", "CO", "COL", 170, "Colombia", "country"),
+    _DestRow(59, "Ecuador", "South America", "EC", "ECU", 218, "Ecuador", "country"),
+    _DestRow(60, "French Guiana", "South America", "GF", "GUF", 254, "France", "territory"),
+    _DestRow(61, "Guyana", "South America", "GY", "GUY", 328, "Guyana", "country"),
+    _DestRow(62, "Nueva Esparta", "South America", None, None, None, "Venezuela", "subnational"),
+    _DestRow(63, "Paraguay", "South America", "PY", "PRY", 600, "Paraguay", "country"),
+    _DestRow(64, "Peru", "South America", "PE", "PER", 604, "Peru", "country"),
+    _DestRow(65, "Suriname", "South America", "SR", "SUR", 740, "Suriname", "country"),
+    _DestRow(66, "Uruguay", "South America", "UY", "URY", 858, "Uruguay", "country"),
+    _DestRow(67, "Venezuela", "South America", "VE", "VEN", 862, "Venezuela", "country"),
     # === CARIBBEAN (68-98) ===
-    (68, "Anguilla", "Caribbean", "AI", "AIA", 660, "United Kingdom", "territory"),
-    (69, "Antigua & Barbuda", "Caribbean", "AG", "ATG", 28, "Antigua and Barbuda", "country"),
-    (70, "Aruba", "Caribbean", "AW", "ABW", 533, "Netherlands", "territory"),
-    (71, "Bahamas", "Caribbean", "BS", "BHS", 44, "Bahamas", "country"),
-    (72, "Barbados", "Caribbean", "BB", "BRB", 52, "Barbados", "country"),
-    (73, "Bonaire", "Caribbean", None, "BES", None, "Netherlands", "territory"),
-    (74, "Cayman Islands", "Caribbean", "KY", "CYM", 136, "United Kingdom", "territory"),
-    (75, "Cuba", "Caribbean", "CU", "CUB", 192, "Cuba", "country"),
-    (76, "Curacao", "Caribbean", "CW", "CUW", 531, "Netherlands", "territory"),
-    (77, "Dominica", "Caribbean", "DM", "DMA", 212, "Dominica", "country"),
-    (78, "Dominican Republic", "Caribbean", "DO", "DOM", 214, "Dominican Republic", "country"),
-    (79, "Grenada & Dependencies", "Caribbean", "GD", "GRD", 308, "Grenada", "country"),
-    (80, "Guadeloupe & Dependencies", "Caribbean", "GP", "GLP", 312, "France", "territory"),
-    (81, "Haiti", "Caribbean", "HT", "HTI", 332, "Haiti", "country"),
-    (82, "Jamaica", "Caribbean", "JM", "JAM", 388, "Jamaica", "country"),
-    (83, "Martinique", "Caribbean", "MQ", "MTQ", 474, "France", "territory"),
-    (84, "Montserrat", "Caribbean", "MS", "MSR", 500, "United Kingdom", "territory"),
-    (85, "Nevis", "Caribbean", None, None, None, "Saint Kitts and Nevis", "subnational"),
-    (86, "Puerto Rico", "Caribbean", "PR", "PRI", 630, "United States", "territory"),
-    (87, "Saba & Sint Eustatius", "Caribbean", None, "BES", None, "Netherlands", "territory"),
-    (88, "St. Barth\u00e9lemy", "Caribbean", "BL", "BLM", 652, "France", "territory"),
-    (89, "St. Kitts", "Caribbean", None, None, None, "Saint Kitts and Nevis", "subnational"),
-    (90, "St. Lucia", "Caribbean", "LC", "LCA", 662, "Saint Lucia", "country"),
-    (91, "St. Martin", "Caribbean", "MF", "MAF", 663, "France", "territory"),
-    (
+    _DestRow(68, "Anguilla", "Caribbean", "AI", "AIA", 660, "United Kingdom", "territory"),
+    _DestRow(
+        69, "Antigua & Barbuda", "Caribbean", "AG", "ATG", 28, "Antigua and Barbuda", "country"
+    ),
+    _DestRow(70, "Aruba", "Caribbean", "AW", "ABW", 533, "Netherlands", "territory"),
+    _DestRow(71, "Bahamas", "Caribbean", "BS", "BHS", 44, "Bahamas", "country"),
+    _DestRow(72, "Barbados", "Caribbean", "BB", "BRB", 52, "Barbados", "country"),
+    _DestRow(73, "Bonaire", "Caribbean", None, "BES", None, "Netherlands", "territory"),
+    _DestRow(74, "Cayman Islands", "Caribbean", "KY", "CYM", 136, "United Kingdom", "territory"),
+    _DestRow(75, "Cuba", "Caribbean", "CU", "CUB", 192, "Cuba", "country"),
+    _DestRow(76, "Curacao", "Caribbean", "CW", "CUW", 531, "Netherlands", "territory"),
+    _DestRow(77, "Dominica", "Caribbean", "DM", "DMA", 212, "Dominica", "country"),
+    _DestRow(
+        78, "Dominican Republic", "Caribbean", "DO", "DOM", 214, "Dominican Republic", "country"
+    ),
+    _DestRow(79, "Grenada & Dependencies", "Caribbean", "GD", "GRD", 308, "Grenada", "country"),
+    _DestRow(80, "Guadeloupe & Dependencies", "Caribbean", "GP", "GLP", 312, "France", "territory"),
+    _DestRow(81, "Haiti", "Caribbean", "HT", "HTI", 332, "Haiti", "country"),
+    _DestRow(82, "Jamaica", "Caribbean", "JM", "JAM", 388, "Jamaica", "country"),
+    _DestRow(83, "Martinique", "Caribbean", "MQ", "MTQ", 474, "France", "territory"),
+    _DestRow(84, "Montserrat", "Caribbean", "MS", "MSR", 500, "United Kingdom", "territory"),
+    _DestRow(85, "Nevis", "Caribbean", None, None, None, "Saint Kitts and Nevis", "subnational"),
+    _DestRow(86, "Puerto Rico", "Caribbean", "PR", "PRI", 630, "United States", "territory"),
+    _DestRow(
+        87, "Saba & Sint Eustatius", "Caribbean", None, "BES", None, "Netherlands", "territory"
+    ),
+    _DestRow(88, "St. Barth\u00e9lemy", "Caribbean", "BL", "BLM", 652, "France", "territory"),
+    _DestRow(
+        89, "St. Kitts", "Caribbean", None, None, None, "Saint Kitts and Nevis", "subnational"
+    ),
+    _DestRow(90, "St. Lucia", "Caribbean", "LC", "LCA", 662, "Saint Lucia", "country"),
+    _DestRow(91, "St. Martin", "Caribbean", "MF", "MAF", 663, "France", "territory"),
+    _DestRow(
         92,
         "St. Vincent & the Grenadines",
         "Caribbean",
@@ -161,25 +193,39 @@ DESTINATIONS: list[_DestRow] = [
         "Saint Vincent and the Grenadines",
         "country",
     ),
-    (93, "San Andres & Providencia", "Caribbean", None, None, None, "Colombia", "subnational"),
-    (94, "Sint Maarten", "Caribbean", "SX", "SXM", 534, "Netherlands", "territory"),
-    (95, "Trinidad & Tobago", "Caribbean", "TT", "TTO", 780, "Trinidad and Tobago", "country"),
-    (96, "Turks & Caicos Islands", "Caribbean", "TC", "TCA", 796, "United Kingdom", "territory"),
-    (97, "Virgin Islands British", "Caribbean", "VG", "VGB", 92, "United Kingdom", "territory"),
-    (98, "Virgin Islands U.S.", "Caribbean", "VI", "VIR", 850, "United States", "territory"),
+    _DestRow(
+        93, "San Andres & Providencia", "Caribbean", None, None, None, "Colombia", "subnational"
+    ),
+    _DestRow(94, "Sint Maarten", "Caribbean", "SX", "SXM", 534, "Netherlands", "territory"),
+    _DestRow(
+        95, "Trinidad & Tobago", "Caribbean", "TT", "TTO", 780, "Trinidad and Tobago", "country"
+    ),
+    _DestRow(
+        96, "Turks & Caicos Islands", "Caribbean", "TC", "TCA", 796, "United Kingdom", "territory"
+    ),
+    _DestRow(
+        97, "Virgin Islands British", "Caribbean", "VG", "VGB", 92, "United Kingdom", "territory"
+    ),
+    _DestRow(
+        98, "Virgin Islands U.S.", "Caribbean", "VI", "VIR", 850, "United States", "territory"
+    ),
     # === ATLANTIC OCEAN (99-112) ===
-    (99, "Ascension", "Atlantic Ocean", None, None, None, "United Kingdom", "territory"),
-    (100, "Azores Islands", "Atlantic Ocean", None, None, None, "Portugal", "subnational"),
-    (101, "Bermuda", "Atlantic Ocean", "BM", "BMU", 60, "United Kingdom", "territory"),
-    (102, "Canary Islands", "Atlantic Ocean", None, None, None, "Spain", "subnational"),
-    (103, "Cape Verde Islands", "Atlantic Ocean", "CV", "CPV", 132, "Cape Verde", "country"),
-    (104, "Falkland Islands", "Atlantic Ocean", "FK", "FLK", 238, "United Kingdom", "territory"),
-    (105, "Faroe Islands", "Atlantic Ocean", "FO", "FRO", 234, "Denmark", "territory"),
-    (106, "Fernando de Noronha", "Atlantic Ocean", None, None, None, "Brazil", "territory"),
-    (107, "Greenland", "Atlantic Ocean", "GL", "GRL", 304, "Denmark", "territory"),
-    (108, "Iceland", "Atlantic Ocean", "IS", "ISL", 352, "Iceland", "country"),
-    (109, "Madeira", "Atlantic Ocean", None, None, None, "Portugal", "subnational"),
-    (
+    _DestRow(99, "Ascension", "Atlantic Ocean", None, None, None, "United Kingdom", "territory"),
+    _DestRow(100, "Azores Islands", "Atlantic Ocean", None, None, None, "Portugal", "subnational"),
+    _DestRow(101, "Bermuda", "Atlantic Ocean", "BM", "BMU", 60, "United Kingdom", "territory"),
+    _DestRow(102, "Canary Islands", "Atlantic Ocean", None, None, None, "Spain", "subnational"),
+    _DestRow(
+        103, "Cape Verde Islands", "Atlantic Ocean", "CV", "CPV", 132, "Cape Verde", "country"
+    ),
+    _DestRow(
+        104, "Falkland Islands", "Atlantic Ocean", "FK", "FLK", 238, "United Kingdom", "territory"
+    ),
+    _DestRow(105, "Faroe Islands", "Atlantic Ocean", "FO", "FRO", 234, "Denmark", "territory"),
+    _DestRow(106, "Fernando de Noronha", "Atlantic Ocean", None, None, None, "Brazil", "territory"),
+    _DestRow(107, "Greenland", "Atlantic Ocean", "GL", "GRL", 304, "Denmark", "territory"),
+    _DestRow(108, "Iceland", "Atlantic Ocean", "IS", "ISL", 352, "Iceland", "country"),
+    _DestRow(109, "Madeira", "Atlantic Ocean", None, None, None, "Portugal", "subnational"),
+    _DestRow(
         110,
         "South Georgia & the South Sandwich Islands",
         "Atlantic Ocean",
@@ -189,17 +235,23 @@ DESTINATIONS: list[_DestRow] = [
         "United Kingdom",
         "territory",
     ),
-    (111, "St. Helena", "Atlantic Ocean", None, None, None, "United Kingdom", "territory"),
-    (112, "Tristan da Cunha", "Atlantic Ocean", None, None, None, "United Kingdom", "territory"),
+    _DestRow(111, "St. Helena", "Atlantic Ocean", None, None, None, "United Kingdom", "territory"),
+    _DestRow(
+        112, "Tristan da Cunha", "Atlantic Ocean", None, None, None, "United Kingdom", "territory"
+    ),
     # === EUROPE & MEDITERRANEAN (113-180) ===
-    (113, "Aland Islands", "Europe & Mediterranean", "AX", "ALA", 248, "Finland", "subnational"),
-    (114, "Albania", "Europe & Mediterranean", "AL", "ALB", 8, "Albania", "country"),
-    (115, "Andorra", "Europe & Mediterranean", "AD", "AND", 20, "Andorra", "country"),
-    (116, "Austria", "Europe & Mediterranean", "AT", "AUT", 40, "Austria", "country"),
-    (117, "Balearic Islands", "Europe & Mediterranean", None, None, None, "Spain", "subnational"),
-    (118, "Belarus", "Europe & Mediterranean", "BY", "BLR", 112, "Belarus", "country"),
-    (119, "Belgium", "Europe & Mediterranean", "BE", "BEL", 56, "Belgium", "country"),
-    (
+    _DestRow(
+        113, "Aland Islands", "Europe & Mediterranean", "AX", "ALA", 248, "Finland", "subnational"
+    ),
+    _DestRow(114, "Albania", "Europe & Mediterranean", "AL", "ALB", 8, "Albania", "country"),
+    _DestRow(115, "Andorra", "Europe & Mediterranean", "AD", "AND", 20, "Andorra", "country"),
+    _DestRow(116, "Austria", "Europe & Mediterranean", "AT", "AUT", 40, "Austria", "country"),
+    _DestRow(
+        117, "Balearic Islands", "Europe & Mediterranean", None, None, None, "Spain", "subnational"
+    ),
+    _DestRow(118, "Belarus", "Europe & Mediterranean", "BY", "BLR", 112, "Belarus", "country"),
+    _DestRow(119, "Belgium", "Europe & Mediterranean", "BE", "BEL", 56, "Belgium", "country"),
+    _DestRow(
         120,
         "Bosnia & Herzegovina",
         "Europe & Mediterranean",
@@ -209,11 +261,11 @@ DESTINATIONS: list[_DestRow] = [
         "Bosnia and Herzegovina",
         "country",
     ),
-    (121, "Bulgaria", "Europe & Mediterranean", "BG", "BGR", 100, "Bulgaria", "country"),
-    (122, "Corsica", "Europe & Mediterranean", None, None, None, "France", "subnational"),
-    (123, "Crete", "Europe & Mediterranean", None, None, None, "Greece", "subnational"),
-    (124, "Croatia", "Europe & Mediterranean", "HR", "HRV", 191, "Croatia", "country"),
-    (
+    _DestRow(121, "Bulgaria", "Europe & Mediterranean", "BG", "BGR", 100, "Bulgaria", "country"),
+    _DestRow(122, "Corsica", "Europe & Mediterranean", None, None, None, "France", "subnational"),
+    _DestRow(123, "Crete", "Europe & Mediterranean", None, None, None, "Greece", "subnational"),
+    _DestRow(124, "Croatia", "Europe & Mediterranean", "HR", "HRV", 191, "Croatia", "country"),
+    _DestRow(
         125,
         "Cyprus British Sovereign Base Areas",
         "Europe & Mediterranean",
@@ -223,8 +275,10 @@ DESTINATIONS: list[_DestRow] = [
         "United Kingdom",
         "territory",
     ),
-    (126, "Cyprus Republic", "Europe & Mediterranean", "CY", "CYP", 196, "Cyprus", "country"),
-    (
+    _DestRow(
+        126, "Cyprus Republic", "Europe & Mediterranean", "CY", "CYP", 196, "Cyprus", "country"
+    ),
+    _DestRow(
         127,
         "Cyprus Turkish Fed. State",
         "Europe & Mediterranean",
@@ -234,7 +288,7 @@ DESTINATIONS: list[_DestRow] = [
         "Cyprus",
         "disputed",
     ),
-    (
+    _DestRow(
         128,
         "Czech Republic",
         "Europe & Mediterranean",
@@ -244,15 +298,19 @@ DESTINATIONS: list[_DestRow] = [
         "Czech Republic",
         "country",
     ),
-    (129, "Denmark", "Europe & Mediterranean", "DK", "DNK", 208, "Denmark", "country"),
-    (130, "England", "Europe & Mediterranean", None, None, None, "United Kingdom", "subnational"),
-    (131, "Estonia", "Europe & Mediterranean", "EE", "EST", 233, "Estonia", "country"),
-    (132, "Finland", "Europe & Mediterranean", "FI", "FIN", 246, "Finland", "country"),
-    (133, "France", "Europe & Mediterranean", "FR", "FRA", 250, "France", "country"),
-    (134, "Germany", "Europe & Mediterranean", "DE", "DEU", 276, "Germany", "country"),
-    (135, "Gibraltar", "Europe & Mediterranean", "GI", "GIB", 292, "United Kingdom", "territory"),
-    (136, "Greece", "Europe & Mediterranean", "GR", "GRC", 300, "Greece", "country"),
-    (
+    _DestRow(129, "Denmark", "Europe & Mediterranean", "DK", "DNK", 208, "Denmark", "country"),
+    _DestRow(
+        130, "England", "Europe & Mediterranean", None, None, None, "United Kingdom", "subnational"
+    ),
+    _DestRow(131, "Estonia", "Europe & Mediterranean", "EE", "EST", 233, "Estonia", "country"),
+    _DestRow(132, "Finland", "Europe & Mediterranean", "FI", "FIN", 246, "Finland", "country"),
+    _DestRow(133, "France", "Europe & Mediterranean", "FR", "FRA", 250, "France", "country"),
+    _DestRow(134, "Germany", "Europe & Mediterranean", "DE", "DEU", 276, "Germany", "country"),
+    _DestRow(
+        135, "Gibraltar", "Europe & Mediterranean", "GI", "GIB", 292, "United Kingdom", "territory"
+    ),
+    _DestRow(136, "Greece", "Europe & Mediterranean", "GR", "GRC", 300, "Greece", "country"),
+    _DestRow(
         137,
         "Greek Aegean Islands",
         "Europe & Mediterranean",
@@ -262,7 +320,7 @@ DESTINATIONS: list[_DestRow] = [
         "Greece",
         "subnational",
     ),
-    (
+    _DestRow(
         138,
         "Guernsey & Dependencies",
         "Europe & Mediterranean",
@@ -272,10 +330,12 @@ DESTINATIONS: list[_DestRow] = [
         "United Kingdom",
         "territory",
     ),
-    (139, "Hungary", "Europe & Mediterranean", "HU", "HUN", 348, "Hungary", "country"),
-    (140, "Ionian Islands", "Europe & Mediterranean", None, None, None, "Greece", "subnational"),
-    (141, "Ireland", "Europe & Mediterranean", "IE", "IRL", 372, "Ireland", "country"),
-    (
+    _DestRow(139, "Hungary", "Europe & Mediterranean", "HU", "HUN", 348, "Hungary", "country"),
+    _DestRow(
+        140, "Ionian Islands", "Europe & Mediterranean", None, None, None, "Greece", "subnational"
+    ),
+    _DestRow(141, "Ireland", "Europe & Mediterranean", "IE", "IRL", 372, "Ireland", "country"),
+    _DestRow(
         142,
         "Ireland Northern",
         "Europe & Mediterranean",
@@ -285,22 +345,43 @@ DESTINATIONS: list[_DestRow] = [
         "United Kingdom",
         "subnational",
     ),
-    (143, "Isle of Man", "Europe & Mediterranean", "IM", "IMN", 833, "United Kingdom", "territory"),
-    (144, "Italy", "Europe & Mediterranean", "IT", "ITA", 380, "Italy", "country"),
-    (145, "Jersey", "Europe & Mediterranean", "JE", "JEY", 832, "United Kingdom", "territory"),
-    (146, "Kaliningrad", "Europe & Mediterranean", None, None, None, "Russia", "subnational"),
-    (147, "Kosovo", "Europe & Mediterranean", "XK", "XKX", None, "Kosovo", "disputed"),
-    (148, "Lampedusa", "Europe & Mediterranean", None, None, None, "Italy", "territory"),
-    (149, "Latvia", "Europe & Mediterranean", "LV", "LVA", 428, "Latvia", "country"),
-    (150, "Liechtenstein", "Europe & Mediterranean", "LI", "LIE", 438, "Liechtenstein", "country"),
-    (151, "Lithuania", "Europe & Mediterranean", "LT", "LTU", 440, "Lithuania", "country"),
-    (152, "Luxembourg", "Europe & Mediterranean", "LU", "LUX", 442, "Luxembourg", "country"),
-    (153, "Malta", "Europe & Mediterranean", "MT", "MLT", 470, "Malta", "country"),
-    (154, "Moldova", "Europe & Mediterranean", "MD", "MDA", 498, "Moldova", "country"),
-    (155, "Monaco", "Europe & Mediterranean", "MC", "MCO", 492, "Monaco", "country"),
-    (156, "Montenegro", "Europe & Mediterranean", "ME", "MNE", 499, "Montenegro", "country"),
-    (157, "Netherlands", "Europe & Mediterranean", "NL", "NLD", 528, "Netherlands", "country"),
-    (
+    _DestRow(
+        143,
+        "Isle of Man",
+        "Europe & Mediterranean",
+        "IM",
+        "IMN",
+        833,
+        "United Kingdom",
+        "territory",
+    ),
+    _DestRow(144, "Italy", "Europe & Mediterranean", "IT", "ITA", 380, "Italy", "country"),
+    _DestRow(
+        145, "Jersey", "Europe & Mediterranean", "JE", "JEY", 832, "United Kingdom", "territory"
+    ),
+    _DestRow(
+        146, "Kaliningrad", "Europe & Mediterranean", None, None, None, "Russia", "subnational"
+    ),
+    _DestRow(147, "Kosovo", "Europe & Mediterranean", "XK", "XKX", None, "Kosovo", "disputed"),
+    _DestRow(148, "Lampedusa", "Europe & Mediterranean", None, None, None, "Italy", "territory"),
+    _DestRow(149, "Latvia", "Europe & Mediterranean", "LV", "LVA", 428, "Latvia", "country"),
+    _DestRow(
+        150, "Liechtenstein", "Europe & Mediterranean", "LI", "LIE", 438, "Liechtenstein", "country"
+    ),
+    _DestRow(151, "Lithuania", "Europe & Mediterranean", "LT", "LTU", 440, "Lithuania", "country"),
+    _DestRow(
+        152, "Luxembourg", "Europe & Mediterranean", "LU", "LUX", 442, "Luxembourg", "country"
+    ),
+    _DestRow(153, "Malta", "Europe & Mediterranean", "MT", "MLT", 470, "Malta", "country"),
+    _DestRow(154, "Moldova", "Europe & Mediterranean", "MD", "MDA", 498, "Moldova", "country"),
+    _DestRow(155, "Monaco", "Europe & Mediterranean", "MC", "MCO", 492, "Monaco", "country"),
+    _DestRow(
+        156, "Montenegro", "Europe & Mediterranean", "ME", "MNE", 499, "Montenegro", "country"
+    ),
+    _DestRow(
+        157, "Netherlands", "Europe & Mediterranean", "NL", "NLD", 528, "Netherlands", "country"
+    ),
+    _DestRow(
         158,
         "North Macedonia",
         "Europe & Mediterranean",
@@ -310,21 +391,25 @@ DESTINATIONS: list[_DestRow] = [
         "North Macedonia",
         "country",
     ),
-    (159, "Norway", "Europe & Mediterranean", "NO", "NOR", 578, "Norway", "country"),
-    (160, "Poland", "Europe & Mediterranean", "PL", "POL", 616, "Poland", "country"),
-    (161, "Portugal", "Europe & Mediterranean", "PT", "PRT", 620, "Portugal", "country"),
-    (162, "Romania", "Europe & Mediterranean", "RO", "ROU", 642, "Romania", "country"),
-    (163, "Russia", "Europe & Mediterranean", "RU", "RUS", 643, "Russia", "country"),
-    (164, "San Marino", "Europe & Mediterranean", "SM", "SMR", 674, "San Marino", "country"),
-    (165, "Sardinia", "Europe & Mediterranean", None, None, None, "Italy", "subnational"),
-    (166, "Scotland", "Europe & Mediterranean", None, None, None, "United Kingdom", "subnational"),
-    (167, "Serbia", "Europe & Mediterranean", "RS", "SRB", 688, "Serbia", "country"),
-    (168, "Sicily", "Europe & Mediterranean", None, None, None, "Italy", "subnational"),
-    (169, "Slovakia", "Europe & Mediterranean", "SK", "SVK", 703, "Slovakia", "country"),
-    (170, "Slovenia", "Europe & Mediterranean", "SI", "SVN", 705, "Slovenia", "country"),
-    (171, "Spain", "Europe & Mediterranean", "ES", "ESP", 724, "Spain", "country"),
-    (172, "Spitsbergen", "Europe & Mediterranean", None, "SJM", 744, "Norway", "territory"),
-    (
+    _DestRow(159, "Norway", "Europe & Mediterranean", "NO", "NOR", 578, "Norway", "country"),
+    _DestRow(160, "Poland", "Europe & Mediterranean", "PL", "POL", 616, "Poland", "country"),
+    _DestRow(161, "Portugal", "Europe & Mediterranean", "PT", "PRT", 620, "Portugal", "country"),
+    _DestRow(162, "Romania", "Europe & Mediterranean", "RO", "ROU", 642, "Romania", "country"),
+    _DestRow(163, "Russia", "Europe & Mediterranean", "RU", "RUS", 643, "Russia", "country"),
+    _DestRow(
+        164, "San Marino", "Europe & Mediterranean", "SM", "SMR", 674, "San Marino", "country"
+    ),
+    _DestRow(165, "Sardinia", "Europe & Mediterranean", None, None, None, "Italy", "subnational"),
+    _DestRow(
+        166, "Scotland", "Europe & Mediterranean", None, None, None, "United Kingdom", "subnational"
+    ),
+    _DestRow(167, "Serbia", "Europe & Mediterranean", "RS", "SRB", 688, "Serbia", "country"),
+    _DestRow(168, "Sicily", "Europe & Mediterranean", None, None, None, "Italy", "subnational"),
+    _DestRow(169, "Slovakia", "Europe & Mediterranean", "SK", "SVK", 703, "Slovakia", "country"),
+    _DestRow(170, "Slovenia", "Europe & Mediterranean", "SI", "SVN", 705, "Slovenia", "country"),
+    _DestRow(171, "Spain", "Europe & Mediterranean", "ES", "ESP", 724, "Spain", "country"),
+    _DestRow(172, "Spitsbergen", "Europe & Mediterranean", None, "SJM", 744, "Norway", "territory"),
+    _DestRow(
         173,
         "Srpska",
         "Europe & Mediterranean",
@@ -334,16 +419,26 @@ DESTINATIONS: list[_DestRow] = [
         "Bosnia and Herzegovina",
         "subnational",
     ),
-    (174, "Sweden", "Europe & Mediterranean", "SE", "SWE", 752, "Sweden", "country"),
-    (175, "Switzerland", "Europe & Mediterranean", "CH", "CHE", 756, "Switzerland", "country"),
-    (176, "Transnistria", "Europe & Mediterranean", None, None, None, "Moldova", "disputed"),
-    (177, "Turkey in Europe", "Europe & Mediterranean", None, None, None, "Turkey", "subnational"),
-    (178, "Ukraine", "Europe & Mediterranean", "UA", "UKR", 804, "Ukraine", "country"),
-    (179, "Vatican City", "Europe & Mediterranean", "VA", "VAT", 336, "Vatican City", "country"),
-    (180, "Wales", "Europe & Mediterranean", None, None, None, "United Kingdom", "subnational"),
+    _DestRow(174, "Sweden", "Europe & Mediterranean", "SE", "SWE", 752, "Sweden", "country"),
+    _DestRow(
+        175, "Switzerland", "Europe & Mediterranean", "CH", "CHE", 756, "Switzerland", "country"
+    ),
+    _DestRow(
+        176, "Transnistria", "Europe & Mediterranean", None, None, None, "Moldova", "disputed"
+    ),
+    _DestRow(
+        177, "Turkey in Europe", "Europe & Mediterranean", None, None, None, "Turkey", "subnational"
+    ),
+    _DestRow(178, "Ukraine", "Europe & Mediterranean", "UA", "UKR", 804, "Ukraine", "country"),
+    _DestRow(
+        179, "Vatican City", "Europe & Mediterranean", "VA", "VAT", 336, "Vatican City", "country"
+    ),
+    _DestRow(
+        180, "Wales", "Europe & Mediterranean", None, None, None, "United Kingdom", "subnational"
+    ),
     # === ANTARCTICA (181-187) ===
-    (181, "Argentine Antarctica", "Antarctica", None, None, None, "Argentina", "antarctic"),
-    (
+    _DestRow(181, "Argentine Antarctica", "Antarctica", None, None, None, "Argentina", "antarctic"),
+    _DestRow(
         182,
         "Australian Antarctic Territory",
         "Antarctica",
@@ -353,7 +448,7 @@ DESTINATIONS: list[_DestRow] = [
         "Australia",
         "antarctic",
     ),
-    (
+    _DestRow(
         183,
         "British Antarctic Territory",
         "Antarctica",
@@ -363,20 +458,24 @@ DESTINATIONS: list[_DestRow] = [
         "United Kingdom",
         "antarctic",
     ),
-    (184, "Chilean Antarctic Territory", "Antarctica", None, None, None, "Chile", "antarctic"),
-    (185, "French Antarctica", "Antarctica", None, None, None, "France", "antarctic"),
-    (186, "New Zealand Antarctica", "Antarctica", None, None, None, "New Zealand", "antarctic"),
-    (187, "Norwegian Dependencies", "Antarctica", None, None, None, "Norway", "antarctic"),
+    _DestRow(
+        184, "Chilean Antarctic Territory", "Antarctica", None, None, None, "Chile", "antarctic"
+    ),
+    _DestRow(185, "French Antarctica", "Antarctica", None, None, None, "France", "antarctic"),
+    _DestRow(
+        186, "New Zealand Antarctica", "Antarctica", None, None, None, "New Zealand", "antarctic"
+    ),
+    _DestRow(187, "Norwegian Dependencies", "Antarctica", None, None, None, "Norway", "antarctic"),
     # === AFRICA (188-242) ===
-    (188, "Algeria", "Africa", "DZ", "DZA", 12, "Algeria", "country"),
-    (189, "Angola", "Africa", "AO", "AGO", 24, "Angola", "country"),
-    (190, "Benin", "Africa", "BJ", "BEN", 204, "Benin", "country"),
-    (191, "Botswana", "Africa", "BW", "BWA", 72, "Botswana", "country"),
-    (192, "Burkina Faso", "Africa", "BF", "BFA", 854, "Burkina Faso", "country"),
-    (193, "Burundi", "Africa", "BI", "BDI", 108, "Burundi", "country"),
-    (194, "Cabinda", "Africa", None, None, None, "Angola", "subnational"),
-    (195, "Cameroon", "Africa", "CM", "CMR", 120, "Cameroon", "country"),
-    (
+    _DestRow(188, "Algeria", "Africa", "DZ", "DZA", 12, "Algeria", "country"),
+    _DestRow(189, "Angola", "Africa", "AO", "AGO", 24, "Angola", "country"),
+    _DestRow(190, "Benin", "Africa", "BJ", "BEN", 204, "Benin", "country"),
+    _DestRow(191, "Botswana", "Africa", "BW", "BWA", 72, "Botswana", "country"),
+    _DestRow(192, "Burkina Faso", "Africa", "BF", "BFA", 854, "Burkina Faso", "country"),
+    _DestRow(193, "Burundi", "Africa", "BI", "BDI", 108, "Burundi", "country"),
+    _DestRow(194, "Cabinda", "Africa", None, None, None, "Angola", "subnational"),
+    _DestRow(195, "Cameroon", "Africa", "CM", "CMR", 120, "Cameroon", "country"),
+    _DestRow(
         196,
         "Central African Republic",
         "Africa",
@@ -386,8 +485,8 @@ DESTINATIONS: list[_DestRow] = [
         "Central African Republic",
         "country",
     ),
-    (197, "Chad", "Africa", "TD", "TCD", 148, "Chad", "country"),
-    (
+    _DestRow(197, "Chad", "Africa", "TD", "TCD", 148, "Chad", "country"),
+    _DestRow(
         198,
         "Congo Democratic Republic",
         "Africa",
@@ -397,11 +496,13 @@ DESTINATIONS: list[_DestRow] = [
         "Democratic Republic of the Congo",
         "country",
     ),
-    (199, "Congo Republic", "Africa", "CG", "COG", 178, "Republic of the Congo", "country"),
-    (200, "C\u00f4te d'Ivoire", "Africa", "CI", "CIV", 384, "C\u00f4te d'Ivoire", "country"),
-    (201, "Djibouti", "Africa", "DJ", "DJI", 262, "Djibouti", "country"),
-    (202, "Egypt in Africa", "Africa", "EG", "EGY", 818, "Egypt", "country"),
-    (
+    _DestRow(199, "Congo Republic", "Africa", "CG", "COG", 178, "Republic of the Congo", "country"),
+    _DestRow(
+        200, "C\u00f4te d'Ivoire", "Africa", "CI", "CIV", 384, "C\u00f4te d'Ivoire", "country"
+    ),
+    _DestRow(201, "Djibouti", "Africa", "DJ", "DJI", 262, "Djibouti", "country"),
+    _DestRow(202, "Egypt in Africa", "Africa", "EG", "EGY", 818, "Egypt", "country"),
+    _DestRow(
         203,
         "Equatorial Guinea Bioko",
         "Africa",
@@ -411,7 +512,7 @@ DESTINATIONS: list[_DestRow] = [
         "Equatorial Guinea",
         "subnational",
     ),
-    (
+    _DestRow(
         204,
         "Equatorial Guinea Rio Muni",
         "Africa",
@@ -421,69 +522,97 @@ DESTINATIONS: list[_DestRow] = [
         "Equatorial Guinea",
         "subnational",
     ),
-    (205, "Eritrea", "Africa", "ER", "ERI", 232, "Eritrea", "country"),
-    (206, "Eswatini", "Africa", "SZ", "SWZ", 748, "Eswatini", "country"),
-    (207, "Ethiopia", "Africa", "ET", "ETH", 231, "Ethiopia", "country"),
-    (208, "Gabon", "Africa", "GA", "GAB", 266, "Gabon", "country"),
-    (209, "Gambia", "Africa", "GM", "GMB", 270, "Gambia", "country"),
-    (210, "Ghana", "Africa", "GH", "GHA", 288, "Ghana", "country"),
-    (211, "Guinea", "Africa", "GN", "GIN", 324, "Guinea", "country"),
-    (212, "Guinea-Bissau", "Africa", "GW", "GNB", 624, "Guinea-Bissau", "country"),
-    (213, "Kenya", "Africa", "KE", "KEN", 404, "Kenya", "country"),
-    (214, "Lesotho", "Africa", "LS", "LSO", 426, "Lesotho", "country"),
-    (215, "Liberia", "Africa", "LR", "LBR", 430, "Liberia", "country"),
-    (216, "Libya", "Africa", "LY", "LBY", 434, "Libya", "country"),
-    (217, "Malawi", "Africa", "MW", "MWI", 454, "Malawi", "country"),
-    (218, "Mali", "Africa", "ML", "MLI", 466, "Mali", "country"),
-    (219, "Mauritania", "Africa", "MR", "MRT", 478, "Mauritania", "country"),
-    (220, "Morocco", "Africa", "MA", "MAR", 504, "Morocco", "country"),
-    (221, "Morocco Spanish", "Africa", None, None, None, "Spain", "territory"),
-    (222, "Mozambique", "Africa", "MZ", "MOZ", 508, "Mozambique", "country"),
-    (223, "Namibia", "Africa", "NA", "NAM", 516, "Namibia", "country"),
-    (224, "Niger", "Africa", "NE", "NER", 562, "Niger", "country"),
-    (225, "Nigeria", "Africa", "NG", "NGA", 566, "Nigeria", "country"),
-    (226, "Rwanda", "Africa", "RW", "RWA", 646, "Rwanda", "country"),
-    (227, "Sao Tome & Principe", "Africa", "ST", "STP", 678, "Sao Tome and Principe", "country"),
-    (228, "Senegal", "Africa", "SN", "SEN", 686, "Senegal", "country"),
-    (229, "Sierra Leone", "Africa", "SL", "SLE", 694, "Sierra Leone", "country"),
-    (230, "Somalia", "Africa", "SO", "SOM", 706, "Somalia", "country"),
-    (231, "Somaliland", "Africa", None, None, None, "Somalia", "disputed"),
-    (232, "South Africa", "Africa", "ZA", "ZAF", 710, "South Africa", "country"),
-    (233, "South Sudan", "Africa", "SS", "SSD", 728, "South Sudan", "country"),
-    (234, "Sudan", "Africa", "SD", "SDN", 729, "Sudan", "country"),
-    (235, "Tanzania", "Africa", "TZ", "TZA", 834, "Tanzania", "country"),
-    (236, "Togo", "Africa", "TG", "TGO", 768, "Togo", "country"),
-    (237, "Tunisia", "Africa", "TN", "TUN", 788, "Tunisia", "country"),
-    (238, "Uganda", "Africa", "UG", "UGA", 800, "Uganda", "country"),
-    (239, "Western Sahara", "Africa", "EH", "ESH", 732, "Western Sahara", "disputed"),
-    (240, "Zambia", "Africa", "ZM", "ZMB", 894, "Zambia", "country"),
-    (241, "Zanzibar", "Africa", None, None, None, "Tanzania", "subnational"),
-    (242, "Zimbabwe", "Africa", "ZW", "ZWE", 716, "Zimbabwe", "country"),
+    _DestRow(205, "Eritrea", "Africa", "ER", "ERI", 232, "Eritrea", "country"),
+    _DestRow(206, "Eswatini", "Africa", "SZ", "SWZ", 748, "Eswatini", "country"),
+    _DestRow(207, "Ethiopia", "Africa", "ET", "ETH", 231, "Ethiopia", "country"),
+    _DestRow(208, "Gabon", "Africa", "GA", "GAB", 266, "Gabon", "country"),
+    _DestRow(209, "Gambia", "Africa", "GM", "GMB", 270, "Gambia", "country"),
+    _DestRow(210, "Ghana", "Africa", "GH", "GHA", 288, "Ghana", "country"),
+    _DestRow(211, "Guinea", "Africa", "GN", "GIN", 324, "Guinea", "country"),
+    _DestRow(212, "Guinea-Bissau", "Africa", "GW", "GNB", 624, "Guinea-Bissau", "country"),
+    _DestRow(213, "Kenya", "Africa", "KE", "KEN", 404, "Kenya", "country"),
+    _DestRow(214, "Lesotho", "Africa", "LS", "LSO", 426, "Lesotho", "country"),
+    _DestRow(215, "Liberia", "Africa", "LR", "LBR", 430, "Liberia", "country"),
+    _DestRow(216, "Libya", "Africa", "LY", "LBY", 434, "Libya", "country"),
+    _DestRow(217, "Malawi", "Africa", "MW", "MWI", 454, "Malawi", "country"),
+    _DestRow(218, "Mali", "Africa", "ML", "MLI", 466, "Mali", "country"),
+    _DestRow(219, "Mauritania", "Africa", "MR", "MRT", 478, "Mauritania", "country"),
+    _DestRow(220, "Morocco", "Africa", "MA", "MAR", 504, "Morocco", "country"),
+    _DestRow(221, "Morocco Spanish", "Africa", None, None, None, "Spain", "territory"),
+    _DestRow(222, "Mozambique", "Africa", "MZ", "MOZ", 508, "Mozambique", "country"),
+    _DestRow(223, "Namibia", "Africa", "NA", "NAM", 516, "Namibia", "country"),
+    _DestRow(224, "Niger", "Africa", "NE", "NER", 562, "Niger", "country"),
+    _DestRow(225, "Nigeria", "Africa", "NG", "NGA", 566, "Nigeria", "country"),
+    _DestRow(226, "Rwanda", "Africa", "RW", "RWA", 646, "Rwanda", "country"),
+    _DestRow(
+        227, "Sao Tome & Principe", "Africa", "ST", "STP", 678, "Sao Tome and Principe", "country"
+    ),
+    _DestRow(228, "Senegal", "Africa", "SN", "SEN", 686, "Senegal", "country"),
+    _DestRow(229, "Sierra Leone", "Africa", "SL", "SLE", 694, "Sierra Leone", "country"),
+    _DestRow(230, "Somalia", "Africa", "SO", "SOM", 706, "Somalia", "country"),
+    _DestRow(231, "Somaliland", "Africa", None, None, None, "Somalia", "disputed"),
+    _DestRow(232, "South Africa", "Africa", "ZA", "ZAF", 710, "South Africa", "country"),
+    _DestRow(233, "South Sudan", "Africa", "SS", "SSD", 728, "South Sudan", "country"),
+    _DestRow(234, "Sudan", "Africa", "SD", "SDN", 729, "Sudan", "country"),
+    _DestRow(235, "Tanzania", "Africa", "TZ", "TZA", 834, "Tanzania", "country"),
+    _DestRow(236, "Togo", "Africa", "TG", "TGO", 768, "Togo", "country"),
+    _DestRow(237, "Tunisia", "Africa", "TN", "TUN", 788, "Tunisia", "country"),
+    _DestRow(238, "Uganda", "Africa", "UG", "UGA", 800, "Uganda", "country"),
+    _DestRow(239, "Western Sahara", "Africa", "EH", "ESH", 732, "Western Sahara", "disputed"),
+    _DestRow(240, "Zambia", "Africa", "ZM", "ZMB", 894, "Zambia", "country"),
+    _DestRow(241, "Zanzibar", "Africa", None, None, None, "Tanzania", "subnational"),
+    _DestRow(242, "Zimbabwe", "Africa", "ZW", "ZWE", 716, "Zimbabwe", "country"),
     # === MIDDLE EAST (243-263) ===
-    (243, "Abu Dhabi", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (244, "Ajman", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (245, "Bahrain", "Middle East", "BH", "BHR", 48, "Bahrain", "country"),
-    (246, "Dubai", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (247, "Egypt in Asia", "Middle East", None, None, None, "Egypt", "subnational"),
-    (248, "Fujairah", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (249, "Iran", "Middle East", "IR", "IRN", 364, "Iran", "country"),
-    (250, "Iraq", "Middle East", "IQ", "IRQ", 368, "Iraq", "country"),
-    (251, "Israel", "Middle East", "IL", "ISR", 376, "Israel", "country"),
-    (252, "Jordan", "Middle East", "JO", "JOR", 400, "Jordan", "country"),
-    (253, "Kuwait", "Middle East", "KW", "KWT", 414, "Kuwait", "country"),
-    (254, "Lebanon", "Middle East", "LB", "LBN", 422, "Lebanon", "country"),
-    (255, "Oman", "Middle East", "OM", "OMN", 512, "Oman", "country"),
-    (256, "Palestine", "Middle East", "PS", "PSE", 275, "Palestine", "disputed"),
-    (257, "Qatar", "Middle East", "QA", "QAT", 634, "Qatar", "country"),
-    (258, "Ras Al Khaimah", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (259, "Saudi Arabia", "Middle East", "SA", "SAU", 682, "Saudi Arabia", "country"),
-    (260, "Sharjah", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (261, "Syria", "Middle East", "SY", "SYR", 760, "Syria", "country"),
-    (262, "Umm Al Qaiwain", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
-    (263, "Yemen", "Middle East", "YE", "YEM", 887, "Yemen", "country"),
+    _DestRow(
+        243, "Abu Dhabi", "Middle East", None, None, None, "United Arab Emirates", "subnational"
+    ),
+    _DestRow(244, "Ajman", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
+    _DestRow(245, "Bahrain", "Middle East", "BH", "BHR", 48, "Bahrain", "country"),
+    _DestRow(246, "Dubai", "Middle East", None, None, None, "United Arab Emirates", "subnational"),
+    _DestRow(247, "Egypt in Asia", "Middle East", None, None, None, "Egypt", "subnational"),
+    _DestRow(
+        248, "Fujairah", "Middle East", None, None, None, "United Arab Emirates", "subnational"
+    ),
+    _DestRow(249, "Iran", "Middle East", "IR", "IRN", 364, "Iran", "country"),
+    _DestRow(250, "Iraq", "Middle East", "IQ", "IRQ", 368, "Iraq", "country"),
+    _DestRow(251, "Israel", "Middle East", "IL", "ISR", 376, "Israel", "country"),
+    _DestRow(252, "Jordan", "Middle East", "JO", "JOR", 400, "Jordan", "country"),
+    _DestRow(253, "Kuwait", "Middle East", "KW", "KWT", 414, "Kuwait", "country"),
+    _DestRow(254, "Lebanon", "Middle East", "LB", "LBN", 422, "Lebanon", "country"),
+    _DestRow(255, "Oman", "Middle East", "OM", "OMN", 512, "Oman", "country"),
+    _DestRow(256, "Palestine", "Middle East", "PS", "PSE", 275, "Palestine", "disputed"),
+    _DestRow(257, "Qatar", "Middle East", "QA", "QAT", 634, "Qatar", "country"),
+    _DestRow(
+        258,
+        "Ras Al Khaimah",
+        "Middle East",
+        None,
+        None,
+        None,
+        "United Arab Emirates",
+        "subnational",
+    ),
+    _DestRow(259, "Saudi Arabia", "Middle East", "SA", "SAU", 682, "Saudi Arabia", "country"),
+    _DestRow(
+        260, "Sharjah", "Middle East", None, None, None, "United Arab Emirates", "subnational"
+    ),
+    _DestRow(261, "Syria", "Middle East", "SY", "SYR", 760, "Syria", "country"),
+    _DestRow(
+        262,
+        "Umm Al Qaiwain",
+        "Middle East",
+        None,
+        None,
+        None,
+        "United Arab Emirates",
+        "subnational",
+    ),
+    _DestRow(263, "Yemen", "Middle East", "YE", "YEM", 887, "Yemen", "country"),
     # === INDIAN OCEAN (264-278) ===
-    (264, "Andaman-Nicobar Islands", "Indian Ocean", None, None, None, "India", "subnational"),
-    (
+    _DestRow(
+        264, "Andaman-Nicobar Islands", "Indian Ocean", None, None, None, "India", "subnational"
+    ),
+    _DestRow(
         265,
         "British Indian Ocean Territory",
         "Indian Ocean",
@@ -493,73 +622,77 @@ DESTINATIONS: list[_DestRow] = [
         "United Kingdom",
         "territory",
     ),
-    (266, "Christmas Island", "Indian Ocean", "CX", "CXR", 162, "Australia", "territory"),
-    (267, "Cocos Islands", "Indian Ocean", "CC", "CCK", 166, "Australia", "territory"),
-    (268, "Comoros", "Indian Ocean", "KM", "COM", 174, "Comoros", "country"),
-    (269, "Lakshadweep", "Indian Ocean", None, None, None, "India", "subnational"),
-    (270, "Madagascar", "Indian Ocean", "MG", "MDG", 450, "Madagascar", "country"),
-    (271, "Maldives", "Indian Ocean", "MV", "MDV", 462, "Maldives", "country"),
-    (272, "Mauritius & Dependencies", "Indian Ocean", "MU", "MUS", 480, "Mauritius", "country"),
-    (273, "Mayotte", "Indian Ocean", "YT", "MYT", 175, "France", "territory"),
-    (274, "Reunion", "Indian Ocean", "RE", "REU", 638, "France", "territory"),
-    (275, "Rodrigues Island", "Indian Ocean", None, None, None, "Mauritius", "territory"),
-    (276, "Seychelles", "Indian Ocean", "SC", "SYC", 690, "Seychelles", "country"),
-    (277, "Socotra", "Indian Ocean", None, None, None, "Yemen", "territory"),
-    (278, "Zil Elwannyen Sesel", "Indian Ocean", None, None, None, "Seychelles", "territory"),
+    _DestRow(266, "Christmas Island", "Indian Ocean", "CX", "CXR", 162, "Australia", "territory"),
+    _DestRow(267, "Cocos Islands", "Indian Ocean", "CC", "CCK", 166, "Australia", "territory"),
+    _DestRow(268, "Comoros", "Indian Ocean", "KM", "COM", 174, "Comoros", "country"),
+    _DestRow(269, "Lakshadweep", "Indian Ocean", None, None, None, "India", "subnational"),
+    _DestRow(270, "Madagascar", "Indian Ocean", "MG", "MDG", 450, "Madagascar", "country"),
+    _DestRow(271, "Maldives", "Indian Ocean", "MV", "MDV", 462, "Maldives", "country"),
+    _DestRow(
+        272, "Mauritius & Dependencies", "Indian Ocean", "MU", "MUS", 480, "Mauritius", "country"
+    ),
+    _DestRow(273, "Mayotte", "Indian Ocean", "YT", "MYT", 175, "France", "territory"),
+    _DestRow(274, "Reunion", "Indian Ocean", "RE", "REU", 638, "France", "territory"),
+    _DestRow(275, "Rodrigues Island", "Indian Ocean", None, None, None, "Mauritius", "territory"),
+    _DestRow(276, "Seychelles", "Indian Ocean", "SC", "SYC", 690, "Seychelles", "country"),
+    _DestRow(277, "Socotra", "Indian Ocean", None, None, None, "Yemen", "territory"),
+    _DestRow(
+        278, "Zil Elwannyen Sesel", "Indian Ocean", None, None, None, "Seychelles", "territory"
+    ),
     # === ASIA (279-330) ===
-    (279, "Abkhazia", "Asia", None, None, None, "Georgia", "disputed"),
-    (280, "Afghanistan", "Asia", "AF", "AFG", 4, "Afghanistan", "country"),
-    (281, "Armenia", "Asia", "AM", "ARM", 51, "Armenia", "country"),
-    (282, "Azerbaijan", "Asia", "AZ", "AZE", 31, "Azerbaijan", "country"),
-    (283, "Bangladesh", "Asia", "BD", "BGD", 50, "Bangladesh", "country"),
-    (284, "Bhutan", "Asia", "BT", "BTN", 64, "Bhutan", "country"),
-    (285, "Brunei", "Asia", "BN", "BRN", 96, "Brunei", "country"),
-    (286, "Cambodia", "Asia", "KH", "KHM", 116, "Cambodia", "country"),
-    (287, "China People's Republic", "Asia", "CN", "CHN", 156, "China", "country"),
-    (288, "Georgia", "Asia", "GE", "GEO", 268, "Georgia", "country"),
-    (289, "Hainan Island", "Asia", None, None, None, "China", "subnational"),
-    (290, "Hong Kong", "Asia", "HK", "HKG", 344, "China", "territory"),
-    (291, "India", "Asia", "IN", "IND", 356, "India", "country"),
-    (292, "Indonesia Java", "Asia", None, None, None, "Indonesia", "subnational"),
-    (293, "Japan", "Asia", "JP", "JPN", 392, "Japan", "country"),
-    (294, "Jeju Island", "Asia", None, None, None, "South Korea", "subnational"),
-    (295, "Kalimantan", "Asia", None, None, None, "Indonesia", "subnational"),
-    (296, "Kashmir", "Asia", None, None, None, "Disputed", "disputed"),
-    (297, "Kazakhstan", "Asia", "KZ", "KAZ", 398, "Kazakhstan", "country"),
-    (298, "Korea North", "Asia", "KP", "PRK", 408, "North Korea", "country"),
-    (299, "Korea South", "Asia", "KR", "KOR", 410, "South Korea", "country"),
-    (300, "Kyrgyzstan", "Asia", "KG", "KGZ", 417, "Kyrgyzstan", "country"),
-    (301, "Laos", "Asia", "LA", "LAO", 418, "Laos", "country"),
-    (302, "Lesser Sunda Islands", "Asia", None, None, None, "Indonesia", "subnational"),
-    (303, "Macau", "Asia", "MO", "MAC", 446, "China", "territory"),
-    (304, "Malaysia", "Asia", "MY", "MYS", 458, "Malaysia", "country"),
-    (305, "Maluku Islands", "Asia", None, None, None, "Indonesia", "subnational"),
-    (306, "Mongolia", "Asia", "MN", "MNG", 496, "Mongolia", "country"),
-    (307, "Myanmar", "Asia", "MM", "MMR", 104, "Myanmar", "country"),
-    (308, "Nakhchivan", "Asia", None, None, None, "Azerbaijan", "subnational"),
-    (309, "Nepal", "Asia", "NP", "NPL", 524, "Nepal", "country"),
-    (310, "Pakistan", "Asia", "PK", "PAK", 586, "Pakistan", "country"),
-    (311, "Papua", "Asia", None, None, None, "Indonesia", "subnational"),
-    (312, "Philippines", "Asia", "PH", "PHL", 608, "Philippines", "country"),
-    (313, "Russia in Asia", "Asia", None, None, None, "Russia", "subnational"),
-    (314, "Sabah", "Asia", None, None, None, "Malaysia", "subnational"),
-    (315, "Sarawak", "Asia", None, None, None, "Malaysia", "subnational"),
-    (316, "Sikkim", "Asia", None, None, None, "India", "subnational"),
-    (317, "Singapore", "Asia", "SG", "SGP", 702, "Singapore", "country"),
-    (318, "South Ossetia", "Asia", None, None, None, "Georgia", "disputed"),
-    (319, "Sri Lanka", "Asia", "LK", "LKA", 144, "Sri Lanka", "country"),
-    (320, "Sulawesi", "Asia", None, None, None, "Indonesia", "subnational"),
-    (321, "Sumatra", "Asia", None, None, None, "Indonesia", "subnational"),
-    (322, "Taiwan", "Asia", "TW", "TWN", 158, "Taiwan", "country"),
-    (323, "Tajikistan", "Asia", "TJ", "TJK", 762, "Tajikistan", "country"),
-    (324, "Thailand", "Asia", "TH", "THA", 764, "Thailand", "country"),
-    (325, "Tibet", "Asia", None, None, None, "China", "subnational"),
-    (326, "Timor-Leste", "Asia", "TL", "TLS", 626, "Timor-Leste", "country"),
-    (327, "Turkey in Asia", "Asia", None, None, None, "Turkey", "subnational"),
-    (328, "Turkmenistan", "Asia", "TM", "TKM", 795, "Turkmenistan", "country"),
-    (329, "Uzbekistan", "Asia", "UZ", "UZB", 860, "Uzbekistan", "country"),
-    (330, "Vietnam", "Asia", "VN", "VNM", 704, "Vietnam", "country"),
-]
+    _DestRow(279, "Abkhazia", "Asia", None, None, None, "Georgia", "disputed"),
+    _DestRow(280, "Afghanistan", "Asia", "AF", "AFG", 4, "Afghanistan", "country"),
+    _DestRow(281, "Armenia", "Asia", "AM", "ARM", 51, "Armenia", "country"),
+    _DestRow(282, "Azerbaijan", "Asia", "AZ", "AZE", 31, "Azerbaijan", "country"),
+    _DestRow(283, "Bangladesh", "Asia", "BD", "BGD", 50, "Bangladesh", "country"),
+    _DestRow(284, "Bhutan", "Asia", "BT", "BTN", 64, "Bhutan", "country"),
+    _DestRow(285, "Brunei", "Asia", "BN", "BRN", 96, "Brunei", "country"),
+    _DestRow(286, "Cambodia", "Asia", "KH", "KHM", 116, "Cambodia", "country"),
+    _DestRow(287, "China People's Republic", "Asia", "CN", "CHN", 156, "China", "country"),
+    _DestRow(288, "Georgia", "Asia", "GE", "GEO", 268, "Georgia", "country"),
+    _DestRow(289, "Hainan Island", "Asia", None, None, None, "China", "subnational"),
+    _DestRow(290, "Hong Kong", "Asia", "HK", "HKG", 344, "China", "territory"),
+    _DestRow(291, "India", "Asia", "IN", "IND", 356, "India", "country"),
+    _DestRow(292, "Indonesia Java", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(293, "Japan", "Asia", "JP", "JPN", 392, "Japan", "country"),
+    _DestRow(294, "Jeju Island", "Asia", None, None, None, "South Korea", "subnational"),
+    _DestRow(295, "Kalimantan", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(296, "Kashmir", "Asia", None, None, None, "Disputed", "disputed"),
+    _DestRow(297, "Kazakhstan", "Asia", "KZ", "KAZ", 398, "Kazakhstan", "country"),
+    _DestRow(298, "Korea North", "Asia", "KP", "PRK", 408, "North Korea", "country"),
+    _DestRow(299, "Korea South", "Asia", "KR", "KOR", 410, "South Korea", "country"),
+    _DestRow(300, "Kyrgyzstan", "Asia", "KG", "KGZ", 417, "Kyrgyzstan", "country"),
+    _DestRow(301, "Laos", "Asia", "LA", "LAO", 418, "Laos", "country"),
+    _DestRow(302, "Lesser Sunda Islands", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(303, "Macau", "Asia", "MO", "MAC", 446, "China", "territory"),
+    _DestRow(304, "Malaysia", "Asia", "MY", "MYS", 458, "Malaysia", "country"),
+    _DestRow(305, "Maluku Islands", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(306, "Mongolia", "Asia", "MN", "MNG", 496, "Mongolia", "country"),
+    _DestRow(307, "Myanmar", "Asia", "MM", "MMR", 104, "Myanmar", "country"),
+    _DestRow(308, "Nakhchivan", "Asia", None, None, None, "Azerbaijan", "subnational"),
+    _DestRow(309, "Nepal", "Asia", "NP", "NPL", 524, "Nepal", "country"),
+    _DestRow(310, "Pakistan", "Asia", "PK", "PAK", 586, "Pakistan", "country"),
+    _DestRow(311, "Papua", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(312, "Philippines", "Asia", "PH", "PHL", 608, "Philippines", "country"),
+    _DestRow(313, "Russia in Asia", "Asia", None, None, None, "Russia", "subnational"),
+    _DestRow(314, "Sabah", "Asia", None, None, None, "Malaysia", "subnational"),
+    _DestRow(315, "Sarawak", "Asia", None, None, None, "Malaysia", "subnational"),
+    _DestRow(316, "Sikkim", "Asia", None, None, None, "India", "subnational"),
+    _DestRow(317, "Singapore", "Asia", "SG", "SGP", 702, "Singapore", "country"),
+    _DestRow(318, "South Ossetia", "Asia", None, None, None, "Georgia", "disputed"),
+    _DestRow(319, "Sri Lanka", "Asia", "LK", "LKA", 144, "Sri Lanka", "country"),
+    _DestRow(320, "Sulawesi", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(321, "Sumatra", "Asia", None, None, None, "Indonesia", "subnational"),
+    _DestRow(322, "Taiwan", "Asia", "TW", "TWN", 158, "Taiwan", "country"),
+    _DestRow(323, "Tajikistan", "Asia", "TJ", "TJK", 762, "Tajikistan", "country"),
+    _DestRow(324, "Thailand", "Asia", "TH", "THA", 764, "Thailand", "country"),
+    _DestRow(325, "Tibet", "Asia", None, None, None, "China", "subnational"),
+    _DestRow(326, "Timor-Leste", "Asia", "TL", "TLS", 626, "Timor-Leste", "country"),
+    _DestRow(327, "Turkey in Asia", "Asia", None, None, None, "Turkey", "subnational"),
+    _DestRow(328, "Turkmenistan", "Asia", "TM", "TKM", 795, "Turkmenistan", "country"),
+    _DestRow(329, "Uzbekistan", "Asia", "UZ", "UZB", 860, "Uzbekistan", "country"),
+    _DestRow(330, "Vietnam", "Asia", "VN", "VNM", 704, "Vietnam", "country"),
+)
 
 # Extraction strategies. Destinations NOT listed here use the default "direct" strategy,
 # which matches from NE admin_0_map_subunits/map_units by iso_a3 code.
@@ -586,26 +719,26 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     1: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "PYF",
-        "bbox": [-155, -28, -144, -20],
+        "bbox": (-155, -28, -144, -20),
     },
     # 2 - Australia: mainland minus Tasmania (admin1 subtracted)
     2: {
         "strategy": "remainder",
         "adm0_a3": "AUS",
-        "subtract_admin1": ["Tasmania"],
+        "subtract_admin1": ("Tasmania",),
     },
     # 3 - Chatham Islands: extract from NZ by bbox
     3: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "NZL",
-        "bbox": [-177.5, -45, -175, -43],
+        "bbox": (-177.5, -45, -175, -43),
     },
     # 4 - Cook Islands: direct (COK)
     # 5 - Easter Island: extract from Chile by bbox
     5: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "CHL",
-        "bbox": [-110, -28, -108, -26],
+        "bbox": (-110, -28, -108, -26),
     },
     # 6 - Fiji: direct (FJI)
     # 7 - French Polynesia: PYF minus Austral and Marquesas
@@ -618,20 +751,20 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     8: {
         "strategy": "admin1",
         "adm0_a3": "ECU",
-        "admin1": ["Gal\u00e1pagos"],
+        "admin1": ("Gal\u00e1pagos",),
     },
     # 9 - Guam: direct (GUM)
     # 10 - Hawaiian Islands: admin1 from USA
     10: {
         "strategy": "admin1",
         "adm0_a3": "USA",
-        "admin1": ["Hawaii"],
+        "admin1": ("Hawaii",),
     },
     # 11 - Juan Fernandez Islands: extract from Chile by bbox
     11: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "CHL",
-        "bbox": [-81, -35, -78, -32],
+        "bbox": (-81, -35, -78, -32),
     },
     # 12 - Kiribati: KIR minus Line/Phoenix Islands
     12: {
@@ -643,19 +776,19 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     13: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "KIR",
-        "bbox": [-175, -15, -148, 7],
+        "bbox": (-175, -15, -148, 7),
     },
     # 14 - Lord Howe Island: extract from Australia by bbox
     14: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "AUS",
-        "bbox": [158, -32.5, 160, -31],
+        "bbox": (158, -32.5, 160, -31),
     },
     # 15 - Marquesas Islands: extract from French Polynesia by bbox
     15: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "PYF",
-        "bbox": [-141, -12, -138, -7],
+        "bbox": (-141, -12, -138, -7),
     },
     # 16 - Marshall Islands: direct (MHL)
     # 17 - Micronesia: direct (FSM)
@@ -679,7 +812,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     25: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "JPN",
-        "bbox": [141, 24, 143, 28],
+        "bbox": (141, 24, 143, 28),
     },
     # 26 - Palau: direct (PLW)
     # 27 - Papua New Guinea: PNG minus Islands Region
@@ -692,14 +825,14 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     28: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "PNG",
-        "bbox": [147, -8, 160, -1],
+        "bbox": (147, -8, 160, -1),
     },
     # 29 - Pitcairn Island: direct (PCN)
     # 30 - Ryukyu Islands (Okinawa): admin1 from Japan
     30: {
         "strategy": "admin1",
         "adm0_a3": "JPN",
-        "admin1": ["Okinawa"],
+        "admin1": ("Okinawa",),
     },
     # 31 - Samoa American: direct (ASM)
     # 32 - Samoa: direct (WSM)
@@ -708,7 +841,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     34: {
         "strategy": "admin1",
         "adm0_a3": "AUS",
-        "admin1": ["Tasmania"],
+        "admin1": ("Tasmania",),
     },
     # 35 - Tokelau Islands: direct (TKL)
     # 36 - Tonga: direct (TON)
@@ -727,27 +860,27 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     41: {
         "strategy": "admin1",
         "adm0_a3": "USA",
-        "admin1": ["Alaska"],
+        "admin1": ("Alaska",),
     },
     # 42 - Canada: CAN minus Prince Edward Island
     42: {
         "strategy": "remainder",
         "adm0_a3": "CAN",
-        "subtract_admin1": ["Prince Edward Island"],
+        "subtract_admin1": ("Prince Edward Island",),
     },
     # 43 - Mexico: direct (MEX)
     # 44 - Prince Edward Island: admin1 from Canada
     44: {
         "strategy": "admin1",
         "adm0_a3": "CAN",
-        "admin1": ["Prince Edward Island"],
+        "admin1": ("Prince Edward Island",),
     },
     # 45 - St. Pierre & Miquelon: direct (SPM)
     # 46 - United States (Contiguous): USA minus Alaska and Hawaii
     46: {
         "strategy": "remainder",
         "adm0_a3": "USA",
-        "subtract_admin1": ["Alaska", "Hawaii"],
+        "subtract_admin1": ("Alaska", "Hawaii"),
     },
     # =========================================================================
     # CENTRAL AMERICA (47-53): all direct
@@ -773,13 +906,13 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     58: {
         "strategy": "remainder",
         "adm0_a3": "COL",
-        "subtract_admin1": ["San Andr\u00e9s y Providencia"],
+        "subtract_admin1": ("San Andr\u00e9s y Providencia",),
     },
     # 59 - Ecuador: ECU minus Galapagos
     59: {
         "strategy": "remainder",
         "adm0_a3": "ECU",
-        "subtract_admin1": ["Gal\u00e1pagos"],
+        "subtract_admin1": ("Gal\u00e1pagos",),
     },
     # 60 - French Guiana: direct (GUF)
     # 61 - Guyana: direct (GUY)
@@ -787,7 +920,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     62: {
         "strategy": "admin1",
         "adm0_a3": "VEN",
-        "admin1": ["Nueva Esparta"],
+        "admin1": ("Nueva Esparta",),
     },
     # 63 - Paraguay: direct (PRY)
     # 64 - Peru: direct (PER)
@@ -797,7 +930,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     67: {
         "strategy": "remainder",
         "adm0_a3": "VEN",
-        "subtract_admin1": ["Nueva Esparta"],
+        "subtract_admin1": ("Nueva Esparta",),
     },
     # =========================================================================
     # CARIBBEAN
@@ -811,7 +944,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     73: {
         "strategy": "admin1",
         "adm0_a3": "NLD",
-        "admin1": ["Bonaire"],
+        "admin1": ("Bonaire",),
     },
     # 74 - Cayman Islands: direct (CYM)
     # 75 - Cuba: direct (CUB)
@@ -828,21 +961,21 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     85: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "KNA",
-        "bbox": [-62.7, 17.05, -62.4, 17.25],
+        "bbox": (-62.7, 17.05, -62.4, 17.25),
     },
     # 86 - Puerto Rico: direct (PRI)
     # 87 - Saba & Sint Eustatius: admin1 from Netherlands
     87: {
         "strategy": "admin1",
         "adm0_a3": "NLD",
-        "admin1": ["Saba", "St. Eustatius"],
+        "admin1": ("Saba", "St. Eustatius"),
     },
     # 88 - St. Barthelemy: direct (BLM)
     # 89 - St. Kitts: extract from KNA by bbox
     89: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "KNA",
-        "bbox": [-62.9, 17.2, -62.5, 17.45],
+        "bbox": (-62.9, 17.2, -62.5, 17.45),
     },
     # 90 - St. Lucia: direct (LCA)
     # 91 - St. Martin: direct (MAF)
@@ -851,7 +984,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     93: {
         "strategy": "admin1",
         "adm0_a3": "COL",
-        "admin1": ["San Andr\u00e9s y Providencia"],
+        "admin1": ("San Andr\u00e9s y Providencia",),
     },
     # 94 - Sint Maarten: direct (SXM)
     # 95 - Trinidad & Tobago: direct (TTO)
@@ -865,20 +998,20 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     99: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "SHN",
-        "bbox": [-15, -8.5, -14, -7],
+        "bbox": (-15, -8.5, -14, -7),
     },
     # 100 - Azores Islands: admin1 from Portugal
     100: {
         "strategy": "admin1",
         "adm0_a3": "PRT",
-        "admin1": ["Azores"],
+        "admin1": ("Azores",),
     },
     # 101 - Bermuda: direct (BMU)
     # 102 - Canary Islands: admin1 from Spain
     102: {
         "strategy": "admin1",
         "adm0_a3": "ESP",
-        "admin1": ["Las Palmas", "Santa Cruz de Tenerife"],
+        "admin1": ("Las Palmas", "Santa Cruz de Tenerife"),
     },
     # 103 - Cape Verde: direct (CPV)
     # 104 - Falkland Islands: direct (FLK)
@@ -887,7 +1020,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     106: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "BRA",
-        "bbox": [-33, -4.5, -32, -3],
+        "bbox": (-33, -4.5, -32, -3),
     },
     # 107 - Greenland: direct (GRL)
     # 108 - Iceland: direct (ISL)
@@ -895,20 +1028,20 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     109: {
         "strategy": "admin1",
         "adm0_a3": "PRT",
-        "admin1": ["Madeira"],
+        "admin1": ("Madeira",),
     },
     # 110 - South Georgia & South Sandwich Islands: direct (SGS)
     # 111 - St. Helena: extract from SHN by bbox
     111: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "SHN",
-        "bbox": [-6.5, -16.5, -5, -15],
+        "bbox": (-6.5, -16.5, -5, -15),
     },
     # 112 - Tristan da Cunha: extract from SHN by bbox
     112: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "SHN",
-        "bbox": [-13, -38, -12, -36.5],
+        "bbox": (-13, -38, -12, -36.5),
     },
     # =========================================================================
     # EUROPE & MEDITERRANEAN
@@ -925,7 +1058,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     117: {
         "strategy": "admin1",
         "adm0_a3": "ESP",
-        "admin1": ["Baleares"],
+        "admin1": ("Baleares",),
     },
     # 118 - Belarus: direct (BLR)
     # 119 - Belgium: direct (BEL)
@@ -945,7 +1078,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     123: {
         "strategy": "admin1",
         "adm0_a3": "GRC",
-        "admin1": ["Kriti"],
+        "admin1": ("Kriti",),
     },
     # 124 - Croatia: direct (HRV)
     # 125 - Cyprus British Sovereign Base Areas: direct by name/code
@@ -962,7 +1095,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     # 127 - Cyprus Turkish Fed. State: from disputed layer
     127: {
         "strategy": "disputed",
-        "name": "N. Cyprus",
+        "ne_name": "N. Cyprus",
     },
     # 128 - Czech Republic: direct (CZE)
     # 129 - Denmark: direct (DNK)
@@ -985,13 +1118,13 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     136: {
         "strategy": "remainder",
         "adm0_a3": "GRC",
-        "subtract_admin1": ["Kriti", "Ionioi Nisoi", "Voreio Aigaio", "Notio Aigaio"],
+        "subtract_admin1": ("Kriti", "Ionioi Nisoi", "Voreio Aigaio", "Notio Aigaio"),
     },
     # 137 - Greek Aegean Islands: admin1 merge
     137: {
         "strategy": "admin1",
         "adm0_a3": "GRC",
-        "admin1": ["Voreio Aigaio", "Notio Aigaio"],
+        "admin1": ("Voreio Aigaio", "Notio Aigaio"),
     },
     # 138 - Guernsey & Dependencies: direct (GGY)
     # 139 - Hungary: direct (HUN)
@@ -999,7 +1132,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     140: {
         "strategy": "admin1",
         "adm0_a3": "GRC",
-        "admin1": ["Ionioi Nisoi"],
+        "admin1": ("Ionioi Nisoi",),
     },
     # 141 - Ireland: direct (IRL)
     # 142 - Ireland Northern: subunit from map_subunits
@@ -1012,7 +1145,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     144: {
         "strategy": "remainder",
         "adm0_a3": "ITA",
-        "subtract_admin1": [
+        "subtract_admin1": (
             "Cagliari",
             "Carbonia-Iglesias",
             "Medio Campidano",
@@ -1030,14 +1163,14 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
             "Ragusa",
             "Siracusa",
             "Trapani",
-        ],
+        ),
     },
     # 145 - Jersey: direct (JEY)
     # 146 - Kaliningrad: admin1 from Russia
     146: {
         "strategy": "admin1",
         "adm0_a3": "RUS",
-        "admin1": ["Kaliningrad"],
+        "admin1": ("Kaliningrad",),
     },
     # 147 - Kosovo: direct (XKX in admin_0)
     147: {
@@ -1049,7 +1182,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
         "strategy": "island_bbox",
         "parent_adm0_a3": "ITA",
         "parent_admin1": "Agrigento",
-        "bbox": [12, 35, 13, 36],
+        "bbox": (12, 35, 13, 36),
     },
     # 149 - Latvia: direct (LVA)
     # 150 - Liechtenstein: direct (LIE)
@@ -1072,7 +1205,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     161: {
         "strategy": "remainder",
         "adm0_a3": "PRT",
-        "subtract_admin1": ["Madeira", "Azores"],
+        "subtract_admin1": ("Madeira", "Azores"),
     },
     # 162 - Romania: direct (ROU)
     # 163 - Russia (European part): clip with Europe-Asia boundary, minus Kaliningrad & Crimea
@@ -1089,7 +1222,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     165: {
         "strategy": "admin1",
         "adm0_a3": "ITA",
-        "admin1": [
+        "admin1": (
             "Cagliari",
             "Carbonia-Iglesias",
             "Medio Campidano",
@@ -1098,7 +1231,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
             "Olbia-Tempio",
             "Oristrano",
             "Sassari",
-        ],
+        ),
     },
     # 166 - Scotland: subunit from map_subunits
     166: {
@@ -1110,7 +1243,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     168: {
         "strategy": "admin1",
         "adm0_a3": "ITA",
-        "admin1": [
+        "admin1": (
             "Agrigento",
             "Caltanissetta",
             "Catania",
@@ -1120,7 +1253,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
             "Ragusa",
             "Siracusa",
             "Trapani",
-        ],
+        ),
     },
     # 169 - Slovakia: direct (SVK)
     # 170 - Slovenia: direct (SVN)
@@ -1128,7 +1261,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     171: {
         "strategy": "remainder",
         "adm0_a3": "ESP",
-        "subtract_admin1": ["Baleares", "Las Palmas", "Santa Cruz de Tenerife", "Ceuta", "Melilla"],
+        "subtract_admin1": ("Baleares", "Las Palmas", "Santa Cruz de Tenerife", "Ceuta", "Melilla"),
     },
     # 172 - Spitsbergen (Svalbard): direct from NE map_units
     172: {
@@ -1224,7 +1357,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     189: {
         "strategy": "remainder",
         "adm0_a3": "AGO",
-        "subtract_admin1": ["Cabinda"],
+        "subtract_admin1": ("Cabinda",),
     },
     # 190 - Benin: direct (BEN)
     # 191 - Botswana: direct (BWA)
@@ -1234,7 +1367,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     194: {
         "strategy": "admin1",
         "adm0_a3": "AGO",
-        "admin1": ["Cabinda"],
+        "admin1": ("Cabinda",),
     },
     # 195 - Cameroon: direct (CMR)
     # 196 - Central African Republic: direct (CAF)
@@ -1247,20 +1380,20 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     202: {
         "strategy": "remainder",
         "adm0_a3": "EGY",
-        "subtract_admin1": ["North Sinai", "South Sinai"],
+        "subtract_admin1": ("North Sinai", "South Sinai"),
         "merge_disputed": ["Bir Tawil"],
     },
     # 203 - Equatorial Guinea Bioko: admin1
     203: {
         "strategy": "admin1",
         "adm0_a3": "GNQ",
-        "admin1": ["Bioko Norte", "Bioko Sur"],
+        "admin1": ("Bioko Norte", "Bioko Sur"),
     },
     # 204 - Equatorial Guinea Rio Muni: admin1 (mainland)
     204: {
         "strategy": "admin1",
         "adm0_a3": "GNQ",
-        "admin1": ["Centro Sur", "Kié-Ntem", "Litoral", "Wele-Nzas"],
+        "admin1": ("Centro Sur", "Kié-Ntem", "Litoral", "Wele-Nzas"),
     },
     # 205 - Eritrea: direct (ERI)
     # 206 - Eswatini: direct (SWZ)
@@ -1282,7 +1415,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     221: {
         "strategy": "admin1",
         "adm0_a3": "ESP",
-        "admin1": ["Ceuta", "Melilla"],
+        "admin1": ("Ceuta", "Melilla"),
     },
     # 222 - Mozambique: direct (MOZ)
     # 223 - Namibia: direct (NAM)
@@ -1301,7 +1434,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     # 231 - Somaliland: from disputed layer
     231: {
         "strategy": "disputed",
-        "name": "Somaliland",
+        "ne_name": "Somaliland",
     },
     # 232 - South Africa: direct (ZAF)
     # 233 - South Sudan: direct (SSD)
@@ -1310,12 +1443,12 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     235: {
         "strategy": "remainder",
         "adm0_a3": "TZA",
-        "subtract_admin1": [
+        "subtract_admin1": (
             "Zanzibar North",
             "Zanzibar South and Central",
             "Zanzibar West",
             "Zanzibar Urban/West",
-        ],
+        ),
         "subtract_admin1_match": "Zanzibar",
     },
     # 236 - Togo: direct (TGO)
@@ -1327,12 +1460,12 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     241: {
         "strategy": "admin1",
         "adm0_a3": "TZA",
-        "admin1": [
+        "admin1": (
             "Zanzibar North",
             "Zanzibar South and Central",
             "Zanzibar West",
             "Zanzibar Urban/West",
-        ],
+        ),
         "admin1_match": "Zanzibar",
     },
     # 242 - Zimbabwe: direct (ZWE)
@@ -1343,32 +1476,32 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     243: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Abu Dhabi"],
+        "admin1": ("Abu Dhabi",),
     },
     # 244 - Ajman: admin1 from UAE
     244: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Ajman"],
+        "admin1": ("Ajman",),
     },
     # 245 - Bahrain: direct (BHR)
     # 246 - Dubai: admin1 from UAE
     246: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Dubay"],
+        "admin1": ("Dubay",),
     },
     # 247 - Egypt in Asia (Sinai): admin1 from Egypt
     247: {
         "strategy": "admin1",
         "adm0_a3": "EGY",
-        "admin1": ["North Sinai", "South Sinai"],
+        "admin1": ("North Sinai", "South Sinai"),
     },
     # 248 - Fujairah: admin1 from UAE
     248: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Fujayrah"],
+        "admin1": ("Fujayrah",),
     },
     # 249 - Iran: direct (IRN)
     # 250 - Iraq: direct (IRQ)
@@ -1387,21 +1520,21 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     258: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Ras Al Khaymah"],
+        "admin1": ("Ras Al Khaymah",),
     },
     # 259 - Saudi Arabia: direct (SAU)
     # 260 - Sharjah: admin1 from UAE
     260: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Sharjah"],
+        "admin1": ("Sharjah",),
     },
     # 261 - Syria: direct (SYR)
     # 262 - Umm Al Qaiwain: admin1 from UAE
     262: {
         "strategy": "admin1",
         "adm0_a3": "ARE",
-        "admin1": ["Umm Al Qaywayn"],
+        "admin1": ("Umm Al Qaywayn",),
     },
     # 263 - Yemen: YEM minus Socotra
     263: {
@@ -1416,7 +1549,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     264: {
         "strategy": "admin1",
         "adm0_a3": "IND",
-        "admin1": ["Andaman and Nicobar"],
+        "admin1": ("Andaman and Nicobar",),
     },
     # 265 - British Indian Ocean Territory: direct (IOT)
     # 266 - Christmas Island: direct (CXR)
@@ -1426,7 +1559,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     269: {
         "strategy": "admin1",
         "adm0_a3": "IND",
-        "admin1": ["Lakshadweep"],
+        "admin1": ("Lakshadweep",),
     },
     # 270 - Madagascar: direct (MDG)
     # 271 - Maldives: direct (MDV)
@@ -1442,7 +1575,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     275: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "MUS",
-        "bbox": [63, -20.5, 64, -19],
+        "bbox": (63, -20.5, 64, -19),
     },
     # 276 - Seychelles: SYC minus Zil Elwannyen Sesel (outer islands)
     276: {
@@ -1454,13 +1587,13 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     277: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "YEM",
-        "bbox": [52, 11, 55, 13],
+        "bbox": (52, 11, 55, 13),
     },
     # 278 - Zil Elwannyen Sesel: extract outer Seychelles islands by bbox
     278: {
         "strategy": "island_bbox",
         "parent_adm0_a3": "SYC",
-        "bbox": [52, -10, 57, -3],
+        "bbox": (52, -10, 57, -3),
     },
     # =========================================================================
     # ASIA
@@ -1468,7 +1601,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     # 279 - Abkhazia: from disputed layer
     279: {
         "strategy": "disputed",
-        "name": "Abkhazia",
+        "ne_name": "Abkhazia",
     },
     # 280 - Afghanistan: direct (AFG)
     # 281 - Armenia: direct (ARM)
@@ -1476,7 +1609,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     282: {
         "strategy": "remainder",
         "adm0_a3": "AZE",
-        "subtract_admin1": ["Nax\u00e7\u0131van"],
+        "subtract_admin1": ("Nax\u00e7\u0131van",),
     },
     # 283 - Bangladesh: direct (BGD)
     # 284 - Bhutan: direct (BTN)
@@ -1486,7 +1619,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     287: {
         "strategy": "remainder",
         "adm0_a3": "CHN",
-        "subtract_admin1": ["Hainan", "Xizang"],
+        "subtract_admin1": ("Hainan", "Xizang"),
     },
     # 288 - Georgia: GEO minus Abkhazia and South Ossetia
     288: {
@@ -1498,57 +1631,57 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     289: {
         "strategy": "admin1",
         "adm0_a3": "CHN",
-        "admin1": ["Hainan"],
+        "admin1": ("Hainan",),
     },
     # 290 - Hong Kong: direct (HKG)
     # 291 - India: IND minus Sikkim, Andaman-Nicobar, Lakshadweep, Kashmir
     291: {
         "strategy": "remainder",
         "adm0_a3": "IND",
-        "subtract_admin1": ["Sikkim", "Andaman and Nicobar", "Lakshadweep"],
+        "subtract_admin1": ("Sikkim", "Andaman and Nicobar", "Lakshadweep"),
         "subtract_disputed": ["Kashmir"],
     },
     # 292 - Indonesia Java: admin1 merge
     292: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": [
+        "admin1": (
             "Jakarta Raya",
             "Banten",
             "Jawa Barat",
             "Jawa Tengah",
             "Jawa Timur",
             "Yogyakarta",
-        ],
+        ),
     },
     # 293 - Japan: JPN minus Okinawa (and Ogasawara extracted separately)
     293: {
         "strategy": "remainder",
         "adm0_a3": "JPN",
-        "subtract_admin1": ["Okinawa"],
+        "subtract_admin1": ("Okinawa",),
     },
     # 294 - Jeju Island: admin1 from South Korea
     294: {
         "strategy": "admin1",
         "adm0_a3": "KOR",
-        "admin1": ["Jeju"],
+        "admin1": ("Jeju",),
     },
     # 295 - Kalimantan: admin1 merge from Indonesia
     295: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": [
+        "admin1": (
             "Kalimantan Barat",
             "Kalimantan Selatan",
             "Kalimantan Tengah",
             "Kalimantan Timur",
             "Kalimantan Utara",
-        ],
+        ),
     },
     # 296 - Kashmir: from disputed layer, plus Siachen Glacier
     296: {
         "strategy": "disputed",
-        "name": "Kashmir",
+        "ne_name": "Kashmir",
         "also_merge": ["Siachen Glacier"],
     },
     # 297 - Kazakhstan: KAZ + KAB (Baikonur Cosmodrome lease area)
@@ -1562,7 +1695,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     299: {
         "strategy": "remainder",
         "adm0_a3": "KOR",
-        "subtract_admin1": ["Jeju"],
+        "subtract_admin1": ("Jeju",),
     },
     # 300 - Kyrgyzstan: direct (KGZ)
     # 301 - Laos: direct (LAO)
@@ -1570,20 +1703,20 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     302: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": ["Bali", "Nusa Tenggara Barat", "Nusa Tenggara Timur"],
+        "admin1": ("Bali", "Nusa Tenggara Barat", "Nusa Tenggara Timur"),
     },
     # 303 - Macau: direct (MAC)
     # 304 - Malaysia: MYS minus Sabah and Sarawak
     304: {
         "strategy": "remainder",
         "adm0_a3": "MYS",
-        "subtract_admin1": ["Sabah", "Sarawak"],
+        "subtract_admin1": ("Sabah", "Sarawak"),
     },
     # 305 - Maluku Islands: admin1 merge from Indonesia
     305: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": ["Maluku", "Maluku Utara"],
+        "admin1": ("Maluku", "Maluku Utara"),
     },
     # 306 - Mongolia: direct (MNG)
     # 307 - Myanmar: direct (MMR)
@@ -1591,7 +1724,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     308: {
         "strategy": "admin1",
         "adm0_a3": "AZE",
-        "admin1": ["Nax\u00e7\u0131van"],
+        "admin1": ("Nax\u00e7\u0131van",),
     },
     # 309 - Nepal: direct (NPL)
     # 310 - Pakistan: PAK minus Kashmir
@@ -1604,7 +1737,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     311: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": ["Papua", "Papua Barat"],
+        "admin1": ("Papua", "Papua Barat"),
     },
     # 312 - Philippines: direct (PHL)
     # 313 - Russia in Asia: clip with Europe-Asia boundary
@@ -1618,45 +1751,45 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     314: {
         "strategy": "admin1",
         "adm0_a3": "MYS",
-        "admin1": ["Sabah"],
+        "admin1": ("Sabah",),
     },
     # 315 - Sarawak: admin1 from Malaysia
     315: {
         "strategy": "admin1",
         "adm0_a3": "MYS",
-        "admin1": ["Sarawak"],
+        "admin1": ("Sarawak",),
     },
     # 316 - Sikkim: admin1 from India
     316: {
         "strategy": "admin1",
         "adm0_a3": "IND",
-        "admin1": ["Sikkim"],
+        "admin1": ("Sikkim",),
     },
     # 317 - Singapore: direct (SGP)
     # 318 - South Ossetia: from disputed layer
     318: {
         "strategy": "disputed",
-        "name": "South Ossetia",
+        "ne_name": "South Ossetia",
     },
     # 319 - Sri Lanka: direct (LKA)
     # 320 - Sulawesi: admin1 merge from Indonesia
     320: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": [
+        "admin1": (
             "Sulawesi Barat",
             "Sulawesi Selatan",
             "Sulawesi Tengah",
             "Sulawesi Tenggara",
             "Sulawesi Utara",
             "Gorontalo",
-        ],
+        ),
     },
     # 321 - Sumatra: admin1 merge from Indonesia
     321: {
         "strategy": "admin1",
         "adm0_a3": "IDN",
-        "admin1": [
+        "admin1": (
             "Aceh",
             "Bengkulu",
             "Jambi",
@@ -1667,7 +1800,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
             "Sumatera Barat",
             "Sumatera Selatan",
             "Sumatera Utara",
-        ],
+        ),
     },
     # 322 - Taiwan: direct (TWN)
     # 323 - Tajikistan: direct (TJK)
@@ -1676,7 +1809,7 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
     325: {
         "strategy": "admin1",
         "adm0_a3": "CHN",
-        "admin1": ["Xizang"],
+        "admin1": ("Xizang",),
     },
     # 326 - Timor-Leste: direct (TLS)
     # 327 - Turkey in Asia: clip with Europe-Asia boundary
@@ -1691,6 +1824,25 @@ EXTRACTIONS: dict[int, dict[str, Any]] = {
 }
 
 
+# Position of each destination's row in DESTINATIONS, by tcc_index
+_ROW_BY_INDEX: dict[int, int] = {row.tcc_index: pos for pos, row in enumerate(DESTINATIONS)}
+
+
+def _merge_extraction(row: _DestRow) -> TccDestination:
+    """Return the config dict for one ``DESTINATIONS`` row merged with its ``EXTRACTIONS`` entry.
+
+    Args:
+        row: A destination row from ``DESTINATIONS``.
+
+    Returns:
+        The base destination fields plus the strategy-specific keys, with
+        ``{"strategy": "direct"}`` when the row has no ``EXTRACTIONS`` entry.
+    """
+    d: TccDestination = row._asdict()
+    d.update(EXTRACTIONS.get(row.tcc_index, {"strategy": "direct"}))
+    return d
+
+
 def get_destinations() -> list[TccDestination]:
     """Return all 330 destinations as dicts with merged extraction config.
 
@@ -1701,19 +1853,20 @@ def get_destinations() -> list[TccDestination]:
     Returns:
         List of 330 merged destination config dicts, one per TCC entry.
     """
-    results: list[TccDestination] = []
-    for idx, name, region, a2, a3, n3, sovereign, dtype in DESTINATIONS:
-        d: TccDestination = {
-            "tcc_index": idx,
-            "name": name,
-            "region": region,
-            "iso_a2": a2,
-            "iso_a3": a3,
-            "iso_n3": n3,
-            "sovereign": sovereign,
-            "type": dtype,
-        }
-        ext = EXTRACTIONS.get(idx, {"strategy": "direct"})
-        d.update(ext)
-        results.append(d)
-    return results
+    return [_merge_extraction(row) for row in DESTINATIONS]
+
+
+def get_destination(tcc_index: int) -> TccDestination | None:
+    """Return one destination's merged config dict, looked up by tcc_index.
+
+    Args:
+        tcc_index: TCC destination number (1-330).
+
+    Returns:
+        The same dict ``get_destinations()`` builds for that entry, or None
+        if no destination has that index.
+    """
+    pos = _ROW_BY_INDEX.get(tcc_index)
+    if pos is None:
+        return None
+    return _merge_extraction(DESTINATIONS[pos])
@@ -16,7 +16,6 @@ Run with: python -m src.markers
 
 from __future__ import annotations
 
-import json
 import math
 import os
 import subprocess
@@ -24,6 +23,7 @@ from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
+import orjson
 from shapely.geometry import Point, mapping
 
 AREA_THRESHOLD_KM2: float = 1000.0
@@ -197,8 +197,7 @@ def inject_points(topojson_path: Path, point_features: list[dict[str, Any]]) ->
         topojson_path: Path to the TopoJSON file produced by mapshaper.
         point_features: GeoJSON Feature dicts whose geometry is a Point.
     """
-    with topojson_path.open() as f:
-        topology: dict[str, Any] = json.load(f)
+    topology: dict[str, Any] = orjson.loads(topojson_path.read_bytes())
 
     transform: dict[str, Any] | None = topology.get("transform")
 
@@ -218,8 +217,7 @@ def inject_points(topojson_path: Path, point_features: list[dict[str, Any]]) ->
         ],
     }
 
-    with topojson_path.open("w") as f:
-        json.dump(topology, f)
+    topojson_path.write_bytes(orjson.dumps(topology))
 
 
 def main() -> None:
@@ -239,8 +237,7 @@ def main() -> None:
     polygon_collection, point_features = build_markers_collection(gdf)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    with MARKERS_GEOJSON.open("w") as f:
-        json.dump(polygon_collection, f)
+    MARKERS_GEOJSON.write_bytes(orjson.dumps(polygon_collection))
 
     size_mb = MARKERS_GEOJSON.stat().st_size / (1024 * 1024)
     print(f"\nWrote {MARKERS_GEOJSON} ({size_mb:.1f} MB)")
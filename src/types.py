@@ -13,7 +13,7 @@ type Coordinate = tuple[float, float]
 type CoordList = list[Coordinate]
 type GeoJsonProperties = dict[str, str | int | float | None]
 
-# A complete GeoJSON Feature dict as produced by to_feature()
+# A Feature dict as produced by to_feature(); its geometry is a shapely object
 type TccFeature = dict[str, Any]
 
 # A merged destination config dict as returned by get_destinations()
@@ -2,18 +2,52 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from shapely.geometry import MultiPolygon, Polygon, mapping
+import contextlib
+import weakref
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     import geopandas as gpd
+    import pandas as pd
 
     from .types import Bbox, GeoJsonProperties, TccDestination, TccFeature
 
+# Per-frame lookup caches used by column_index() and select_rows(), keyed by
+# id() and guarded by a weak reference so that a recycled id can never hit
+# another frame's entry.  Each entry holds the ``value -> row positions``
+# indexes per ``(field, lower)``, the row subsets already handed out, and the
+# lower-cased string columns, as Series and as plain object arrays.
+_row_indexes: dict[
+    int,
+    tuple[
+        weakref.ref[gpd.GeoDataFrame],
+        dict[tuple[str, bool], dict[Any, np.ndarray]],
+        dict[tuple[str, bool, Any], gpd.GeoDataFrame],
+        dict[str, pd.Series],
+        dict[str, np.ndarray],
+    ],
+] = {}
+
+# Results of dissolve_rows() for multi-row frames, keyed and guarded like
+# _row_indexes.  Selections from select_rows() are cached frames, so a parent
+# country or province picked by several destinations is unioned only once.
+_dissolved: dict[int, tuple[weakref.ref[gpd.GeoDataFrame], Any]] = {}
+
+# Polygon parts and their STRtree for each geometry queried by
+# extract_polygons_by_bbox(), keyed and guarded like _row_indexes.  Parent
+# geometries come from the dissolve caches, so island destinations sharing a
+# parent country reuse one index.
+_part_trees: dict[int, tuple[weakref.ref[BaseGeometry], np.ndarray, shapely.STRtree]] = {}
+
 
 def dissolve_geometries(geometries: list[Any]) -> Any:
     """Dissolve a list of geometries into a single geometry.
@@ -27,6 +61,114 @@ def dissolve_geometries(geometries: list[Any]) -> Any:
     return unary_union(geometries)
 
 
+def make_valid_polygons(geom: Any) -> Any:
+    """Repair an invalid polygonal geometry, leaving valid ones untouched.
+
+    Every repair in the build goes through here.  GEOS MakeValid with the
+    ``structure`` method always returns a polygonal result (collapsed parts
+    are dropped), and unlike ``buffer(0)`` it keeps both lobes of a
+    self-intersecting ring.
+
+    Args:
+        geom: A shapely (Multi)Polygon.
+
+    Returns:
+        ``geom`` itself if valid, otherwise its repaired polygonal equivalent,
+        which is empty if no area remains.
+    """
+    if geom.is_valid:
+        return geom
+    return shapely.make_valid(geom, method="structure", keep_collapsed=False)
+
+
+def difference_by_parts(geom: Any, other: Any) -> Any:
+    """Compute ``geom.difference(other)`` touching only the parts near ``other``.
+
+    If the envelopes of ``geom`` and ``other`` are disjoint ``geom`` is returned
+    as-is.  For a MultiPolygon (e.g. a country with hundreds of islands) only the parts
+    whose envelope meets ``other``'s envelope go through the overlay; the rest
+    are carried over unchanged.  Parts of a valid MultiPolygon are disjoint and
+    the differenced parts only shrink, so the pieces are reassembled without a
+    union.
+
+    Args:
+        geom: A valid shapely (Multi)Polygon.
+        other: Polygonal geometry to remove from ``geom``.
+
+    Returns:
+        The polygonal difference, equal in area to ``geom.difference(other)``.
+    """
+    if other.is_empty:
+        return geom.difference(other)
+    w, s, e, n = other.bounds
+    gw, gs, ge, gn = geom.bounds
+    if gw > e or ge < w or gs > n or gn < s:
+        # Disjoint envelopes: nothing to remove
+        return geom
+    if not isinstance(geom, MultiPolygon):
+        return geom.difference(other)
+
+    parts = shapely.get_parts(geom)
+    bounds = shapely.bounds(parts)
+    near = (bounds[:, 0] <= e) & (bounds[:, 2] >= w) & (bounds[:, 1] <= n) & (bounds[:, 3] >= s)
+    if not near.any():
+        return geom
+    if near.all():
+        return geom.difference(other)
+
+    touched = shapely.get_parts(shapely.multipolygons(parts[near]).difference(other))
+    touched = touched[(shapely.get_type_id(touched) == 3) & ~shapely.is_empty(touched)]
+    kept = [*parts[~near], *touched]
+    return kept[0] if len(kept) == 1 else MultiPolygon(kept)
+
+
+def dissolve_rows(gdf: gpd.GeoDataFrame) -> Any:
+    """Dissolve the geometries of a GeoDataFrame into a single geometry.
+
+    A single row is returned as-is; several rows are unioned directly with
+    ``shapely.union_all`` over the geometry array, skipping the grouping and
+    frame rebuild of ``dissolve()``.
+    The union is computed once per frame and reused on later calls.
+
+    Args:
+        gdf: Non-empty GeoDataFrame of matched rows. It must not be mutated
+            afterwards.
+
+    Returns:
+        A single shapely geometry.
+    """
+    geoms = gdf.geometry.values
+    if len(geoms) == 1:
+        return geoms[0]
+
+    key = id(gdf)
+    hit = _dissolved.get(key)
+    if hit is not None and hit[0]() is gdf:
+        return hit[1]
+    geom = shapely.union_all(geoms)
+    _dissolved[key] = (weakref.ref(gdf, lambda _: _dissolved.pop(key, None)), geom)
+    return geom
+
+
+def union_rows(gdf: gpd.GeoDataFrame, positions: np.ndarray) -> Any:
+    """Union the geometries at the given row positions of a GeoDataFrame.
+
+    Works on the geometry array alone, so no row subset (with its index and
+    attribute columns) is built just to be dissolved.
+
+    Args:
+        gdf: GeoDataFrame holding the geometries.
+        positions: Non-empty row positions (as from :func:`column_index`).
+
+    Returns:
+        A single shapely geometry.
+    """
+    geoms = gdf.geometry.values[positions]
+    if len(geoms) == 1:
+        return geoms[0]
+    return shapely.union_all(geoms)
+
+
 def extract_polygons_by_bbox(geom: Any, bbox: Bbox) -> Polygon | MultiPolygon | None:
     """Extract individual polygons from a Multi/Polygon whose centroid falls within bbox.
 
@@ -40,18 +182,20 @@ def extract_polygons_by_bbox(geom: Any, bbox: Bbox) -> Polygon | MultiPolygon |
     w, s, e, n = bbox
     bbox_poly = Polygon([(w, s), (e, s), (e, n), (w, n)])
 
-    if isinstance(geom, Polygon):
-        polys: list[Polygon] = [geom]
-    elif isinstance(geom, MultiPolygon):
-        polys = list(geom.geoms)
-    else:
+    if not isinstance(geom, Polygon | MultiPolygon):
         return None
 
-    matches = [p for p in polys if bbox_poly.contains(p.centroid)]
+    # Only parts whose envelope overlaps the bbox can contain a centroid in it
+    # or intersect it
+    parts, tree = _part_tree(geom)
+    candidates = parts[np.sort(tree.query(bbox_poly))]
+
+    centroids = shapely.centroid(candidates)
+    matches = list(candidates[shapely.contains(bbox_poly, centroids)])
 
     if not matches:
         # Fallback: check intersection instead of centroid containment
-        matches = [p for p in polys if bbox_poly.intersects(p)]
+        matches = list(candidates[shapely.intersects(bbox_poly, candidates)])
 
     if not matches:
         return None
@@ -60,6 +204,25 @@ def extract_polygons_by_bbox(geom: Any, bbox: Bbox) -> Polygon | MultiPolygon |
     return MultiPolygon(matches)
 
 
+def _part_tree(geom: BaseGeometry) -> tuple[np.ndarray, shapely.STRtree]:
+    """Return the polygon parts of ``geom`` and an STRtree over them, cached per geometry.
+
+    Args:
+        geom: A shapely (Multi)Polygon.
+
+    Returns:
+        A ``(parts, tree)`` tuple; tree query results index into ``parts``.
+    """
+    key = id(geom)
+    hit = _part_trees.get(key)
+    if hit is not None and hit[0]() is geom:
+        return hit[1], hit[2]
+    parts = shapely.get_parts(geom)
+    tree = shapely.STRtree(parts)
+    _part_trees[key] = (weakref.ref(geom, lambda _: _part_trees.pop(key, None)), parts, tree)
+    return parts, tree
+
+
 def subtract_polygons_by_bbox(geom: Any, bbox: Bbox) -> Polygon | MultiPolygon | None:
     """Remove polygons whose centroid falls within bbox from a Multi/Polygon.
 
@@ -80,7 +243,8 @@ def subtract_polygons_by_bbox(geom: Any, bbox: Bbox) -> Polygon | MultiPolygon |
     else:
         return geom
 
-    remaining = [p for p in polys if not bbox_poly.contains(p.centroid)]
+    inside = shapely.contains(bbox_poly, shapely.centroid(polys))
+    remaining = [p for p, hit in zip(polys, inside, strict=True) if not hit]
 
     if not remaining:
         return None
@@ -89,33 +253,253 @@ def subtract_polygons_by_bbox(geom: Any, bbox: Bbox) -> Polygon | MultiPolygon |
     return MultiPolygon(remaining)
 
 
-def load_shapefile(path: Path) -> gpd.GeoDataFrame:
-    """Load a shapefile as a GeoDataFrame.
+def _frame_cache(
+    gdf: gpd.GeoDataFrame,
+) -> tuple[
+    dict[tuple[str, bool], dict[Any, np.ndarray]],
+    dict[tuple[str, bool, Any], gpd.GeoDataFrame],
+    dict[str, pd.Series],
+    dict[str, np.ndarray],
+]:
+    """Return the ``(indexes, subsets, lowered, lowered_values)`` caches for ``gdf``.
+
+    The caches are created on first use.
+    """
+    key = id(gdf)
+    entry = _row_indexes.get(key)
+    if entry is None or entry[0]() is not gdf:
+        entry = (weakref.ref(gdf, lambda _: _row_indexes.pop(key, None)), {}, {}, {}, {})
+        _row_indexes[key] = entry
+    return entry[1], entry[2], entry[3], entry[4]
+
+
+def lower_column(gdf: gpd.GeoDataFrame, field: str) -> pd.Series:
+    """Return ``gdf[field].str.lower()``, computed once per frame and column.
+
+    Args:
+        gdf: GeoDataFrame holding the string column. It must not be mutated afterwards.
+        field: Name of the string column.
+
+    Returns:
+        The lower-cased column (missing values stay missing).
+    """
+    _, _, lowered, _ = _frame_cache(gdf)
+    column = lowered.get(field)
+    if column is None:
+        column = gdf[field].str.lower()
+        lowered[field] = column
+    return column
+
+
+def contains_rows(gdf: gpd.GeoDataFrame, field: str, needle: str) -> np.ndarray:
+    """Return the positions of the rows whose lower-cased ``field`` contains ``needle``.
+
+    A literal substring test over the cached lower-cased column as a plain
+    object array.  On small layers such as the disputed areas, this Python
+    scan is several times faster than ``Series.str.contains``.
+
+    Args:
+        gdf: GeoDataFrame holding the string column. It must not be mutated afterwards.
+        field: Name of the string column.
+        needle: Lower-cased substring to look for.
+
+    Returns:
+        Ascending row positions (possibly empty); missing values never match.
+    """
+    _, _, _, lowered_values = _frame_cache(gdf)
+    values = lowered_values.get(field)
+    if values is None:
+        values = lower_column(gdf, field).to_numpy(dtype=object)
+        lowered_values[field] = values
+    return np.flatnonzero([isinstance(v, str) and needle in v for v in values])
+
+
+def column_index(
+    gdf: gpd.GeoDataFrame, field: str, *, lower: bool = False
+) -> dict[Any, np.ndarray]:
+    """Group a column into a ``value -> row positions`` dict, cached per frame.
+
+    Args:
+        gdf: GeoDataFrame to index. It must not be mutated afterwards.
+        field: Column to group on. Missing values are left out.
+        lower: If True, index the lower-cased column for case-insensitive lookups.
+
+    Returns:
+        Dict mapping each distinct value to the ascending row positions holding it.
+    """
+    indexes, _, _, _ = _frame_cache(gdf)
+    index = indexes.get((field, lower))
+    if index is None:
+        column = lower_column(gdf, field) if lower else gdf[field]
+        index = cast("dict[Any, np.ndarray]", column.groupby(column, sort=False).indices)
+        indexes[(field, lower)] = index
+    return index
+
+
+def select_rows(
+    gdf: gpd.GeoDataFrame, field: str, value: Any, *, lower: bool = False
+) -> gpd.GeoDataFrame:
+    """Select the rows of ``gdf`` whose ``field`` equals ``value``.
+
+    Equivalent to ``gdf[gdf[field] == value]`` (or, with ``lower``, to
+    ``gdf[gdf[field].str.lower() == value.lower()]``), but answered from a
+    :func:`column_index` lookup instead of a full-column scan.  The selected
+    frame is cached too, so repeated selections return the same object and
+    lookups on it reuse its own indexes.
+
+    Args:
+        gdf: GeoDataFrame to select from. It must not be mutated afterwards.
+        field: Column to match on.
+        value: Value to look up.
+        lower: If True, match case-insensitively.
+
+    Returns:
+        The matching rows, in their original order (possibly empty). Treat
+        the result as read-only.
+    """
+    if lower:
+        value = value.lower()
+    _, subsets, _, _ = _frame_cache(gdf)
+    subset = subsets.get((field, lower, value))
+    if subset is None:
+        rows = column_index(gdf, field, lower=lower).get(value)
+        subset = gdf.iloc[rows] if rows is not None else gdf.iloc[:0]
+        subsets[(field, lower, value)] = subset
+    return subset
+
+
+def find_rows(
+    gdfs: list[gpd.GeoDataFrame], fields: list[str], value: Any
+) -> gpd.GeoDataFrame | None:
+    """Return the first non-empty ``select_rows`` match across frames and fields.
+
+    Frames are searched in order, each over ``fields`` in order.  Fields a frame
+    lacks are skipped, and misses are answered from the cached
+    :func:`column_index` without building an empty selection.
+
+    Args:
+        gdfs: GeoDataFrames to search, in priority order.
+        fields: Columns to match on, in priority order.
+        value: Value to look up.
+
+    Returns:
+        The matching rows of the first frame and field that have any, or None.
+    """
+    for gdf in gdfs:
+        for field in fields:
+            if field in gdf.columns and value in column_index(gdf, field):
+                return select_rows(gdf, field, value)
+    return None
+
+
+def _read_parquet_cache(cache: Path, columns: list[str] | None) -> gpd.GeoDataFrame | None:
+    """Read the requested columns from a shapefile's GeoParquet cache.
+
+    Only the parquet schema is inspected up front, so a cache that lacks a
+    requested column is rejected without decoding it, and unrequested columns
+    are never read.
+
+    Args:
+        cache: Path to the ``.parquet`` cache written by ``load_shapefile``.
+        columns: Attribute columns to read, or None for all of them.
+
+    Returns:
+        The cached GeoDataFrame, or None if the cache does not cover ``columns``.
+    """
+    import geopandas as gpd
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(cache)
+    metadata = schema.metadata or {}
+    # None means the cache was written with every column
+    attrs = orjson.loads(metadata.get(b"PANDAS_ATTRS", b"{}"))
+    if columns is None:
+        return gpd.read_parquet(cache) if attrs.get("shapefile_columns") is None else None
+    if not set(columns) <= set(schema.names):
+        return None
+    geometry = orjson.loads(metadata[b"geo"])["primary_column"]
+    return gpd.read_parquet(
+        cache, columns=[c for c in schema.names if c in columns or c == geometry]
+    )
+
+
+def load_shapefile(path: Path, columns: list[str] | None = None) -> gpd.GeoDataFrame:
+    """Load a shapefile as a GeoDataFrame, via a GeoParquet cache.
+
+    The shapefile is read with the pyogrio engine in Arrow mode (falling back to
+    fiona if pyogrio/pyarrow are unavailable) and written to a ``.parquet``
+    sibling. Later calls read just the requested columns from the parquet file
+    while it is at least as new as the shapefile and holds all of them.
 
     Args:
         path: Filesystem path to the .shp file.
+        columns: Attribute columns to decode, or None for all of them. The
+            geometry column is always included.
 
     Returns:
         A GeoDataFrame with all features from the shapefile.
     """
     import geopandas as gpd
 
-    return gpd.read_file(path)
+    cache = path.with_suffix(".parquet")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        cached = _read_parquet_cache(cache, columns)
+        if cached is not None:
+            return cached
+
+    try:
+        gdf = gpd.read_file(path, engine="pyogrio", use_arrow=True, columns=columns)
+    except ImportError:
+        gdf = gpd.read_file(path, engine="fiona", columns=columns)
+
+    # The cache is best-effort; the shapefile stays authoritative
+    gdf.attrs["shapefile_columns"] = columns
+    with contextlib.suppress(ImportError, OSError):
+        gdf.to_parquet(cache)
+    return gdf
+
+
+def geometries_from_features(features: list[TccFeature]) -> list[Any]:
+    """Return the geometries of built features as shapely objects.
+
+    Features from :func:`to_feature` already hold shapely geometries.  Any
+    given as GeoJSON mappings are serialised with ``orjson`` and decoded in one
+    vectorized ``shapely.from_geojson`` call, instead of calling ``shape()`` on
+    each of them.
+
+    Args:
+        features: Feature dicts as produced by :func:`to_feature`.
+
+    Returns:
+        Shapely geometries in the same order as ``features``.
+    """
+    geoms = [feat["geometry"] for feat in features]
+    mapped = [i for i, g in enumerate(geoms) if not isinstance(g, BaseGeometry)]
+    if mapped:
+        raw = [orjson.dumps(geoms[i], option=orjson.OPT_SERIALIZE_NUMPY) for i in mapped]
+        for i, geom in zip(mapped, shapely.from_geojson(raw), strict=True):
+            geoms[i] = geom
+    return geoms
 
 
 def to_feature(geometry: Any, properties: GeoJsonProperties) -> TccFeature:
-    """Create a GeoJSON-style feature dict.
+    """Create a feature dict.
+
+    The geometry is kept as a shapely object rather than converted with
+    ``mapping()``; it is serialised to GeoJSON only when the collection is
+    written (see ``build.write_geojson``), in one vectorized
+    ``shapely.to_geojson`` call.
 
     Args:
         geometry: A shapely geometry object.
         properties: Dict of feature properties.
 
     Returns:
-        A GeoJSON Feature dict with ``type``, ``geometry``, and ``properties`` keys.
+        A Feature dict with ``type``, ``geometry``, and ``properties`` keys.
     """
     return {
         "type": "Feature",
-        "geometry": mapping(geometry),
+        "geometry": geometry,
         "properties": properties,
     }
 
@@ -158,11 +542,5 @@ def get_country_geom(
     Returns:
         A dissolved shapely geometry, or None if not found in either layer.
     """
-    for gdf in [subunits_gdf, units_gdf]:
-        for field in ["ADM0_A3", "SU_A3", "GU_A3", "ISO_A3"]:
-            if field not in gdf.columns:
-                continue
-            matches = gdf[gdf[field] == adm0_a3]
-            if len(matches) > 0:
-                return matches.dissolve().geometry.iloc[0]
-    return None
+    matches = find_rows([subunits_gdf, units_gdf], ["ADM0_A3", "SU_A3", "GU_A3", "ISO_A3"], adm0_a3)
+    return None if matches is None else dissolve_rows(matches)
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import shapely
 from shapely.geometry import LineString, MultiLineString, Polygon, box
 
 from src.boundary import (
     _collect_polygons,
     _count_crossings,
     _extract_polygons,
-    _pt_dist,
+    _finalize,
+    _pt_dist_sq,
 )
 
 
@@ -22,21 +26,35 @@ def reset_boundary_cache():
 
     b._boundary_line = None
     b._ordered_path = None
+    b._ordered_xy = None
+    b._boundary_bounds = None
+    b._europe_clip = None
+    b._merged_boundary = None
+    b._boundary_segments = None
     yield
     b._boundary_line = None
     b._ordered_path = None
+    b._ordered_xy = None
+    b._boundary_bounds = None
+    b._europe_clip = None
+    b._merged_boundary = None
+    b._boundary_segments = None
 
 
-class TestPtDist:
+class TestPtDistSq:
     def test_zero_distance(self):
-        assert _pt_dist((0.0, 0.0), (0.0, 0.0)) == pytest.approx(0.0)
+        assert _pt_dist_sq((0.0, 0.0), (0.0, 0.0)) == pytest.approx(0.0)
 
     def test_unit_distance(self):
-        assert _pt_dist((0.0, 0.0), (1.0, 0.0)) == pytest.approx(1.0)
+        assert _pt_dist_sq((0.0, 0.0), (1.0, 0.0)) == pytest.approx(1.0)
 
     def test_diagonal(self):
-        dist = _pt_dist((0.0, 0.0), (3.0, 4.0))
-        assert dist == pytest.approx(5.0)
+        dist = _pt_dist_sq((0.0, 0.0), (3.0, 4.0))
+        assert dist == pytest.approx(25.0)
+
+    def test_many_points(self):
+        dists = _pt_dist_sq((0.0, 0.0), [(3.0, 4.0), (0.0, 2.0)])
+        assert list(dists) == pytest.approx([25.0, 4.0])
 
 
 class TestCollectPolygons:
@@ -67,6 +85,14 @@ class TestCollectPolygons:
         result = _collect_polygons(gc)
         assert len(result) == 1
 
+    def test_nested_collection_keeps_order(self):
+        from shapely.geometry import GeometryCollection, MultiPolygon
+
+        p1, p2, p3 = box(0, 0, 1, 1), box(2, 2, 3, 3), box(4, 4, 5, 5)
+        gc = GeometryCollection([MultiPolygon([p1, p2]), GeometryCollection([p3])])
+        result = _collect_polygons(gc)
+        assert [r.bounds for r in result] == [p1.bounds, p2.bounds, p3.bounds]
+
 
 class TestExtractPolygons:
     def test_returns_single_polygon(self):
@@ -91,6 +117,32 @@ class TestExtractPolygons:
         assert isinstance(result, MP)
 
 
+class TestFinalize:
+    def test_returns_valid_polygon_unchanged(self):
+        poly = box(0, 0, 1, 1)
+        assert _finalize(poly, None) is poly
+
+    def test_drops_lines_and_empty_parts(self):
+        from shapely.geometry import GeometryCollection
+
+        gc = GeometryCollection([box(0, 0, 1, 1), LineString([(0, 0), (1, 1)]), Polygon()])
+        result = _finalize(gc, None)
+        assert isinstance(result, Polygon)
+        assert result.area == pytest.approx(1.0)
+
+    def test_repairs_invalid_result(self):
+        bowtie = Polygon([(0, 0), (2, 2), (2, 0), (0, 2)])
+        result = _finalize(bowtie, None)
+        assert result is not None
+        assert result.is_valid
+        assert result.area == pytest.approx(2.0)
+
+    def test_returns_fallback_without_polygons(self):
+        fallback = box(0, 0, 1, 1)
+        assert _finalize(None, fallback) is fallback
+        assert _finalize(Polygon(), fallback) is fallback
+
+
 class TestCountCrossings:
     def test_no_crossings(self):
         boundary = LineString([(50, 0), (50, 10)])
@@ -109,6 +161,44 @@ class TestCountCrossings:
         ray = LineString([(0, 5), (20, 5)])
         assert _count_crossings(ray, mls) == 2
 
+    def test_array_of_rays(self):
+        import numpy as np
+
+        boundary = MultiLineString([[(5, 0), (5, 10)], [(15, 0), (15, 10)]])
+        rays = np.array(
+            [
+                LineString([(0, 5), (2, 5)]),
+                LineString([(0, 5), (10, 5)]),
+                LineString([(0, 5), (20, 5)]),
+            ]
+        )
+        assert list(_count_crossings(rays, boundary)) == [0, 1, 2]
+
+    def test_shared_vertex_counted_once(self):
+        boundary = LineString([(5, 0), (5, 5), (6, 10)])
+        ray = LineString([(0, 5), (10, 5)])
+        assert _count_crossings(ray, boundary) == 1
+
+    def test_segments_cached_per_boundary(self):
+        import src.boundary as b
+
+        boundary = MultiLineString([[(5, 0), (5, 10)], [(15, 0), (15, 10)]])
+        segments = b._boundary_segments_xy(boundary)
+        assert segments.shape == (2, 2, 2)
+        assert b._boundary_segments_xy(boundary) is segments
+        assert b._boundary_segments_xy(LineString([(5, 0), (5, 10)])) is not segments
+
+    def test_touching_vertex_keeps_parity(self):
+        # The ray grazes the tip of a peak: no side change, so an even count
+        boundary = LineString([(4, 0), (5, 5), (6, 0)])
+        ray = LineString([(0, 5), (10, 5)])
+        assert _count_crossings(ray, boundary) % 2 == 0
+
+    def test_crossing_beyond_ray_end_ignored(self):
+        boundary = LineString([(5, 0), (5, 10)])
+        ray = LineString([(-180, 5), (4, 5)])
+        assert _count_crossings(ray, boundary) == 0
+
 
 class TestBuildOrderedPath:
     """Test the greedy path-building logic with synthetic boundaries."""
@@ -144,6 +234,17 @@ class TestBuildOrderedPath:
         # Result: path starts at lat 10 or 0, ends at lat 70 → south-to-north
         assert path[0][1] <= path[-1][1]
 
+    def test_chains_reversed_segments(self):
+        from src.boundary import _build_ordered_path
+
+        # Middle segment is stored north-to-south, so it must be reversed when chained;
+        # the 0.01° gaps stop linemerge from joining them
+        seg1 = LineString([(0, 0), (0, 1)])
+        seg2 = LineString([(0.01, 2), (0.01, 1)])
+        seg3 = LineString([(0, 2.01), (0, 3)])
+        path = _build_ordered_path(MultiLineString([seg3, seg1, seg2]))
+        assert path == [(0, 0), (0, 1), (0.01, 1), (0.01, 2), (0, 2.01), (0, 3)]
+
     def test_caches_result(self):
         from src.boundary import _build_ordered_path
         import src.boundary as b
@@ -188,6 +289,43 @@ class TestClipByBoundary:
         # Asia should be mostly east of boundary
         assert result.bounds[0] >= 4.9  # minx near boundary
 
+    def test_country_inside_europe_returned_unchanged(self):
+        from src.boundary import _clip_by_boundary
+
+        country = box(0, 0, 4, 10)
+        boundary = self._make_vertical_boundary(5.0)
+        assert _clip_by_boundary(country, boundary, side="europe") is country
+
+    def test_country_east_of_boundary_skips_clip(self, mocker):
+        import src.boundary as b
+
+        country = box(30, 0, 40, 10)
+        build_polygon = mocker.spy(b, "_europe_polygon")
+        for side in ("europe", "asia"):
+            assert b._clip_by_boundary(country, self._make_vertical_boundary(5.0), side) is country
+        build_polygon.assert_not_called()
+
+    def test_europe_polygon_built_once(self):
+        import src.boundary as b
+
+        boundary = self._make_vertical_boundary(5.0)
+        b._clip_by_boundary(box(0, 0, 20, 10), boundary, side="europe")
+        cached = b._europe_clip
+        b._clip_by_boundary(box(-20, 0, 20, 5), boundary, side="asia")
+        assert cached is not None
+        assert b._europe_clip is cached
+        assert cached[0].bounds[0] == -30.0
+
+    def test_non_monotone_boundary_matches_full_intersection(self):
+        """Pre-trimming with clip_by_rect must not change the overlay result."""
+        import src.boundary as b
+
+        boundary = LineString([(5, -10), (5, 5), (8, 3), (8, 20)])
+        country = box(0, 0, 20, 10)
+        result = b._clip_by_boundary(country, boundary, side="europe")
+        europe_polygon, _ = b._europe_polygon(b._build_ordered_path(boundary))
+        assert result.symmetric_difference(country.intersection(europe_polygon)).area < 1e-9
+
     def test_fallback_on_exception(self, mocker):
         """When intersection() raises, fallback clip is used and returns a geometry."""
         from src.boundary import _clip_by_boundary
@@ -209,6 +347,19 @@ class TestClipByBoundary:
         assert result is not None
 
 
+class TestGetMergedBoundary:
+    def test_merges_once_per_boundary(self, mocker):
+        import src.boundary as b
+
+        boundary = MultiLineString([[(0, 0), (1, 1)], [(1, 1), (2, 3)]])
+        merge = mocker.spy(b, "linemerge")
+        merged = b._get_merged_boundary(boundary)
+        assert merged.geom_type == "LineString"
+        assert b._get_merged_boundary(boundary) is merged
+        b._fallback_clip(box(0, 0, 2, 3), boundary, "europe")
+        assert merge.call_count == 1
+
+
 class TestFallbackClip:
     """Tests for _fallback_clip using synthetic data."""
 
@@ -222,6 +373,26 @@ class TestFallbackClip:
         # Should return the west piece (roughly)
         assert result is not None or True  # May be None if strip is too wide
 
+    def test_keeps_western_and_eastern_pieces(self):
+        from src.boundary import _fallback_clip
+
+        boundary = LineString([(5, -1), (5, 11)])
+        country = box(0, 0, 10, 10)
+        europe = _fallback_clip(country, boundary, side="europe")
+        asia = _fallback_clip(country, boundary, side="asia")
+        assert europe is not None and asia is not None
+        assert europe.bounds[2] == pytest.approx(4.995)
+        assert asia.bounds[0] == pytest.approx(5.005)
+
+    def test_morton_sorted_groups_neighbours(self):
+        from src.boundary import _morton_sorted
+
+        far = box(100, 100, 101, 101)
+        near_a = box(0, 0, 1, 1)
+        near_b = box(1, 0, 2, 1)
+        ordered = _morton_sorted([near_a, far, near_b])
+        assert ordered == [near_a, near_b, far]
+
     def test_returns_none_for_empty_remainder(self):
         from src.boundary import _fallback_clip
 
@@ -249,6 +420,89 @@ class TestCountCrossingsExtended:
         assert result == 1
 
 
+class TestLoadBoundaryCache:
+    """load_boundary() against a synthetic GeoJSON file."""
+
+    def _write_boundary(self, data_dir: Path) -> Path:
+        path = data_dir / "europe_asia_boundary.geojson"
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "MultiLineString",
+                    "coordinates": [[[1, 1], [2, 2]], [[3, 3], [4, 4], [5, 5]]],
+                },
+            },
+        ]
+        path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+        return path
+
+    def test_builds_lines_and_writes_cache(self, tmp_path, mocker):
+        import src.boundary as b
+
+        mocker.patch.object(b, "DATA_DIR", tmp_path)
+        self._write_boundary(tmp_path)
+
+        boundary = b.load_boundary()
+        assert boundary.geom_type == "MultiLineString"
+        assert [len(g.coords) for g in boundary.geoms] == [2, 2, 3]
+        assert (tmp_path / "europe_asia_boundary.wkb").exists()
+
+    def test_reads_cache_on_next_load(self, tmp_path, mocker):
+        import src.boundary as b
+
+        mocker.patch.object(b, "DATA_DIR", tmp_path)
+        self._write_boundary(tmp_path)
+        first = b.load_boundary()
+
+        b._boundary_line = None
+        load_json = mocker.patch("src.boundary.json.load")
+        second = b.load_boundary()
+        load_json.assert_not_called()
+        assert second.equals(first)
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path, mocker):
+        import src.boundary as b
+
+        mocker.patch.object(b, "DATA_DIR", tmp_path)
+        self._write_boundary(tmp_path)
+        first = b.load_boundary()
+
+        cache = tmp_path / "europe_asia_boundary.wkb"
+        cache.write_bytes(shapely.to_wkb(first)[:20])
+        b._boundary_line = None
+        assert b.load_boundary().equals(first)
+        assert shapely.from_wkb(cache.read_bytes()).equals(first)
+
+    def test_restored_state_skips_loading(self, tmp_path, mocker):
+        import src.boundary as b
+
+        mocker.patch.object(b, "DATA_DIR", tmp_path)
+        self._write_boundary(tmp_path)
+        state = b.boundary_state()
+
+        b._boundary_line = b._ordered_path = b._europe_clip = None
+        load_json = mocker.patch("src.boundary.json.load")
+        b.restore_boundary_state(state)
+        assert b.load_boundary() is state[0]
+        assert b._build_ordered_path(state[0]) is state[1]
+        assert b._europe_polygon(state[1])[0] is state[2]
+        load_json.assert_not_called()
+
+    def test_unwritable_cache_is_ignored(self, tmp_path, mocker):
+        import src.boundary as b
+
+        mocker.patch.object(b, "DATA_DIR", tmp_path)
+        self._write_boundary(tmp_path)
+        # A directory in place of the cache file can be neither read nor replaced
+        (tmp_path / "europe_asia_boundary.wkb").mkdir()
+        assert b.load_boundary().geom_type == "MultiLineString"
+
+
 @pytest.mark.integration
 class TestLoadBoundary:
     """Integration tests that require the real boundary file."""
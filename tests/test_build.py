@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import geopandas as gpd
@@ -34,6 +34,29 @@ class TestWriteGeojson:
         indices = [f["properties"]["tcc_index"] for f in data["features"]]
         assert indices == [1, 2, 3]
 
+    def test_empty_collection_is_valid_json(self, tmp_path):
+        from src.build import write_geojson
+
+        out = tmp_path / "empty.geojson"
+        write_geojson({}, out)
+        assert json.loads(out.read_text()) == {"type": "FeatureCollection", "features": []}
+
+    def test_serialises_shapely_and_mapping_geometries(self, tmp_path):
+        from src.build import write_geojson
+        from src.utils import to_feature
+
+        features = {
+            1: to_feature(box(0, 0, 2, 1), {"tcc_index": 1, "name": "Dest 1"}),
+            2: _make_feature(2),
+        }
+        out = tmp_path / "mixed.geojson"
+        write_geojson(features, out)
+
+        data = json.loads(out.read_text())
+        assert data["features"][0]["geometry"] == json.loads(json.dumps(mapping(box(0, 0, 2, 1))))
+        assert data["features"][1]["geometry"]["type"] == "Polygon"
+        assert data["features"][0]["properties"]["name"] == "Dest 1"
+
     def test_creates_parent_dirs(self, tmp_path):
         from src.build import write_geojson
 
@@ -64,6 +87,13 @@ class TestExtractFeature:
         )
         assert feat is None
 
+    def test_table_covers_all_strategies(self):
+        from src.build import STRATEGY_TABLE
+        from src.destinations import EXTRACTIONS
+
+        strategies = {cfg["strategy"] for cfg in EXTRACTIONS.values()} | {"direct"}
+        assert strategies <= STRATEGY_TABLE.keys()
+
     def test_dispatch_subunit(self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf):
         from src.build import _extract_feature
 
@@ -206,16 +236,24 @@ class TestLoadData:
     def test_returns_four_gdfs(self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, mocker):
         from src import build as bld
 
-        mocker.patch(
-            "geopandas.read_file", side_effect=[subunits_gdf, units_gdf, admin1_gdf, disputed_gdf]
+        # Layers are read concurrently, so answer by file name rather than call order
+        layers = {
+            "ne_10m_admin_0_map_subunits.shp": subunits_gdf,
+            "ne_10m_admin_0_map_units.shp": units_gdf,
+            "ne_10m_admin_1_states_provinces.shp": admin1_gdf,
+            "ne_10m_admin_0_disputed_areas.shp": disputed_gdf,
+        }
+        load = mocker.patch.object(
+            bld, "load_shapefile", side_effect=lambda path, columns: layers[path.name]
         )
-        mocker.patch.object(bld, "DATA_DIR", MagicMock())
+        mocker.patch.object(bld, "DATA_DIR", Path("/nonexistent"))
 
         sub, uni, adm, dis = bld.load_data()
-        assert len(sub) == len(subunits_gdf)
-        assert len(uni) == len(units_gdf)
-        assert len(adm) == len(admin1_gdf)
-        assert len(dis) == len(disputed_gdf)
+        assert sub is subunits_gdf
+        assert uni is units_gdf
+        assert adm is admin1_gdf
+        assert dis is disputed_gdf
+        assert load.call_count == 4
 
 
 class TestBuildFeatures:
@@ -284,6 +322,197 @@ class TestBuildFeatures:
         # Second pass: remainder after subtracting feature 1 should be non-empty
         assert 2 in built
 
+    def test_serial_build_matches_pool(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        mocker.patch.object(bld, "get_destinations", return_value=[base_dest])
+        serial = bld.build_features(subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1)
+        pooled = bld.build_features(subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=2)
+        assert serial == pooled
+        assert list(serial) == [1]
+
+    def test_defers_clip_with_subtract_indices(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        clip_dest = {**base_dest, "tcc_index": 2, "strategy": "clip", "subtract_indices": [1]}
+        mocker.patch.object(bld, "get_destinations", return_value=[clip_dest, base_dest])
+        extract = mocker.patch.object(bld, "_extract_feature", return_value=None)
+
+        bld.build_features(subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1)
+        # The dependent clip runs last, after the direct feature it subtracts
+        assert [c.args[0]["tcc_index"] for c in extract.call_args_list] == [1, 2]
+
+    def test_loads_boundary_once_for_clips(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        clip_dest = {**base_dest, "tcc_index": 2, "strategy": "clip", "side": "europe"}
+        state = mocker.patch.object(bld, "boundary_state", return_value=("state",))
+        restore = mocker.patch.object(bld, "restore_boundary_state")
+        mocker.patch.object(bld, "_extract_feature", return_value=None)
+
+        frames = (subunits_gdf, units_gdf, admin1_gdf, disputed_gdf)
+        bld.build_features(*frames, workers=1, destinations=[base_dest])
+        state.assert_not_called()
+
+        bld.build_features(*frames, workers=1, destinations=[base_dest, clip_dest])
+        state.assert_called_once()
+        restore.assert_called_once_with(("state",))
+
+    def test_pool_does_not_fork(self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, mocker):
+        from src import build as bld
+
+        pool = mocker.patch.object(bld, "ProcessPoolExecutor")
+        bld.build_features(
+            subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=2, destinations=[]
+        )
+        assert pool.call_args.kwargs["mp_context"].get_start_method() != "fork"
+
+    def test_second_pass_gets_only_subtracted_features(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        dests = [
+            base_dest,
+            {**base_dest, "tcc_index": 2, "strategy": "point", "lat": 0.0, "lon": 0.0},
+            {**base_dest, "tcc_index": 3, "strategy": "group_remainder", "subtract_indices": [1]},
+        ]
+        extract = mocker.spy(bld, "_extract_in_worker")
+        bld.build_features(
+            subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1, destinations=dests
+        )
+        deferred = extract.call_args_list[-1]
+        assert deferred.args[0]["tcc_index"] == 3
+        assert list(deferred.args[1]) == [1]
+
+    def test_deferred_chain_runs_in_dependency_order(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        dests = [
+            base_dest,
+            {**base_dest, "tcc_index": 2, "strategy": "group_remainder", "subtract_indices": [3]},
+            {**base_dest, "tcc_index": 3, "strategy": "group_remainder", "subtract_indices": [1]},
+        ]
+        extract = mocker.patch.object(
+            bld, "_extract_feature", side_effect=lambda d, *a: {"id": d["tcc_index"]}
+        )
+        bld.build_features(
+            subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1, destinations=dests
+        )
+        assert [c.args[0]["tcc_index"] for c in extract.call_args_list] == [1, 3, 2]
+        assert list(extract.call_args_list[-1].args[6]) == [3]
+
+    def test_circular_deferred_raises(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest
+    ):
+        from src import build as bld
+
+        dests = [
+            {**base_dest, "strategy": "group_remainder", "subtract_indices": [2]},
+            {**base_dest, "tcc_index": 2, "strategy": "group_remainder", "subtract_indices": [1]},
+        ]
+        with pytest.raises(ValueError, match="Circular"):
+            bld.build_features(
+                subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1, destinations=dests
+            )
+
+    def test_schedules_expensive_strategies_first(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        dests = [
+            base_dest,
+            {**base_dest, "tcc_index": 2, "strategy": "admin1"},
+            {**base_dest, "tcc_index": 3, "strategy": "clip", "side": "europe"},
+        ]
+        mocker.patch.object(bld, "get_destinations", return_value=dests)
+        extract = mocker.patch.object(bld, "_extract_feature", return_value=None)
+
+        bld.build_features(subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1)
+        assert [c.args[0]["tcc_index"] for c in extract.call_args_list] == [3, 2, 1]
+
+    def test_uses_given_destinations(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, mocker
+    ):
+        from src import build as bld
+
+        get_destinations = mocker.patch.object(bld, "get_destinations")
+        built = bld.build_features(
+            subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, workers=1, destinations=[base_dest]
+        )
+        get_destinations.assert_not_called()
+        assert list(built) == [1]
+
+    def test_reuses_cached_features(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, tmp_path, mocker
+    ):
+        from src import build as bld
+
+        frames = (subunits_gdf, units_gdf, admin1_gdf, disputed_gdf)
+        first = bld.build_features(*frames, workers=1, destinations=[base_dest], cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.wkb"))) == 1
+
+        extract = mocker.patch.object(bld, "_extract_in_worker")
+        renamed = {**base_dest, "name": "Renamed"}
+        mocker.patch.object(bld, "make_properties", return_value={"name": "Renamed"})
+        second = bld.build_features(
+            *frames, workers=1, destinations=[base_dest], cache_dir=tmp_path
+        )
+        extract.assert_not_called()
+        assert second[1]["geometry"].equals(first[1]["geometry"])
+        assert second[1]["properties"] == {"name": "Renamed"}
+
+        # A different config misses the cache
+        extract.return_value = None
+        bld.build_features(*frames, workers=1, destinations=[renamed], cache_dir=tmp_path)
+        extract.assert_called_once()
+
+    def test_corrupt_cache_file_is_rebuilt(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, tmp_path, mocker
+    ):
+        from src import build as bld
+
+        frames = (subunits_gdf, units_gdf, admin1_gdf, disputed_gdf)
+        bld.build_features(*frames, workers=1, destinations=[base_dest], cache_dir=tmp_path)
+        (path,) = tmp_path.glob("*.wkb")
+        path.write_bytes(b"garbage")
+
+        extract = mocker.spy(bld, "_extract_in_worker")
+        built = bld.build_features(*frames, workers=1, destinations=[base_dest], cache_dir=tmp_path)
+        extract.assert_called_once()
+        assert 1 in built
+        assert bld.shapely.from_wkb(path.read_bytes()).equals(built[1]["geometry"])
+
+    def test_cache_invalidated_by_fingerprint(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, base_dest, tmp_path, mocker
+    ):
+        from src import build as bld
+
+        frames = (subunits_gdf, units_gdf, admin1_gdf, disputed_gdf)
+        mocker.patch.object(bld, "_cache_fingerprint", return_value=b"old")
+        bld.build_features(*frames, workers=1, destinations=[base_dest], cache_dir=tmp_path)
+
+        mocker.patch.object(bld, "_cache_fingerprint", return_value=b"new")
+        extract = mocker.spy(bld, "_extract_in_worker")
+        bld.build_features(*frames, workers=1, destinations=[base_dest], cache_dir=tmp_path)
+        extract.assert_called_once()
+
+    def test_worker_requires_init(self, base_dest, mocker):
+        from src import build as bld
+
+        mocker.patch.object(bld, "_worker_frames", None)
+        with pytest.raises(RuntimeError):
+            bld._extract_in_worker(base_dest)
+
     def test_reports_failures(
         self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, mocker, capsys
     ):
@@ -321,7 +550,7 @@ class TestMain:
         mocker.patch.object(bld, "OUTPUT_DIR", tmp_path)
 
         # Patch get_destinations to return minimal set to avoid 330-feature build
-        mocker.patch.object(
+        get_destinations = mocker.patch.object(
             bld,
             "get_destinations",
             return_value=[
@@ -340,6 +569,7 @@ class TestMain:
         )
 
         bld.main()
+        get_destinations.assert_called_once()
 
         out = tmp_path / "merged.geojson"
         assert out.exists()
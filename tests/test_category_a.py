@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import pytest
 import geopandas as gpd
+import pytest
 from shapely.geometry import box
 
 from src.category_a import _find_geom, extract_direct, extract_subunit
@@ -96,6 +96,17 @@ class TestExtractDirect:
         geom = shape(feat["geometry"])
         assert geom.area > box(10, 10, 20, 20).area
 
+    def test_merges_in_single_union(self, base_dest, subunits_gdf, units_gdf, mocker):
+        """All merge_a3 rows are unioned in one pass; unknown codes are skipped."""
+        from src import category_a
+
+        spy = mocker.spy(category_a.shapely, "union_all")
+        dest = {**base_dest, "merge_a3": ["ZZZ", "TST"]}
+        feat = extract_direct(dest, subunits_gdf, units_gdf)
+        assert feat is not None
+        assert spy.call_count == 1
+        assert feat["geometry"].area == pytest.approx(box(10, 10, 20, 20).area)
+
     def test_uses_ne_a3_override(self, subunits_gdf, units_gdf):
         """ne_a3 should override iso_a3 for lookup."""
         dest = {
@@ -144,6 +155,27 @@ class TestExtractSubunit:
         feat = extract_subunit(dest, subunits_gdf)
         assert feat is None
 
+    def test_ne_name_narrows_shared_su_a3(self):
+        subunits = gpd.GeoDataFrame(
+            {"SU_A3": ["SPL", "SPL"], "NAME": ["Main", "Isle"]},
+            geometry=[box(0, 0, 4, 4), box(10, 10, 11, 11)],
+            crs="EPSG:4326",
+        )
+        dest = {
+            "tcc_index": 12,
+            "name": "Isle",
+            "region": "Test",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Testland",
+            "type": "subnational",
+            "su_a3": "SPL",
+            "ne_name": "Isle",
+        }
+        feat = extract_subunit(dest, subunits)
+        assert feat["geometry"].equals(box(10, 10, 11, 11))
+
     def test_falls_back_to_name_match(self, subunits_gdf):
         dest = {
             "tcc_index": 12,
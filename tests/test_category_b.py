@@ -7,6 +7,7 @@ import geopandas as gpd
 from shapely.geometry import box, shape
 
 from src.category_b import (
+    _find_disputed,
     _match_provinces,
     extract_admin1,
     extract_disputed_remainder,
@@ -33,11 +34,50 @@ class TestMatchProvinces:
         # Should find "North Province" via contains fallback
         assert len(result) >= 1
 
+    def test_contains_treats_names_literally(self, admin1_gdf):
+        assert len(_match_provinces(admin1_gdf, ["north.*"])) == 0
+        assert len(_match_provinces(admin1_gdf, ["uth prov"])) == 1
+
+    def test_no_names_returns_empty(self, admin1_gdf):
+        assert len(_match_provinces(admin1_gdf, [])) == 0
+
     def test_no_match_returns_empty(self, admin1_gdf):
         result = _match_provinces(admin1_gdf, ["Nonexistent Province"])
         assert len(result) == 0
 
 
+class TestFindDisputed:
+    @pytest.fixture()
+    def kashmir_gdf(self):
+        return gpd.GeoDataFrame(
+            {
+                "NAME": ["Kashmir West", "Kashmir East", "N. Cyprus"],
+                "BRK_NAME": ["Kashmir West", "Kashmir East", "N. Cyprus"],
+                "NAME_LONG": ["Kashmir West", "Kashmir East", "Northern Cyprus"],
+            },
+            geometry=[box(12, 12, 14, 14), box(40, 40, 42, 42), box(0, 0, 1, 1)],
+            crs="EPSG:4326",
+        )
+
+    def test_dissolves_all_matches(self, kashmir_gdf):
+        geom = _find_disputed(kashmir_gdf, "KASHMIR")
+        assert geom.area == pytest.approx(8.0)
+
+    def test_within_drops_distant_matches(self, kashmir_gdf):
+        geom = _find_disputed(kashmir_gdf, "kashmir", box(10, 10, 20, 20))
+        assert geom.equals(box(12, 12, 14, 14))
+
+    def test_within_without_nearby_match(self, kashmir_gdf):
+        assert _find_disputed(kashmir_gdf, "kashmir", box(100, 0, 101, 1)) is None
+
+    def test_matches_names_literally(self, kashmir_gdf):
+        assert _find_disputed(kashmir_gdf, "n. cyprus") is not None
+        assert _find_disputed(kashmir_gdf, "n.cyprus") is None
+
+    def test_falls_back_to_later_fields(self, kashmir_gdf):
+        assert _find_disputed(kashmir_gdf, "Northern Cyprus").equals(box(0, 0, 1, 1))
+
+
 class TestExtractAdmin1:
     def test_extracts_province(self, admin1_dest, admin1_gdf, subunits_gdf, units_gdf):
         feat = extract_admin1(admin1_dest, admin1_gdf, subunits_gdf, units_gdf)
@@ -182,6 +222,31 @@ class TestExtractRemainder:
         # Disputed zone (12-14, 12-14) was subtracted — area should be less
         assert result_geom.area < box(10, 10, 20, 20).area
 
+    def test_subtracts_admin1_and_disputed_together(
+        self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf, mocker
+    ):
+        from shapely.geometry.base import BaseGeometry
+
+        dest = {
+            "tcc_index": 10,
+            "name": "Testland",
+            "region": "Test",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Testland",
+            "type": "country",
+            "adm0_a3": "TST",
+            "subtract_admin1": ["North Province"],
+            "subtract_disputed": ["Disputed Zone"],
+        }
+        difference = mocker.spy(BaseGeometry, "difference")
+        feat = extract_remainder(dest, admin1_gdf, subunits_gdf, units_gdf, disputed_gdf)
+        assert feat is not None
+        assert difference.call_count == 1
+        # 100 - North Province (50) - disputed zone (4)
+        assert shape(feat["geometry"]).area == pytest.approx(46.0)
+
     def test_merges_disputed_areas(self, subunits_gdf, units_gdf, admin1_gdf, disputed_gdf):
         dest = {
             "tcc_index": 10,
@@ -9,8 +9,12 @@ from shapely.geometry import MultiPolygon, Point, Polygon, box, shape
 
 from src.category_c import (
     _collect_parts_in_lon,
+    _find_disputed_geoms,
+    _get_admin1_geom,
     _make_wedge,
+    _sector_wedge,
     _split_parts_by_lon,
+    _valid_union,
     extract_disputed,
     extract_group_remainder,
     extract_island_bbox,
@@ -38,6 +42,34 @@ class TestMakeWedge:
         w = _make_wedge(-10, 10, -60, -90)
         assert w.bounds[1] == pytest.approx(-90)
 
+    def test_arc_vertices(self):
+        w = _make_wedge(0, 60, -60, -90, n_points=6)
+        coords = list(w.exterior.coords)
+        assert coords[:7] == [(float(lon), -60.0) for lon in range(0, 61, 10)]
+        assert coords[7:] == [(60.0, -90.0), (0.0, -90.0), (0.0, -60.0)]
+
+
+class TestSectorWedge:
+    def test_disjoint_spans_build_multipolygon(self):
+        from shapely.ops import unary_union
+
+        spans = [(160, 180), (-180, -150)]
+        with patch("src.category_c.unary_union") as union:
+            w = _sector_wedge(spans, -60, -90)
+        union.assert_not_called()
+        assert isinstance(w, MultiPolygon)
+        assert w.is_valid
+        assert w.equals(unary_union([_make_wedge(a, b, -60, -90) for a, b in spans]))
+
+    def test_touching_spans_are_unioned(self):
+        w = _sector_wedge([(10, 20), (0, 10)], -60, -90)
+        assert isinstance(w, Polygon)
+        assert w.bounds == pytest.approx((0, -90, 20, -60))
+
+    def test_single_span_is_plain_wedge(self):
+        w = _sector_wedge([(0, 45)], -60, -90)
+        assert w.equals(_make_wedge(0, 45, -60, -90))
+
 
 class TestCollectPartsInLon:
     def test_polygon_inside(self):
@@ -73,6 +105,36 @@ class TestSplitPartsByLon:
         assert len(keep) == 1
         assert len(shed) == 1
 
+    def test_overlapping_envelope_with_centroid_outside(self):
+        straddling = box(10, 0, 30, 5)  # bounds reach into [0, 15], centroid at 20
+        keep, shed = _split_parts_by_lon(MultiPolygon([straddling, box(5, 0, 6, 1)]), 0, 15)
+        assert [p.equals(straddling) for p in keep] == [True]
+        assert len(shed) == 1
+
+    def test_centroids_only_for_straddling_parts(self, mocker):
+        from src import category_c
+
+        spy = mocker.spy(category_c.shapely, "centroid")
+        parts = [box(5, 0, 6, 1), box(20, 0, 21, 1), box(10, 0, 30, 5)]
+        keep, shed = _split_parts_by_lon(MultiPolygon(parts), 0, 15)
+        assert len(spy.call_args.args[0]) == 1
+        assert [p.bounds for p in shed] == [(5.0, 0.0, 6.0, 1.0)]
+        assert len(keep) == 2
+
+    def test_non_polygon_yields_nothing(self):
+        assert _split_parts_by_lon(Point(5, 5), 0, 15) == ([], [])
+
+
+class TestValidUnion:
+    def test_single_geometry_used_directly(self):
+        geom = box(0, 0, 1, 1)
+        assert _valid_union([geom]) is geom
+
+    def test_unions_and_repairs(self):
+        bowtie = Polygon([(0, 0), (2, 2), (2, 0), (0, 2), (0, 0)])
+        assert _valid_union([bowtie]).is_valid
+        assert _valid_union([box(0, 0, 1, 1), box(1, 0, 2, 1)]).area == pytest.approx(2.0)
+
 
 class TestExtractClip:
     """Tests for extract_clip with mocked boundary functions."""
@@ -195,6 +257,20 @@ class TestExtractClip:
 
         assert feat is not None
 
+    def test_subtract_repairs_invalid_geometry(self, subunits_gdf, units_gdf):
+        from src.category_c import extract_clip
+
+        dest = {**self._clip_dest("europe"), "subtract_indices": [99]}
+        # Self-intersecting bowtie: a raw difference raises a TopologyException
+        bowtie = Polygon([(11, 12), (14, 18), (14, 12), (11, 18), (11, 12)])
+        built = {99: {"type": "Feature", "geometry": bowtie, "properties": {}}}
+
+        with patch("src.category_c.clip_to_europe", return_value=box(10, 10, 15, 20)):
+            feat = extract_clip(dest, subunits_gdf, units_gdf, built=built)
+
+        assert feat["geometry"].is_valid
+        assert feat["geometry"].area == pytest.approx(50 - 9)
+
     def test_absorb_lon_range_europe(self, subunits_gdf, units_gdf):
         from src.category_c import extract_clip
 
@@ -276,6 +352,74 @@ class TestExtractDisputed:
         feat = extract_disputed(dest, disputed_gdf)
         assert feat is not None
 
+    def test_matches_name_literally(self, disputed_gdf):
+        dest = {
+            "tcc_index": 50,
+            "name": "Disputed.Zone",
+            "region": "Test",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Test",
+            "type": "disputed",
+        }
+        # "." would match the space as a regex wildcard
+        assert extract_disputed(dest, disputed_gdf) is None
+
+
+class TestFindDisputedGeoms:
+    @pytest.fixture()
+    def layer(self):
+        import geopandas as gpd
+
+        return gpd.GeoDataFrame(
+            {
+                "NAME": ["Kashmir", "Glacier", "Kashmir North"],
+                "BRK_NAME": ["Kashmir", "Siachen Glacier", "Kashmir North"],
+            },
+            geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1), box(0, 1, 1, 2)],
+            crs="EPSG:4326",
+        )
+
+    def test_finds_each_name_in_its_first_matching_field(self, layer):
+        found = _find_disputed_geoms(["KASHMIR", "Siachen Glacier", "Nowhere"], layer)
+        assert set(found) == {"KASHMIR", "Siachen Glacier"}
+        assert found["KASHMIR"].area == pytest.approx(2.0)
+        assert found["Siachen Glacier"].equals(box(1, 0, 2, 1))
+
+    def test_extract_merges_also_merge(self, layer):
+        dest = {
+            "tcc_index": 50,
+            "name": "Kashmir",
+            "region": "Test",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Test",
+            "type": "disputed",
+            "also_merge": ["Siachen Glacier"],
+        }
+        assert extract_disputed(dest, layer)["geometry"].area == pytest.approx(3.0)
+
+    def test_extract_merges_all_extras_in_one_union(self, layer):
+        from shapely.ops import unary_union
+
+        dest = {
+            "tcc_index": 50,
+            "name": "Kashmir",
+            "region": "Test",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Test",
+            "type": "disputed",
+            "also_merge": ["Siachen Glacier", "Kashmir North", "Nowhere"],
+        }
+        with patch("src.category_c.unary_union", wraps=unary_union) as union:
+            feat = extract_disputed(dest, layer)
+        union.assert_called_once()
+        assert feat["geometry"].area == pytest.approx(3.0)
+
 
 class TestExtractIslandBbox:
     def test_extracts_island(self, island_dest, subunits_gdf, units_gdf):
@@ -374,6 +518,27 @@ class TestExtractGroupRemainder:
         result_geom = shape(feat["geometry"])
         assert result_geom.area < box(10, 10, 20, 20).area
 
+    def test_repairs_invalid_subtract_geometry(self, subunits_gdf, units_gdf):
+        # Self-intersecting bowtie: a raw difference raises a TopologyException
+        bowtie = Polygon([(12, 12), (18, 18), (18, 12), (12, 18), (12, 12)])
+        dest = {
+            "tcc_index": 10,
+            "name": "Testland Remainder",
+            "region": "Test",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Testland",
+            "type": "country",
+            "adm0_a3": "TST",
+            "subtract_indices": [99],
+        }
+        built = {99: {"type": "Feature", "geometry": bowtie, "properties": {"tcc_index": 99}}}
+        feat = extract_group_remainder(dest, subunits_gdf, units_gdf, built)
+        assert feat is not None
+        assert feat["geometry"].is_valid
+        assert feat["geometry"].area == pytest.approx(100 - 18)
+
     def test_returns_none_without_adm0(self, subunits_gdf, units_gdf):
         dest = {
             "tcc_index": 10,
@@ -404,6 +569,23 @@ class TestExtractGroupRemainder:
         assert feat is None
 
 
+class TestGetAdmin1Geom:
+    def test_dissolves_split_province_once(self):
+        import geopandas as gpd
+
+        admin1 = gpd.GeoDataFrame(
+            {"adm0_a3": ["TST", "TST"], "name": ["Isles", "Isles"]},
+            geometry=[box(0, 0, 1, 1), box(5, 5, 6, 6)],
+            crs="EPSG:4326",
+        )
+        geom = _get_admin1_geom("TST", "isles", admin1)
+        assert geom.area == pytest.approx(2.0)
+        assert _get_admin1_geom("TST", "Isles", admin1) is geom
+
+    def test_returns_none_when_missing(self, admin1_gdf):
+        assert _get_admin1_geom("TST", "Nowhere", admin1_gdf) is None
+
+
 class TestGenerateAntarcticWedge:
     def test_generates_wedge(self):
         dest = {
@@ -489,6 +671,52 @@ class TestGenerateAntarcticWedge:
         feat = generate_antarctic_wedge(dest, antarctica_geom=antarctica)
         assert feat is not None
 
+    def test_ocean_sector_skips_clip(self, mocker):
+        from src import category_c
+
+        clip = mocker.spy(category_c.shapely, "clip_by_rect")
+        dest = {
+            "tcc_index": 181,
+            "name": "Test Antarctic",
+            "region": "Antarctica",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Test",
+            "type": "antarctic",
+            "lon_west": 100,
+            "lon_east": 120,
+        }
+        feat = generate_antarctic_wedge(dest, antarctica_geom=box(-60, -90, -30, -65))
+        clip.assert_not_called()
+        assert feat["geometry"].bounds == pytest.approx((100, -90, 120, -60))
+
+    @pytest.mark.parametrize(
+        "sector",
+        [
+            {"lon_west": -74, "lon_east": -25},
+            {"lon_west": 160, "lon_east": -150},
+            {"sectors": [{"lon_west": 45, "lon_east": 136}, {"lon_west": 142, "lon_east": 160}]},
+        ],
+    )
+    def test_clip_matches_wedge_intersection(self, sector):
+        coast = [(lon, -70 + 3 * ((lon // 7) % 2)) for lon in range(-180, 181)]
+        antarctica = Polygon([*coast, (180, -90), (-180, -90)])
+        dest = {
+            "tcc_index": 181,
+            "name": "Test Antarctic",
+            "region": "Antarctica",
+            "iso_a2": None,
+            "iso_a3": None,
+            "iso_n3": None,
+            "sovereign": "Test",
+            "type": "antarctic",
+            **sector,
+        }
+        wedge = generate_antarctic_wedge(dest)["geometry"]
+        feat = generate_antarctic_wedge(dest, antarctica_geom=antarctica)
+        assert feat["geometry"].equals(antarctica.intersection(wedge))
+
 
 class TestGeneratePoint:
     def test_generates_point_feature(self):
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.destinations import DESTINATIONS, EXTRACTIONS, get_destinations
+from src.destinations import DESTINATIONS, EXTRACTIONS, get_destination, get_destinations
 
 EXPECTED_COUNT = 330
 VALID_TYPES = {"country", "territory", "disputed", "subnational", "antarctic"}
@@ -105,13 +105,26 @@ class TestExtractionsData:
             strat = cfg.get("strategy")
             assert strat in self.VALID_STRATEGIES, f"Unknown strategy '{strat}' at tcc_index={idx}"
 
-    def test_admin1_entries_have_admin1_list(self):
+    def test_entries_do_not_override_base_fields(self):
+        # get_destinations() merges each entry over its row, so a base key such
+        # as "name" would replace the TCC name in the output properties
+        base = set(DESTINATIONS[0]._fields)
+        for idx, cfg in EXTRACTIONS.items():
+            assert not base & cfg.keys(), f"tcc_index={idx} overrides {base & cfg.keys()}"
+
+    def test_admin1_entries_have_admin1_tuple(self):
         for idx, cfg in EXTRACTIONS.items():
             if cfg.get("strategy") == "admin1":
                 assert "admin1" in cfg, f"admin1 strategy missing 'admin1' key at tcc_index={idx}"
-                assert isinstance(cfg["admin1"], list)
+                assert isinstance(cfg["admin1"], tuple)
                 assert len(cfg["admin1"]) > 0
 
+    def test_name_lists_and_bboxes_are_tuples(self):
+        for idx, cfg in EXTRACTIONS.items():
+            for key in ("admin1", "subtract_admin1", "bbox"):
+                if key in cfg:
+                    assert isinstance(cfg[key], tuple), f"{key} is not a tuple at tcc_index={idx}"
+
     def test_island_bbox_have_bbox(self):
         for idx, cfg in EXTRACTIONS.items():
             if cfg.get("strategy") == "island_bbox":
@@ -119,6 +132,13 @@ class TestExtractionsData:
                 bbox = cfg["bbox"]
                 assert len(bbox) == 4
 
+    def test_island_bbox_ordered_and_in_range(self):
+        for idx, cfg in EXTRACTIONS.items():
+            if cfg.get("strategy") == "island_bbox":
+                west, south, east, north = cfg["bbox"]
+                assert -180 <= west < east <= 180, f"bad bbox longitudes at tcc_index={idx}"
+                assert -90 <= south < north <= 90, f"bad bbox latitudes at tcc_index={idx}"
+
     def test_clip_have_side(self):
         for idx, cfg in EXTRACTIONS.items():
             if cfg.get("strategy") == "clip":
@@ -164,6 +184,11 @@ class TestGetDestinations:
         assert dests[1]["strategy"] == "island_bbox"
         assert "bbox" in dests[1]
 
+    def test_base_fields_follow_row_fields(self):
+        first = get_destinations()[0]
+        assert list(first)[:8] == list(DESTINATIONS[0]._fields)
+        assert first["name"] == DESTINATIONS[0].name
+
     def test_base_fields_present(self):
         required = {"tcc_index", "name", "region", "sovereign", "type"}
         for d in get_destinations():
@@ -172,3 +197,15 @@ class TestGetDestinations:
     def test_indices_1_to_330(self):
         indices = {d["tcc_index"] for d in get_destinations()}
         assert indices == set(range(1, 331))
+
+
+class TestGetDestination:
+    """Tests for the get_destination() lookup."""
+
+    def test_matches_get_destinations(self):
+        for d in get_destinations():
+            assert get_destination(d["tcc_index"]) == d
+
+    def test_unknown_index_returns_none(self):
+        assert get_destination(0) is None
+        assert get_destination(331) is None
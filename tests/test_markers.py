@@ -282,6 +282,21 @@ class TestNanPropertiesSanitized:
         data = json.loads(text)
         assert data[0]["properties"]["iso_a2"] is None
 
+    def test_numpy_props_serialise_as_plain_json(self):
+        import numpy as np
+        import orjson
+        from src.markers import build_markers_collection
+
+        # Both writers call orjson.dumps() without OPT_SERIALIZE_NUMPY
+        gdf = gpd.GeoDataFrame(
+            {"name": ["BigLand", "TinyIsland"], "tcc_index": np.array([1, 2], dtype=np.int32)},
+            geometry=[LARGE_BOX, SMALL_BOX],
+            crs="EPSG:4326",
+        )
+        poly_coll, point_features = build_markers_collection(gdf)
+        assert orjson.loads(orjson.dumps(poly_coll))["features"][0]["properties"]["tcc_index"] == 1
+        assert orjson.loads(orjson.dumps(point_features))[0]["properties"]["tcc_index"] == 2
+
 
 # ---------------------------------------------------------------------------
 # inject_points
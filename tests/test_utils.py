@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import pytest
-from shapely.geometry import MultiPolygon, Point, Polygon, box
+import shapely
+from shapely.geometry import MultiPolygon, Point, Polygon, box, mapping
 
 from src.utils import (
+    column_index,
+    contains_rows,
+    difference_by_parts,
     dissolve_geometries,
+    dissolve_rows,
     extract_polygons_by_bbox,
+    find_rows,
+    geometries_from_features,
     get_country_geom,
+    load_shapefile,
     make_properties,
+    make_valid_polygons,
+    select_rows,
     subtract_polygons_by_bbox,
     to_feature,
+    union_rows,
 )
 
 
@@ -29,6 +40,104 @@ class TestDissolveGeometries:
         assert result.equals(p)
 
 
+class TestMakeValidPolygons:
+    def test_valid_geometry_untouched(self):
+        geom = box(0, 0, 1, 1)
+        assert make_valid_polygons(geom) is geom
+
+    def test_bowtie_keeps_both_lobes_as_polygons(self):
+        bowtie = Polygon([(0, 0), (2, 2), (2, 0), (0, 2)])
+        result = make_valid_polygons(bowtie)
+        assert result.is_valid
+        assert isinstance(result, MultiPolygon)
+        assert result.area == pytest.approx(2.0)
+
+    def test_collapsed_ring_becomes_empty(self):
+        assert make_valid_polygons(Polygon([(0, 0), (1, 1), (2, 2)])).is_empty
+
+
+class TestDifferenceByParts:
+    def test_matches_plain_difference(self):
+        geom = MultiPolygon([box(0, 0, 4, 4), box(10, 0, 11, 1), box(20, 0, 21, 1)])
+        other = box(2, 2, 6, 6)
+        result = difference_by_parts(geom, other)
+        assert result.equals(geom.difference(other))
+        assert result.is_valid
+
+    def test_distant_parts_are_not_overlaid(self):
+        far = box(10, 0, 11, 1)
+        result = difference_by_parts(MultiPolygon([box(0, 0, 4, 4), far]), box(2, 2, 6, 6))
+        assert far in list(result.geoms)
+
+    def test_returns_geom_when_nothing_near(self):
+        geom = MultiPolygon([box(0, 0, 1, 1), box(2, 0, 3, 1)])
+        assert difference_by_parts(geom, box(50, 50, 51, 51)) is geom
+
+    def test_fully_removed_part_leaves_polygon(self):
+        result = difference_by_parts(
+            MultiPolygon([box(0, 0, 1, 1), box(5, 5, 6, 6)]), box(-1, -1, 2, 2)
+        )
+        assert isinstance(result, Polygon)
+        assert result.equals(box(5, 5, 6, 6))
+
+    def test_polygon_input(self):
+        result = difference_by_parts(box(0, 0, 2, 2), box(1, 0, 2, 2))
+        assert result.area == pytest.approx(2.0)
+
+    def test_disjoint_envelopes_skip_overlay(self, mocker):
+        from shapely.geometry.base import BaseGeometry
+
+        spy = mocker.spy(BaseGeometry, "difference")
+        geom = box(0, 0, 1, 1)
+        assert difference_by_parts(geom, box(5, 5, 6, 6)) is geom
+        spy.assert_not_called()
+
+
+class TestDissolveRows:
+    def test_single_row_returned_as_is(self):
+        import geopandas as gpd
+
+        geom = box(0, 0, 1, 1)
+        gdf = gpd.GeoDataFrame(geometry=[geom], crs="EPSG:4326")
+        assert dissolve_rows(gdf) is gdf.geometry.values[0]
+        assert dissolve_rows(gdf).equals(geom)
+
+    def test_unions_multiple_rows(self):
+        import geopandas as gpd
+
+        gdf = gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1)], crs="EPSG:4326")
+        result = dissolve_rows(gdf)
+        assert isinstance(result, Polygon)
+        assert result.area == pytest.approx(2.0)
+
+    def test_union_cached_per_frame(self):
+        import geopandas as gpd
+
+        geoms = [box(0, 0, 1, 1), box(1, 0, 2, 1)]
+        gdf = gpd.GeoDataFrame(geometry=geoms, crs="EPSG:4326")
+        assert dissolve_rows(gdf) is dissolve_rows(gdf)
+        other = gpd.GeoDataFrame(geometry=geoms, crs="EPSG:4326")
+        assert dissolve_rows(other) is not dissolve_rows(gdf)
+
+
+class TestUnionRows:
+    def test_single_position_returned_as_is(self):
+        import geopandas as gpd
+        import numpy as np
+
+        gdf = gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1), box(5, 5, 6, 6)], crs="EPSG:4326")
+        assert union_rows(gdf, np.array([1])) is gdf.geometry.values[1]
+
+    def test_unions_selected_positions(self):
+        import geopandas as gpd
+        import numpy as np
+
+        geoms = [box(0, 0, 1, 1), box(5, 5, 6, 6), box(1, 0, 2, 1)]
+        gdf = gpd.GeoDataFrame(geometry=geoms, crs="EPSG:4326")
+        result = union_rows(gdf, np.array([0, 2]))
+        assert result.equals(box(0, 0, 2, 1))
+
+
 class TestExtractPolygonsByBbox:
     def test_extracts_matching_polygon(self):
         # MultiPolygon: one poly inside bbox, one outside
@@ -65,6 +174,20 @@ class TestExtractPolygonsByBbox:
         # Falls back to intersection check → should still find it
         assert result is not None
 
+    def test_fallback_skips_distant_parts(self):
+        near = box(-5, -5, 2, 2)
+        result = extract_polygons_by_bbox(MultiPolygon([near, box(50, 50, 51, 51)]), (0, 0, 1, 1))
+        assert result.equals(near)
+
+    def test_part_tree_reused_for_same_geometry(self, mocker):
+        import shapely
+
+        mp = MultiPolygon([box(0, 0, 1, 1), box(10, 10, 11, 11)])
+        tree = mocker.spy(shapely, "STRtree")
+        assert extract_polygons_by_bbox(mp, (-1, -1, 2, 2)).equals(box(0, 0, 1, 1))
+        assert extract_polygons_by_bbox(mp, (9, 9, 12, 12)).equals(box(10, 10, 11, 11))
+        tree.assert_called_once()
+
     def test_non_polygon_returns_none(self):
         pt = Point(1, 1)
         result = extract_polygons_by_bbox(pt, (0, 0, 2, 2))
@@ -107,15 +230,34 @@ class TestToFeature:
         assert feat["type"] == "Feature"
         assert feat["properties"] == props
         assert "geometry" in feat
-        assert feat["geometry"]["type"] == "Polygon"
+        assert feat["geometry"].geom_type == "Polygon"
 
     def test_geometry_is_serializable(self):
         import json
 
+        import shapely
+
         geom = Point(5, 5)
         feat = to_feature(geom, {"x": 1})
         # Should not raise
-        json.dumps(feat)
+        json.loads(shapely.to_geojson(feat["geometry"]))
+        json.dumps(feat["properties"])
+
+
+class TestGeometriesFromFeatures:
+    def test_round_trips_geometries(self):
+        geoms = [box(0, 0, 1, 1), MultiPolygon([box(2, 2, 3, 3), box(4, 4, 5, 5)])]
+        feats = [{"type": "Feature", "geometry": mapping(g), "properties": {}} for g in geoms]
+        result = geometries_from_features(feats)
+        assert len(result) == 2
+        assert all(r.equals(g) for r, g in zip(result, geoms, strict=True))
+
+    def test_shapely_geometries_passed_through(self):
+        geom = box(0, 0, 1, 1)
+        assert geometries_from_features([to_feature(geom, {})])[0] is geom
+
+    def test_empty_list(self):
+        assert geometries_from_features([]) == []
 
 
 class TestMakeProperties:
@@ -150,6 +292,87 @@ class TestMakeProperties:
         assert props["iso_n3"] is None
 
 
+class TestSelectRows:
+    def _gdf(self):
+        import geopandas as gpd
+
+        return gpd.GeoDataFrame(
+            {"A3": ["AAA", "BBB", "AAA", None]},
+            geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1), box(2, 0, 3, 1), box(3, 0, 4, 1)],
+            crs="EPSG:4326",
+        )
+
+    def test_matches_boolean_mask(self):
+        gdf = self._gdf()
+        result = select_rows(gdf, "A3", "AAA")
+        assert result.equals(gdf[gdf["A3"] == "AAA"])
+
+    def test_missing_value_returns_empty(self):
+        result = select_rows(self._gdf(), "A3", "ZZZ")
+        assert len(result) == 0
+        assert "A3" in result.columns
+
+    def test_index_built_once_per_frame(self):
+        gdf = self._gdf()
+        index = column_index(gdf, "A3")
+        assert column_index(gdf, "A3") is index
+        assert column_index(self._gdf(), "A3") is not index
+        assert list(index["AAA"]) == [0, 2]
+
+    def test_selection_cached(self):
+        gdf = self._gdf()
+        assert select_rows(gdf, "A3", "AAA") is select_rows(gdf, "A3", "AAA")
+
+    def test_lower_matches_case_insensitively(self):
+        gdf = self._gdf()
+        assert len(select_rows(gdf, "A3", "bbb", lower=True)) == 1
+        assert len(select_rows(gdf, "A3", "bbb")) == 0
+
+
+class TestContainsRows:
+    def _gdf(self):
+        import geopandas as gpd
+
+        return gpd.GeoDataFrame(
+            {"NAME": ["Siachen Glacier", None, "Aksai Chin", "Glacier.Bay"]},
+            geometry=[box(i, 0, i + 1, 1) for i in range(4)],
+            crs="EPSG:4326",
+        )
+
+    def test_matches_lowered_substring(self):
+        assert list(contains_rows(self._gdf(), "NAME", "glacier")) == [0, 3]
+
+    def test_literal_match_skips_missing(self):
+        gdf = self._gdf()
+        assert list(contains_rows(gdf, "NAME", "r.b")) == [3]
+        assert list(contains_rows(gdf, "NAME", ".")) == [3]
+        assert len(contains_rows(gdf, "NAME", "nowhere")) == 0
+
+
+class TestFindRows:
+    def _gdfs(self):
+        import geopandas as gpd
+
+        first = gpd.GeoDataFrame(
+            {"SU": ["AAA"], "ADM": ["XXX"]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:4326"
+        )
+        second = gpd.GeoDataFrame({"ADM": ["BBB"]}, geometry=[box(1, 0, 2, 1)], crs="EPSG:4326")
+        return first, second
+
+    def test_first_frame_and_field_win(self):
+        first, second = self._gdfs()
+        assert find_rows([first, second], ["ADM", "SU"], "AAA") is select_rows(first, "SU", "AAA")
+        assert find_rows([first, second], ["SU", "ADM"], "BBB") is select_rows(second, "ADM", "BBB")
+
+    def test_missing_value_returns_none(self, mocker):
+        from src import utils
+
+        first, second = self._gdfs()
+        spy = mocker.spy(utils, "select_rows")
+        assert find_rows([first, second], ["SU", "ADM"], "ZZZ") is None
+        spy.assert_not_called()
+
+
 class TestGetCountryGeom:
     def test_finds_by_adm0_a3(self, subunits_gdf, units_gdf):
         result = get_country_geom("TST", subunits_gdf, units_gdf)
@@ -178,3 +401,74 @@ class TestGetCountryGeom:
         result = get_country_geom("TST", double_gdf, empty)
         assert result is not None
         assert result.area == pytest.approx(2.0)
+
+    def test_repeated_lookup_unions_once(self, units_gdf, mocker):
+        import geopandas as gpd
+
+        double_gdf = gpd.GeoDataFrame(
+            {"ADM0_A3": ["TST", "TST"]},
+            geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1)],
+            crs="EPSG:4326",
+        )
+        union = mocker.spy(shapely, "union_all")
+        first = get_country_geom("TST", double_gdf, units_gdf)
+        assert get_country_geom("TST", double_gdf, units_gdf) is first
+        assert union.call_count == 1
+
+
+class TestLoadShapefile:
+    def _write_shp(self, tmp_path):
+        import geopandas as gpd
+
+        path = tmp_path / "test.shp"
+        gdf = gpd.GeoDataFrame(
+            {"NAME": ["A"], "OTHER": [1]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:4326"
+        )
+        gdf.to_file(path)
+        return path
+
+    def test_writes_parquet_cache(self, tmp_path):
+        path = self._write_shp(tmp_path)
+        gdf = load_shapefile(path)
+        assert list(gdf["NAME"]) == ["A"]
+        assert path.with_suffix(".parquet").exists()
+
+    def test_reuses_fresh_cache(self, tmp_path, mocker):
+        path = self._write_shp(tmp_path)
+        load_shapefile(path)
+        read_file = mocker.patch("geopandas.read_file")
+        gdf = load_shapefile(path)
+        read_file.assert_not_called()
+        assert gdf.geometry.iloc[0].area == pytest.approx(1.0)
+
+    def test_rereads_stale_cache(self, tmp_path):
+        import os
+
+        path = self._write_shp(tmp_path)
+        load_shapefile(path)
+        cache = path.with_suffix(".parquet")
+        os.utime(cache, (0, 0))
+        load_shapefile(path)
+        assert cache.stat().st_mtime >= path.stat().st_mtime
+
+    def test_reads_only_requested_columns(self, tmp_path):
+        path = self._write_shp(tmp_path)
+        gdf = load_shapefile(path, ["NAME"])
+        assert list(gdf.columns) == ["NAME", "geometry"]
+
+    def test_narrow_cache_is_rebuilt_for_wider_request(self, tmp_path):
+        path = self._write_shp(tmp_path)
+        load_shapefile(path, ["NAME"])
+        gdf = load_shapefile(path)
+        assert {"NAME", "OTHER"} <= set(gdf.columns)
+        assert load_shapefile(path, ["OTHER"])["OTHER"].iloc[0] == 1
+
+    def test_cache_decodes_only_requested_columns(self, tmp_path, mocker):
+        import geopandas as gpd
+
+        path = self._write_shp(tmp_path)
+        load_shapefile(path)
+        read_parquet = mocker.spy(gpd, "read_parquet")
+        gdf = load_shapefile(path, ["OTHER"])
+        assert read_parquet.call_args.kwargs["columns"] == ["OTHER", "geometry"]
+        assert list(gdf.columns) == ["OTHER", "geometry"]